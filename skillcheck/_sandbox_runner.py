@@ -7,16 +7,20 @@ import builtins
 import fnmatch
 import json
 import os
+import re
 import runpy
 import socket
 import sys
+from collections.abc import Callable, Iterable
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 from pathlib import Path
-from typing import Iterable, List, Any, cast
+from typing import Any, cast
 from urllib.parse import urlparse
 
-VIOLATIONS: List[dict] = []
+VIOLATIONS: list[dict] = []
+# Captured script output is reported as a short snippet; cap what is serialised back to the probe.
+CAPTURE_LIMIT = 4096
 
 
 class SandboxViolation(RuntimeError):
@@ -32,38 +36,44 @@ def _record(category: str, detail: str) -> None:
     VIOLATIONS.append({"category": category, "detail": detail})
 
 
-def _normalize_globs(globs: Iterable[str]) -> List[str]:
-    values: List[str] = []
+def _normalize_globs(globs: Iterable[str]) -> list[str]:
+    values: list[str] = []
     for item in globs:
         if item:
             values.append(item)
     return values
 
 
+def _compile_globs(globs: list[str]) -> re.Pattern[str] | None:
+    """One regex equivalent to ``any(fnmatch.fnmatch(name, glob) for glob in globs)``; ``None`` if empty."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(glob)) for glob in globs))
+
+
 def _relative_to_root(root: Path, candidate: Path) -> str:
+    """``candidate`` relative to ``root``, or ``".."`` outside it; both must already be resolved."""
     try:
-        relative = candidate.resolve().relative_to(root.resolve())
-    except Exception:
+        relative = candidate.relative_to(root)
+    except ValueError:
         return ".."
     return str(relative)
 
 
-def _apply_fs_guard(skill_root: Path, allow_globs: List[str]) -> None:
+def _apply_fs_guard(skill_root: Path, allow_globs: list[str]) -> None:
     original_open = builtins.open
+    resolved_root = skill_root.resolve()
+    allow_pattern = _compile_globs(allow_globs)
 
     def _validate_write_target(target) -> None:
         filepath = Path(target)
         absolute = filepath.resolve() if filepath.is_absolute() else (Path.cwd() / filepath).resolve()
-        rel = _relative_to_root(skill_root, absolute)
+        rel = _relative_to_root(resolved_root, absolute)
         if rel == "..":
             detail = f"write to {filepath} escapes skill root"
             _record("write", detail)
             raise SandboxViolation("write", detail)
-        if not allow_globs:
-            detail = f"write to {rel} not allowed by policy"
-            _record("write", detail)
-            raise SandboxViolation("write", detail)
-        if not any(fnmatch.fnmatch(rel, glob) for glob in allow_globs):
+        if allow_pattern is None or not allow_pattern.match(os.path.normcase(rel)):
             detail = f"write to {rel} not allowed by policy"
             _record("write", detail)
             raise SandboxViolation("write", detail)
@@ -90,24 +100,21 @@ def _apply_fs_guard(skill_root: Path, allow_globs: List[str]) -> None:
     Path.write_bytes = sandbox_write_bytes  # type: ignore[assignment]
 
 
-def _apply_network_guard(allow_hosts: List[str]) -> None:
+def _apply_network_guard(allow_hosts: list[str]) -> None:
     allowlist = [host for host in allow_hosts if host]
+    # Origin patterns ("https://api.example.com") match "scheme://host" and, through their netloc, the bare host.
+    origin_globs = [pattern for pattern in allowlist if "://" in pattern]
+    host_globs = [pattern for pattern in allowlist if "://" not in pattern]
+    host_globs += [urlparse(pattern).netloc for pattern in origin_globs if urlparse(pattern).netloc]
+    origin_pattern = _compile_globs(origin_globs)
+    host_pattern = _compile_globs(host_globs)
 
     def _host_allowed(host: str, scheme: str = "") -> bool:
-        if not allowlist:
-            return False
-        for pattern in allowlist:
-            if "://" in pattern:
-                candidate = f"{scheme}://{host}" if scheme else host
-                parsed = urlparse(pattern)
-                if fnmatch.fnmatch(candidate, pattern):
-                    return True
-                if parsed.netloc and fnmatch.fnmatch(host, parsed.netloc):
-                    return True
-            else:
-                if fnmatch.fnmatch(host, pattern):
-                    return True
-        return False
+        if origin_pattern is not None:
+            candidate = f"{scheme}://{host}" if scheme else host
+            if origin_pattern.match(os.path.normcase(candidate)):
+                return True
+        return host_pattern is not None and host_pattern.match(os.path.normcase(host)) is not None
 
     original_create_connection = socket.create_connection
 
@@ -135,10 +142,8 @@ def _apply_network_guard(allow_hosts: List[str]) -> None:
     socket_module.create_connection = sandbox_create_connection
     socket_module.socket = GuardedSocket
 
-    try:
-        import urllib.request  # type: ignore
-
-        original_urlopen = urllib.request.urlopen
+    def guard_urlopen(module: Any) -> None:
+        original_urlopen = module.urlopen
 
         def sandbox_urlopen(url, *args, **kwargs):
             parsed = urlparse(url)
@@ -149,14 +154,10 @@ def _apply_network_guard(allow_hosts: List[str]) -> None:
                 raise SandboxViolation("network", detail)
             return original_urlopen(url, *args, **kwargs)
 
-        urllib.request.urlopen = sandbox_urlopen  # type: ignore[assignment]
-    except Exception:  # pragma: no cover - optional dependency
-        pass
-
-    try:
-        import requests  # type: ignore
+        module.urlopen = sandbox_urlopen
 
-        original_request = requests.sessions.Session.request
+    def guard_requests(module: Any) -> None:
+        original_request = module.Session.request
 
         def sandbox_request(self, method, url, *args, **kwargs):
             parsed = urlparse(url)
@@ -167,9 +168,59 @@ def _apply_network_guard(allow_hosts: List[str]) -> None:
                 raise SandboxViolation("network", detail)
             return original_request(self, method, url, *args, **kwargs)
 
-        cast(Any, requests.sessions.Session).request = sandbox_request
-    except Exception:  # pragma: no cover - optional dependency
-        pass
+        module.Session.request = sandbox_request
+
+    # urllib.request and requests cost tens of milliseconds to import; most scripts never touch them.
+    _patch_on_import({"urllib.request": guard_urlopen, "requests.sessions": guard_requests})
+
+
+class _PatchingLoader:
+    """Loader wrapper that applies a guard once the wrapped loader has executed the module."""
+
+    def __init__(self, loader: Any, patch: Callable[[Any], None]):
+        self._loader = loader
+        self._patch = patch
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._loader.exec_module(module)
+        self._patch(module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _PatchingFinder:
+    """Meta path finder that hands guarded modules to ``_PatchingLoader``."""
+
+    def __init__(self, patches: dict[str, Callable[[Any], None]]):
+        self._patches = patches
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        patch = self._patches.get(fullname)
+        if patch is None:
+            return None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = _PatchingLoader(spec.loader, patch)
+                return spec
+        return None
+
+
+def _patch_on_import(patches: dict[str, Callable[[Any], None]]) -> None:
+    """Apply each guard now if its module is loaded, otherwise when the script first imports it."""
+    for name, patch in patches.items():
+        module = sys.modules.get(name)
+        if module is not None:
+            patch(module)
+    sys.meta_path.insert(0, _PatchingFinder(patches))
 
 
 def _apply_subprocess_guard() -> None:
@@ -226,8 +277,8 @@ def main() -> None:
     payload = {
         "violations": VIOLATIONS,
         "returncode": result_code,
-        "stdout": stdout_buffer.getvalue(),
-        "stderr": stderr_buffer.getvalue(),
+        "stdout": stdout_buffer.getvalue().strip()[:CAPTURE_LIMIT],
+        "stderr": stderr_buffer.getvalue().strip()[:CAPTURE_LIMIT],
     }
     print(json.dumps(payload))
 
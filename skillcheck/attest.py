@@ -2,25 +2,15 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 import importlib.util
+import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
 
 from .lint_rules import LintReport
 from .probe import ProbeResult
 from .schema import Policy, parse_skill_metadata, policy_summary
-from .utils import slugify
-
-
-def _hash_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+from .utils import dump_json, iter_relative_files, sha256_file, slugify
 
 
 class AttestationBuilder:
@@ -29,22 +19,23 @@ class AttestationBuilder:
     def __init__(self, policy: Policy):
         self.policy = policy
 
-    def _collect_file_hashes(self, skill_path: Path) -> Dict[str, str]:
-        hashes: Dict[str, str] = {}
-        for file_path in sorted(skill_path.rglob("*")):
-            if file_path.is_file():
-                hashes[str(file_path.relative_to(skill_path))] = _hash_file(file_path)
+    def _collect_file_hashes(self, skill_path: Path) -> dict[str, str]:
+        hashes: dict[str, str] = {}
+        for relative, entry in iter_relative_files(skill_path):
+            hashes[relative] = sha256_file(entry.path)
         return hashes
 
-    def _sign_payload(self, payload: bytes) -> Dict[str, str]:
+    def _sign_payload(self, payload: bytes) -> dict[str, str]:
         if importlib.util.find_spec("sigstore") is None:
             return {
                 "mode": "unsigned",
                 "reason": "sigstore library not installed; attestation stored without signature",
             }
         try:
-            from sigstore.sign import Signer  # type: ignore
-            from sigstore.sign import SigningContext  # type: ignore
+            from sigstore.sign import (
+                Signer,  # type: ignore
+                SigningContext,  # type: ignore
+            )
         except Exception:  # pragma: no cover - optional dependency fallback
             return {
                 "mode": "unsigned",
@@ -73,8 +64,8 @@ class AttestationBuilder:
         sbom_path: Path,
         output_dir: Path,
         *,
-        artifact_stem: Optional[str] = None,
-        source_path: Optional[str] = None,
+        artifact_stem: str | None = None,
+        source_path: str | None = None,
     ) -> Path:
         output_dir.mkdir(parents=True, exist_ok=True)
         stem = artifact_stem or slugify(lint_report.skill_name)
@@ -101,12 +92,12 @@ class AttestationBuilder:
             "probe": probe_result.to_dict(),
             "sbom": {
                 "path": str(sbom_path),
-                "sha256": _hash_file(sbom_path),
+                "sha256": sha256_file(sbom_path),
             },
             "files": self._collect_file_hashes(skill_path),
         }
         serialized = json.dumps(payload, sort_keys=True).encode("utf-8")
         payload["signature"] = self._sign_payload(serialized)
         attestation_path = output_dir / f"{stem}.attestation.json"
-        attestation_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        attestation_path.write_bytes(dump_json(payload))
         return attestation_path
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import importlib.util
 import os
+import shutil
 import subprocess
 import sys
-import importlib.util
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
-from collections import defaultdict
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -23,10 +25,10 @@ from .lint_rules import run_lint
 from .otel import emit_run_span
 from .probe import ProbeRunner
 from .remediation import get_remediation
-from .report import ReportWriter, ReportFinding
+from .report import ReportFinding, ReportWriter
 from .sbom import generate_sbom
 from .schema import Policy, SkillValidationError, find_skill_md, load_policy
-from .utils import slugify
+from .utils import available_cpus, dump_json, slugify
 
 app = typer.Typer(
     add_completion=False,
@@ -50,24 +52,51 @@ def root(ctx: typer.Context) -> None:
     raise typer.Exit(code=0)
 
 
-def _resolve_output_dir(output_dir: Optional[Path]) -> Path:
+def _resolve_output_dir(output_dir: Path | None) -> Path:
     target = output_dir or (Path.cwd() / ".skillcheck")
     target.mkdir(parents=True, exist_ok=True)
     return target
 
 
-def _resolve_diff_output_dir(output_dir: Optional[Path]) -> Path:
+def _resolve_diff_output_dir(output_dir: Path | None) -> Path:
     target = output_dir or (Path.cwd() / ".skillcheck" / "diff")
     target.mkdir(parents=True, exist_ok=True)
     return target
 
 
-def _resolve_fix_output_dir(output_dir: Optional[Path]) -> Path:
+def _resolve_fix_output_dir(output_dir: Path | None) -> Path:
     target = output_dir or (Path.cwd() / ".skillcheck" / "fix")
     target.mkdir(parents=True, exist_ok=True)
     return target
 
 
+def _write_fix_artifact(output_dir: Path | None, payload: dict[str, Any]) -> Path:
+    artifact_path = _resolve_fix_output_dir(output_dir) / "fix.results.json"
+    _save_json(payload, artifact_path)
+    return artifact_path
+
+
+def _fix_summary(
+    pre_scores: list[float],
+    post_scores: list[float],
+    *,
+    skills_changed: int,
+    applied: int,
+    skipped: int,
+) -> dict[str, Any]:
+    pre_avg = round(sum(pre_scores) / len(pre_scores), 2) if pre_scores else 0.0
+    post_avg = round(sum(post_scores) / len(post_scores), 2) if post_scores else 0.0
+    return {
+        "skills_considered": len(pre_scores),
+        "skills_changed": skills_changed,
+        "applied_actions": applied,
+        "skipped_actions": skipped,
+        "pre_avg_trust_score": pre_avg,
+        "post_avg_trust_score": post_avg,
+        "trust_delta": round(post_avg - pre_avg, 2),
+    }
+
+
 def _exec_default() -> bool:
     return os.environ.get("SKILLCHECK_PROBE_EXEC", "").lower() in {"1", "true", "yes"}
 
@@ -136,38 +165,100 @@ def _render_probe_table(result) -> None:
 
 
 def _save_json(payload: dict, path: Path) -> None:
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    path.write_bytes(dump_json(payload))
 
 
-def _load_policy(path: Optional[Path], policy_pack: Optional[str], policy_version: Optional[int]) -> Policy:
+def _load_policy(path: Path | None, policy_pack: str | None, policy_version: int | None) -> Policy:
     try:
         return load_policy(path, policy_pack=policy_pack, expected_version=policy_version)
     except SkillValidationError as exc:
         raise typer.BadParameter(str(exc)) from exc
 
 
-def _git_changed_files(run_dir: Path, base: str, head: str) -> List[str]:
-    cmd = ["git", "-C", str(run_dir), "diff", "--name-only", base, head]
-    try:
-        result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    except FileNotFoundError as exc:
-        raise typer.BadParameter("Git executable is required for `skillcheck fix` and `skillcheck diff`.") from exc
+@cache
+def _git_executable() -> str | None:
+    return shutil.which("git")
+
+
+def _run_git(run_dir: Path, *args: str) -> subprocess.CompletedProcess[bytes]:
+    """Run git against ``run_dir`` using the cached binary and lock-free env."""
+    executable = _git_executable()
+    if executable is None:
+        raise typer.BadParameter("Git executable is required for `skillcheck fix` and `skillcheck diff`.")
+    return subprocess.run(
+        ["git", "-C", str(run_dir), *args],
+        executable=executable,
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        check=False,
+        capture_output=True,
+    )
+
+
+def _process_text(output: bytes) -> str:
+    """Decode captured process output for messages; only called when the text is used."""
+    return output.decode("utf-8", errors="replace").strip()
+
+
+def _git_changed_files(run_dir: Path, base: str, head: str) -> list[str]:
+    result = _run_git(run_dir, "diff", "--name-only", "-z", base, head)
     if result.returncode != 0:
-        stderr = result.stderr.strip() or "Unknown git error"
+        stderr = _process_text(result.stderr) or "Unknown git error"
         raise typer.BadParameter(f"Unable to diff refs '{base}'..'{head}': {stderr}")
-    lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    return lines
+    return [os.fsdecode(name) for name in result.stdout.split(b"\0") if name]
 
 
-def _find_skill_root(repo_root: Path, changed_path: str) -> Optional[Path]:
+def _find_skill_root(
+    repo_root: Path,
+    changed_path: str,
+    cache: dict[Path, Path | None] | None = None,
+) -> Path | None:
     candidate = repo_root / changed_path
     current = candidate if candidate.is_dir() else candidate.parent
+    visited: list[Path] = []
     while True:
+        if cache is not None and current in cache:
+            found = cache[current]
+            break
+        visited.append(current)
         if find_skill_md(current):
-            return current
+            found = current
+            break
         if current == repo_root:
-            return None
+            found = None
+            break
         current = current.parent
+    if cache is not None:
+        for directory in visited:
+            cache[directory] = found
+    return found
+
+
+def _group_changed_skills(run_dir: Path, changed_files: list[str]) -> list[tuple[Path, list[str]]]:
+    """Group changed files by owning skill root, ordered by root path."""
+    grouped: dict[str, tuple[Path, list[str]]] = {}
+    roots_by_dir: dict[Path, Path | None] = {}
+    for changed_file in changed_files:
+        skill_root = _find_skill_root(run_dir, changed_file, roots_by_dir)
+        if skill_root is None:
+            continue
+        grouped.setdefault(str(skill_root), (skill_root, []))[1].append(changed_file)
+    return [grouped[key] for key in sorted(grouped)]
+
+
+def _audit_skill(
+    skill_root: Path,
+    policy: Policy,
+    exec_probe: bool,
+    lint_paths: list[str] | None = None,
+    parallel: bool = True,
+) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """Lint and probe one skill; module-level so diff can fan it out to worker processes.
+
+    Pass ``parallel=False`` from a worker so the probe does not start a pool of its own.
+    """
+    lint_report = run_lint(skill_root, policy, paths=lint_paths)
+    probe_report = ProbeRunner(policy, enable_exec=exec_probe, parallel=parallel).run(skill_root)
+    return lint_report.skill_name, lint_report.to_dict(), probe_report.to_dict()
 
 
 def _clear_diff_artifacts(artifact_dir: Path) -> None:
@@ -209,7 +300,7 @@ def _gha_escape(value: str) -> str:
     return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
 
 
-def _emit_github_annotations(findings: List[ReportFinding]) -> None:
+def _emit_github_annotations(findings: list[ReportFinding]) -> None:
     for finding in findings:
         level = "error"
         severity = finding.severity.lower()
@@ -287,18 +378,18 @@ def remediate(
 @app.command()
 def lint(
     skill_path: Path = typer.Argument(..., exists=True, file_okay=True, dir_okay=True),
-    policy: Optional[Path] = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
-    policy_pack: Optional[str] = typer.Option(
+    policy: Path | None = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
+    policy_pack: str | None = typer.Option(
         None,
         "--policy-pack",
         help="Built-in policy pack (strict|balanced|research|enterprise).",
     ),
-    policy_version: Optional[int] = typer.Option(
+    policy_version: int | None = typer.Option(
         None,
         "--policy-version",
         help="Require the loaded policy version to match this value.",
     ),
-    output_dir: Optional[Path] = typer.Option(
+    output_dir: Path | None = typer.Option(
         None, "--output-dir", help="Directory for lint artifacts (default: ./.skillcheck)."
     ),
 ) -> None:
@@ -326,18 +417,18 @@ def lint(
 @app.command()
 def probe(
     skill_path: Path = typer.Argument(..., exists=True, file_okay=True, dir_okay=True),
-    policy: Optional[Path] = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
-    policy_pack: Optional[str] = typer.Option(
+    policy: Path | None = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
+    policy_pack: str | None = typer.Option(
         None,
         "--policy-pack",
         help="Built-in policy pack (strict|balanced|research|enterprise).",
     ),
-    policy_version: Optional[int] = typer.Option(
+    policy_version: int | None = typer.Option(
         None,
         "--policy-version",
         help="Require the loaded policy version to match this value.",
     ),
-    output_dir: Optional[Path] = typer.Option(
+    output_dir: Path | None = typer.Option(
         None, "--output-dir", help="Directory for probe artifacts (default: ./.skillcheck)."
     ),
     exec_probe: bool = typer.Option(
@@ -372,18 +463,18 @@ def probe(
 @app.command()
 def attest(
     skill_path: Path = typer.Argument(..., exists=True, file_okay=True, dir_okay=True),
-    policy: Optional[Path] = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
-    policy_pack: Optional[str] = typer.Option(
+    policy: Path | None = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
+    policy_pack: str | None = typer.Option(
         None,
         "--policy-pack",
         help="Built-in policy pack (strict|balanced|research|enterprise).",
     ),
-    policy_version: Optional[int] = typer.Option(
+    policy_version: int | None = typer.Option(
         None,
         "--policy-version",
         help="Require the loaded policy version to match this value.",
     ),
-    output_dir: Optional[Path] = typer.Option(
+    output_dir: Path | None = typer.Option(
         None, "--output-dir", help="Directory for attestation artifacts (default: ./.skillcheck)."
     ),
     exec_probe: bool = typer.Option(
@@ -429,7 +520,7 @@ def report(
     run_dir: Path = typer.Argument(
         ..., exists=True, file_okay=False, help="Directory containing skill artifacts (e.g. repo root)."
     ),
-    artifacts_dir: Optional[Path] = typer.Option(
+    artifacts_dir: Path | None = typer.Option(
         None,
         "--artifacts",
         help="Directory with lint/probe/attestation JSON (default: <run_dir>/.skillcheck).",
@@ -439,7 +530,7 @@ def report(
         "--fail-on-failures/--no-fail-on-failures",
         help="Exit with non-zero status if any skill fails lint or probe checks.",
     ),
-    min_trust_score: Optional[float] = typer.Option(
+    min_trust_score: float | None = typer.Option(
         None,
         "--min-trust-score",
         help="Mark skills below this trust score as gate failures when fail-on-low-trust is enabled.",
@@ -530,18 +621,18 @@ def fix(
     ),
     base: str = typer.Option("HEAD~1", "--base", help="Base git ref for changed-files diff."),
     head: str = typer.Option("HEAD", "--head", help="Head git ref for changed-files diff."),
-    policy: Optional[Path] = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
-    policy_pack: Optional[str] = typer.Option(
+    policy: Path | None = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
+    policy_pack: str | None = typer.Option(
         None,
         "--policy-pack",
         help="Built-in policy pack (strict|balanced|research|enterprise).",
     ),
-    policy_version: Optional[int] = typer.Option(
+    policy_version: int | None = typer.Option(
         None,
         "--policy-version",
         help="Require the loaded policy version to match this value.",
     ),
-    output_dir: Optional[Path] = typer.Option(
+    output_dir: Path | None = typer.Option(
         None,
         "--output-dir",
         help="Directory for fix artifacts (default: ./.skillcheck/fix).",
@@ -571,7 +662,7 @@ def fix(
         "--pr/--no-pr",
         help="Open a pull request after push.",
     ),
-    branch_name: Optional[str] = typer.Option(
+    branch_name: str | None = typer.Option(
         None,
         "--branch-name",
         help="Branch to create/switch before commit.",
@@ -594,56 +685,46 @@ def fix(
         raise typer.BadParameter("--push requires --commit")
     if commit and not apply:
         raise typer.BadParameter("--commit requires --apply")
+    gh_executable = shutil.which("gh") if pr else None
+    if pr and gh_executable is None:
+        # Fail before any commit or push so a missing CLI never leaves a half-published branch.
+        raise typer.BadParameter("GitHub CLI `gh` is required for `--pr`.")
 
-    artifacts_dir = _resolve_fix_output_dir(output_dir)
     changed_files = _git_changed_files(run_dir, base, head)
-    changed_skills: Dict[Path, List[str]] = defaultdict(list)
-    for changed_file in changed_files:
-        skill_root = _find_skill_root(run_dir, changed_file)
-        if skill_root is None:
-            continue
-        changed_skills[skill_root].append(changed_file)
+    changed_skills = _group_changed_skills(run_dir, changed_files)
 
+    git_meta: dict[str, Any] = {
+        "commit_requested": commit,
+        "push_requested": push,
+        "pr_requested": pr,
+        "branch_name": branch_name,
+        "commit_created": False,
+        "pushed": False,
+        "pr_url": "",
+    }
     if not changed_skills:
-        empty_payload: Dict[str, Any] = {
+        empty_payload: dict[str, Any] = {
             "mode": "apply" if apply else "dry-run",
             "refs": {"base": base, "head": head},
-            "summary": {
-                "skills_considered": 0,
-                "skills_changed": 0,
-                "applied_actions": 0,
-                "skipped_actions": 0,
-                "pre_avg_trust_score": 0.0,
-                "post_avg_trust_score": 0.0,
-                "trust_delta": 0.0,
-            },
+            "summary": _fix_summary([], [], skills_changed=0, applied=0, skipped=0),
             "skills": [],
-            "git": {
-                "commit_requested": commit,
-                "push_requested": push,
-                "pr_requested": pr,
-                "branch_name": branch_name,
-                "commit_created": False,
-                "pushed": False,
-                "pr_url": "",
-            },
+            "git": git_meta,
         }
-        artifact_path = artifacts_dir / "fix.results.json"
-        artifact_path.write_text(json.dumps(empty_payload, indent=2), encoding="utf-8")
+        artifact_path = _write_fix_artifact(output_dir, empty_payload)
         console.print(f"Fix artifact JSON: {artifact_path}", style="green")
         console.print(f"No changed skill files detected between {base} and {head}.", style="yellow")
         raise typer.Exit(code=0)
 
     policy_obj = _load_policy(policy, policy_pack, policy_version)
-    skills_payload: List[Dict[str, Any]] = []
+    skills_payload: list[dict[str, Any]] = []
     total_applied = 0
     total_skipped = 0
     total_changed = 0
-    pre_scores: List[float] = []
-    post_scores: List[float] = []
-    git_add_paths: List[str] = []
+    pre_scores: list[float] = []
+    post_scores: list[float] = []
+    git_add_paths: list[str] = []
 
-    for skill_root, files in sorted(changed_skills.items(), key=lambda item: str(item[0])):
+    for skill_root, files in changed_skills:
         lint_before = run_lint(skill_root, policy_obj)
         probe_before = ProbeRunner(policy_obj, enable_exec=exec_probe).run(skill_root)
         pre_score = _calculate_trust_score(
@@ -701,27 +782,14 @@ def fix(
             style="cyan",
         )
 
-    pre_avg = round(sum(pre_scores) / len(pre_scores), 2) if pre_scores else 0.0
-    post_avg = round(sum(post_scores) / len(post_scores), 2) if post_scores else 0.0
-    summary_data: Dict[str, Any] = {
-        "skills_considered": len(skills_payload),
-        "skills_changed": total_changed,
-        "applied_actions": total_applied,
-        "skipped_actions": total_skipped,
-        "pre_avg_trust_score": pre_avg,
-        "post_avg_trust_score": post_avg,
-        "trust_delta": round(post_avg - pre_avg, 2),
-    }
-    git_meta: Dict[str, Any] = {
-        "commit_requested": commit,
-        "push_requested": push,
-        "pr_requested": pr,
-        "branch_name": branch_name,
-        "commit_created": False,
-        "pushed": False,
-        "pr_url": "",
-    }
-    payload: Dict[str, Any] = {
+    summary_data = _fix_summary(
+        pre_scores,
+        post_scores,
+        skills_changed=total_changed,
+        applied=total_applied,
+        skipped=total_skipped,
+    )
+    payload: dict[str, Any] = {
         "mode": "apply" if apply else "dry-run",
         "refs": {"base": base, "head": head},
         "summary": summary_data,
@@ -731,56 +799,33 @@ def fix(
 
     if commit and total_changed:
         if branch_name:
-            exists = subprocess.run(
-                ["git", "-C", str(run_dir), "show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"],
-                check=False,
-            ).returncode == 0
-            checkout_cmd = ["git", "-C", str(run_dir), "checkout", branch_name] if exists else [
-                "git",
-                "-C",
-                str(run_dir),
-                "checkout",
-                "-b",
-                branch_name,
-            ]
-            checkout = subprocess.run(checkout_cmd, check=False, capture_output=True, text=True)
+            exists = _run_git(run_dir, "show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}").returncode == 0
+            checkout_args = ["checkout", branch_name] if exists else ["checkout", "-b", branch_name]
+            checkout = _run_git(run_dir, *checkout_args)
             if checkout.returncode != 0:
-                raise typer.BadParameter(f"Unable to switch branch '{branch_name}': {checkout.stderr.strip()}")
+                raise typer.BadParameter(f"Unable to switch branch '{branch_name}': {_process_text(checkout.stderr)}")
         unique_paths = sorted(set(git_add_paths))
-        add_cmd = ["git", "-C", str(run_dir), "add", *unique_paths]
-        add_result = subprocess.run(add_cmd, check=False, capture_output=True, text=True)
+        add_result = _run_git(run_dir, "add", *unique_paths)
         if add_result.returncode != 0:
-            raise typer.BadParameter(f"Unable to stage remediation changes: {add_result.stderr.strip()}")
-        commit_result = subprocess.run(
-            ["git", "-C", str(run_dir), "commit", "-m", commit_message],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+            raise typer.BadParameter(f"Unable to stage remediation changes: {_process_text(add_result.stderr)}")
+        commit_result = _run_git(run_dir, "commit", "-m", commit_message)
         if commit_result.returncode != 0:
-            stderr = commit_result.stderr.strip() or commit_result.stdout.strip()
+            stderr = _process_text(commit_result.stderr) or _process_text(commit_result.stdout)
             raise typer.BadParameter(f"Unable to create remediation commit: {stderr}")
         git_meta["commit_created"] = True
         console.print("Created remediation commit.", style="green")
 
         if push:
-            current_branch = subprocess.run(
-                ["git", "-C", str(run_dir), "rev-parse", "--abbrev-ref", "HEAD"],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if current_branch.returncode != 0:
-                raise typer.BadParameter("Unable to determine current branch for push")
-            branch_to_push = current_branch.stdout.strip()
-            push_result = subprocess.run(
-                ["git", "-C", str(run_dir), "push", "-u", "origin", branch_to_push],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
+            if branch_name:
+                branch_to_push = branch_name
+            else:
+                current_branch = _run_git(run_dir, "rev-parse", "--abbrev-ref", "HEAD")
+                if current_branch.returncode != 0:
+                    raise typer.BadParameter("Unable to determine current branch for push")
+                branch_to_push = _process_text(current_branch.stdout)
+            push_result = _run_git(run_dir, "push", "-u", "origin", branch_to_push)
             if push_result.returncode != 0:
-                raise typer.BadParameter(f"Unable to push remediation branch: {push_result.stderr.strip()}")
+                raise typer.BadParameter(f"Unable to push remediation branch: {_process_text(push_result.stderr)}")
             git_meta["pushed"] = True
             console.print(f"Pushed remediation branch: {branch_to_push}", style="green")
 
@@ -791,36 +836,33 @@ def fix(
                     f"- Skills changed: {total_changed}\\n"
                     f"- Trust delta: {payload['summary']['trust_delta']:+.2f}\\n"
                 )
-                try:
-                    pr_result = subprocess.run(
-                        [
-                            "gh",
-                            "pr",
-                            "create",
-                            "--title",
-                            pr_title,
-                            "--body",
-                            pr_body,
-                            "--head",
-                            branch_to_push,
-                        ],
-                        cwd=run_dir,
-                        check=False,
-                        capture_output=True,
-                        text=True,
-                    )
-                except FileNotFoundError as exc:
-                    raise typer.BadParameter("GitHub CLI `gh` is required for `--pr`.") from exc
+                pr_result = subprocess.run(
+                    [
+                        "gh",
+                        "pr",
+                        "create",
+                        "--title",
+                        pr_title,
+                        "--body",
+                        pr_body,
+                        "--head",
+                        branch_to_push,
+                    ],
+                    executable=gh_executable,
+                    cwd=run_dir,
+                    check=False,
+                    capture_output=True,
+                )
                 if pr_result.returncode != 0:
-                    raise typer.BadParameter(f"Unable to create pull request: {pr_result.stderr.strip()}")
-                pr_url = pr_result.stdout.strip().splitlines()[-1] if pr_result.stdout.strip() else ""
+                    raise typer.BadParameter(f"Unable to create pull request: {_process_text(pr_result.stderr)}")
+                pr_lines = pr_result.stdout.strip().splitlines()
+                pr_url = _process_text(pr_lines[-1]) if pr_lines else ""
                 git_meta["pr_url"] = pr_url
                 console.print(f"Created pull request: {pr_url}", style="green")
     elif commit and not total_changed:
         console.print("No applied remediation changes to commit.", style="yellow")
 
-    artifact_path = artifacts_dir / "fix.results.json"
-    artifact_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    artifact_path = _write_fix_artifact(output_dir, payload)
     console.print(f"Fix artifact JSON: {artifact_path}", style="green")
     console.print(
         f"Fix summary — skills: {len(skills_payload)}, changed: {total_changed}, trust delta: {summary_data['trust_delta']:+.2f}",
@@ -835,18 +877,18 @@ def diff(
     ),
     base: str = typer.Option("HEAD~1", "--base", help="Base git ref for changed-files diff."),
     head: str = typer.Option("HEAD", "--head", help="Head git ref for changed-files diff."),
-    policy: Optional[Path] = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
-    policy_pack: Optional[str] = typer.Option(
+    policy: Path | None = typer.Option(None, "--policy", "-p", help="Path to policy YAML."),
+    policy_pack: str | None = typer.Option(
         None,
         "--policy-pack",
         help="Built-in policy pack (strict|balanced|research|enterprise).",
     ),
-    policy_version: Optional[int] = typer.Option(
+    policy_version: int | None = typer.Option(
         None,
         "--policy-version",
         help="Require the loaded policy version to match this value.",
     ),
-    output_dir: Optional[Path] = typer.Option(
+    output_dir: Path | None = typer.Option(
         None,
         "--output-dir",
         help="Directory for diff artifacts (default: ./.skillcheck/diff).",
@@ -866,15 +908,15 @@ def diff(
         "--summary/--no-summary",
         help="Print a condensed PASS/FAIL table for changed skills.",
     ),
+    changed_only: bool = typer.Option(
+        False,
+        "--changed-only/--full-skill",
+        help="Apply lint content rules only to changed files (schema and dependency checks still run).",
+    ),
 ) -> None:
     """Run lint/probe only for skills touched between two git refs."""
     changed_files = _git_changed_files(run_dir, base, head)
-    changed_skills: Dict[Path, List[str]] = defaultdict(list)
-    for changed_file in changed_files:
-        skill_root = _find_skill_root(run_dir, changed_file)
-        if skill_root is None:
-            continue
-        changed_skills[skill_root].append(changed_file)
+    changed_skills = _group_changed_skills(run_dir, changed_files)
 
     if not changed_skills:
         console.print(f"No changed skill files detected between {base} and {head}.", style="yellow")
@@ -884,13 +926,27 @@ def diff(
     artifacts_dir = _resolve_diff_output_dir(output_dir)
     _clear_diff_artifacts(artifacts_dir)
 
-    for skill_root, files in sorted(changed_skills.items(), key=lambda item: str(item[0])):
-        lint_report = run_lint(skill_root, policy_obj)
-        probe_report = ProbeRunner(policy_obj, enable_exec=exec_probe).run(skill_root)
-        stem = slugify(lint_report.skill_name)
-        _save_json(lint_report.to_dict(), artifacts_dir / f"{stem}.lint.json")
-        _save_json(probe_report.to_dict(), artifacts_dir / f"{stem}.probe.json")
-        console.print(f"Audited {lint_report.skill_name} ({len(files)} changed files)", style="cyan")
+    skill_roots = [skill_root for skill_root, _ in changed_skills]
+    policies = [policy_obj] * len(skill_roots)
+    exec_flags = [exec_probe] * len(skill_roots)
+    lint_paths: list[list[str] | None] = [
+        [str((run_dir / changed).relative_to(skill_root)) for changed in files] if changed_only else None
+        for skill_root, files in changed_skills
+    ]
+    workers = min(len(skill_roots), available_cpus())
+    if workers > 1:
+        # Each skill already has a process of its own; nested probe pools would multiply the process count.
+        parallel_flags = [False] * len(skill_roots)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            audits = list(executor.map(_audit_skill, skill_roots, policies, exec_flags, lint_paths, parallel_flags))
+    else:
+        audits = list(map(_audit_skill, skill_roots, policies, exec_flags, lint_paths))
+
+    for (_, files), (skill_name, lint_payload, probe_payload) in zip(changed_skills, audits):
+        stem = slugify(skill_name)
+        _save_json(lint_payload, artifacts_dir / f"{stem}.lint.json")
+        _save_json(probe_payload, artifacts_dir / f"{stem}.probe.json")
+        console.print(f"Audited {skill_name} ({len(files)} changed files)", style="cyan")
 
     writer = ReportWriter(artifacts_dir)
     result = writer.write()
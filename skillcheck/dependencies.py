@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import fnmatch
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple
 
 try:  # Python 3.11+
     import tomllib  # type: ignore
@@ -16,6 +15,8 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
     except ModuleNotFoundError:
         tomllib = None  # type: ignore
 
+from .utils import iter_files, load_json
+
 
 @dataclass
 class Dependency:
@@ -33,26 +34,33 @@ class DependencyIssue:
 
 
 REQ_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*")
+MANIFEST_IGNORE_DIRS = {".git", "node_modules"}
 
 
-def _iter_requirement_files(skill_path: Path) -> Iterable[Path]:
-    patterns = ("requirements*.txt", "requirements*.in")
-    for pattern in patterns:
-        for path in sorted(skill_path.rglob(pattern)):
-            if "node_modules" in path.parts:
-                continue
-            yield path
+def _iter_manifest_files(skill_path: Path) -> tuple[list[Path], list[Path]]:
+    """Return (requirements files, package.json files) from a single tree walk."""
+    requirements_txt: list[Path] = []
+    requirements_in: list[Path] = []
+    package_json: list[Path] = []
+    for entry in iter_files(skill_path, MANIFEST_IGNORE_DIRS):
+        name = entry.name
+        if name == "package.json":
+            package_json.append(Path(entry.path))
+        elif fnmatch.fnmatchcase(name, "requirements*.txt"):
+            requirements_txt.append(Path(entry.path))
+        elif fnmatch.fnmatchcase(name, "requirements*.in"):
+            requirements_in.append(Path(entry.path))
+    return requirements_txt + requirements_in, package_json
 
 
 def _parse_requirement_line(
-    line: str, path: Path, issues: List[DependencyIssue]
-) -> Optional[Dependency]:
+    line: str, path: Path, issues: list[DependencyIssue]
+) -> Dependency | None:
     stripped = line.strip()
-    if not stripped or stripped.startswith("#"):
-        return None
-    if stripped.startswith(("-", "--")):
+    first = stripped[:1]
+    if not first or first in "#-":
         return None
-    if stripped.startswith((".", "/")):
+    if first in "./":
         issues.append(
             DependencyIssue(
                 code="DEPENDENCY_PYPI_PATH",
@@ -84,13 +92,34 @@ def _parse_requirement_line(
     return Dependency(ecosystem="pypi", name=name, spec=stripped, source=str(path))
 
 
-def _collect_requirements(path: Path, issues: List[DependencyIssue], seen: Set[Path]) -> List[Dependency]:
+def _collect_requirements(path: Path, issues: list[DependencyIssue], seen: set[Path]) -> list[Dependency]:
     if path in seen:
         return []
     seen.add(path)
-    deps: List[Dependency] = []
+    deps: list[Dependency] = []
+    file_issues: list[DependencyIssue] = []
+    # Includes are followed only once this file has decoded cleanly, at the position they appeared.
+    includes: list[tuple[int, int, Path]] = []
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if stripped.startswith(("-r", "--requirement")):
+                    parts = stripped.split(maxsplit=1)
+                    if len(parts) == 2:
+                        includes.append((len(deps), len(file_issues), (path.parent / parts[1]).resolve()))
+                    else:
+                        file_issues.append(
+                            DependencyIssue(
+                                code="DEPENDENCY_PYPI_PARSE",
+                                message=f"Could not parse requirement include: {stripped}",
+                                path=str(path),
+                            )
+                        )
+                    continue
+                dep = _parse_requirement_line(stripped, path, file_issues)
+                if dep:
+                    deps.append(dep)
     except FileNotFoundError:
         issues.append(
             DependencyIssue(
@@ -99,8 +128,9 @@ def _collect_requirements(path: Path, issues: List[DependencyIssue], seen: Set[P
                 path=str(path),
             )
         )
-        return deps
+        return []
     except UnicodeDecodeError:
+        # Match whole-file decoding: findings from lines read before the bad byte are dropped.
         issues.append(
             DependencyIssue(
                 code="DEPENDENCY_PYPI_ENCODING",
@@ -108,32 +138,21 @@ def _collect_requirements(path: Path, issues: List[DependencyIssue], seen: Set[P
                 path=str(path),
             )
         )
-        return deps
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("-r") or stripped.startswith("--requirement"):
-            parts = stripped.split(maxsplit=1)
-            if len(parts) == 2:
-                ref_path = (path.parent / parts[1]).resolve()
-                deps.extend(_collect_requirements(ref_path, issues, seen))
-            else:
-                issues.append(
-                    DependencyIssue(
-                        code="DEPENDENCY_PYPI_PARSE",
-                        message=f"Could not parse requirement include: {stripped}",
-                        path=str(path),
-                    )
-                )
-            continue
-        dep = _parse_requirement_line(line, path, issues)
-        if dep:
-            deps.append(dep)
+        return []
+    dep_shift = issue_shift = 0
+    for dep_at, issue_at, ref_path in includes:
+        ref_issues: list[DependencyIssue] = []
+        ref_deps = _collect_requirements(ref_path, ref_issues, seen)
+        deps[dep_at + dep_shift : dep_at + dep_shift] = ref_deps
+        file_issues[issue_at + issue_shift : issue_at + issue_shift] = ref_issues
+        dep_shift += len(ref_deps)
+        issue_shift += len(ref_issues)
+    issues.extend(file_issues)
     return deps
 
 
-def _parse_pyproject(path: Path, issues: List[DependencyIssue]) -> List[Dependency]:
-    deps: List[Dependency] = []
+def _parse_pyproject(path: Path, issues: list[DependencyIssue]) -> list[Dependency]:
+    deps: list[Dependency] = []
     if tomllib is None:
         issues.append(
             DependencyIssue(
@@ -195,10 +214,10 @@ def _parse_pyproject(path: Path, issues: List[DependencyIssue]) -> List[Dependen
     return deps
 
 
-def _parse_package_json(path: Path, issues: List[DependencyIssue]) -> List[Dependency]:
-    deps: List[Dependency] = []
+def _parse_package_json(path: Path, issues: list[DependencyIssue]) -> list[Dependency]:
+    deps: list[Dependency] = []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json(path.read_bytes())
     except Exception as exc:
         issues.append(
             DependencyIssue(
@@ -242,22 +261,21 @@ def _parse_package_json(path: Path, issues: List[DependencyIssue]) -> List[Depen
     return deps
 
 
-def collect_dependencies(skill_path: Path) -> Tuple[List[Dependency], List[DependencyIssue]]:
+def collect_dependencies(skill_path: Path) -> tuple[list[Dependency], list[DependencyIssue]]:
     """Collect dependencies and parse issues from common manifest files."""
-    dependencies: List[Dependency] = []
-    issues: List[DependencyIssue] = []
+    dependencies: list[Dependency] = []
+    issues: list[DependencyIssue] = []
 
-    seen_requirements: Set[Path] = set()
-    for path in _iter_requirement_files(skill_path):
+    requirement_files, package_files = _iter_manifest_files(skill_path)
+    seen_requirements: set[Path] = set()
+    for path in requirement_files:
         dependencies.extend(_collect_requirements(path, issues, seen_requirements))
 
     pyproject = skill_path / "pyproject.toml"
     if pyproject.exists():
         dependencies.extend(_parse_pyproject(pyproject, issues))
 
-    for path in sorted(skill_path.rglob("package.json")):
-        if "node_modules" in path.parts:
-            continue
+    for path in package_files:
         dependencies.extend(_parse_package_json(path, issues))
 
     return dependencies, issues
@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import os
 import re
+import shutil
+import tempfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from .lint_rules import LintReport
-from .schema import Policy, SKILL_FRONTMATTER_FIELDS, find_skill_md
+from .schema import SKILL_FRONTMATTER_FIELDS, Policy, find_skill_md
 
 NAME_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_PLAIN_SCALAR = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9 _.,()/+-]*[A-Za-z0-9_.,()/+-])?")
+_PLAIN_MAX_WIDTH = 80
+_YAML_RESOLVER = yaml.resolver.Resolver()
 
 
 @dataclass
@@ -25,10 +39,10 @@ class FixAction:
 @dataclass
 class FixResult:
     skill_name: str
-    applied: List[FixAction] = field(default_factory=list)
-    skipped: List[FixAction] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
-    changed_files: List[str] = field(default_factory=list)
+    applied: list[FixAction] = field(default_factory=list)
+    skipped: list[FixAction] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    changed_files: list[str] = field(default_factory=list)
 
     @property
     def proposed(self) -> bool:
@@ -38,7 +52,7 @@ class FixResult:
     def changed(self) -> bool:
         return bool(self.changed_files)
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "skill_name": self.skill_name,
             "applied": [action.__dict__ for action in self.applied],
@@ -50,21 +64,43 @@ class FixResult:
         }
 
 
+class _SlugTable(dict[int, str]):
+    """``str.translate`` table that keeps [a-z0-9-] and maps every other code point to ``-``."""
+
+    def __missing__(self, key: int) -> str:
+        return "-"
+
+
+_SLUG_TABLE = _SlugTable({ord(char): char for char in "abcdefghijklmnopqrstuvwxyz0123456789-"})
+
+
+@lru_cache(maxsize=1024)
 def _slugify_name(value: str) -> str:
-    lowered = value.strip().lower().replace("_", "-").replace(" ", "-")
-    cleaned = re.sub(r"[^a-z0-9-]+", "-", lowered)
-    collapsed = re.sub(r"-+", "-", cleaned).strip("-")
-    return collapsed or "skill"
+    translated = value.lower().translate(_SLUG_TABLE)
+    return "-".join(part for part in translated.split("-") if part) or "skill"
 
 
-def _parse_skill_md(text: str) -> Tuple[Dict[str, Any], str, bool]:
+def _replace_file_text(path: Path, text: str) -> None:
+    """Atomically replace ``path`` with ``text``, keeping its permission bits."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(text.encode("utf-8"))
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _parse_skill_md(text: str) -> tuple[dict[str, Any], str, bool]:
     if text.startswith("---"):
         parts = text.split("---", 2)
         if len(parts) == 3:
             raw_frontmatter = parts[1]
             body = parts[2].lstrip("\n")
             try:
-                parsed = yaml.safe_load(raw_frontmatter) or {}
+                parsed = yaml.load(raw_frontmatter, Loader=_YamlLoader) or {}
             except yaml.YAMLError:
                 return {}, body, False
             if isinstance(parsed, dict):
@@ -72,21 +108,57 @@ def _parse_skill_md(text: str) -> Tuple[Dict[str, Any], str, bool]:
     return {}, text.strip() + "\n", False
 
 
-def _render_skill_md(frontmatter: Dict[str, Any], body: str) -> str:
-    ordered: Dict[str, Any] = {}
+def _is_plain_scalar(value: Any, column: int) -> bool:
+    """True when PyYAML would emit ``value`` as an unquoted, unfolded plain scalar."""
+    return (
+        isinstance(value, str)
+        and column + len(value) <= _PLAIN_MAX_WIDTH
+        and _PLAIN_SCALAR.fullmatch(value) is not None
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == "tag:yaml.org,2002:str"
+    )
+
+
+def _emit_frontmatter(ordered: dict[str, Any]) -> str | None:
+    """Emit the common frontmatter shapes directly; ``None`` means use the YAML dumper."""
+    if not ordered:
+        return None
+    lines: list[str] = []
+    for key, value in ordered.items():
+        if not _is_plain_scalar(key, 0):
+            return None
+        if isinstance(value, dict):
+            if not value:
+                lines.append(f"{key}: {{}}")
+                continue
+            lines.append(f"{key}:")
+            for sub_key, sub_value in value.items():
+                if not (_is_plain_scalar(sub_key, 2) and _is_plain_scalar(sub_value, len(sub_key) + 4)):
+                    return None
+                lines.append(f"  {sub_key}: {sub_value}")
+        elif _is_plain_scalar(value, len(key) + 2):
+            lines.append(f"{key}: {value}")
+        else:
+            return None
+    return "\n".join(lines)
+
+
+def _render_skill_md(frontmatter: dict[str, Any], body: str) -> str:
+    ordered: dict[str, Any] = {}
     for key in ("name", "description", "license", "compatibility", "allowed-tools", "metadata"):
         if key in frontmatter:
             ordered[key] = frontmatter[key]
     for key, value in frontmatter.items():
         if key not in ordered:
             ordered[key] = value
-    header = yaml.safe_dump(ordered, sort_keys=False, allow_unicode=False).strip()
+    header = _emit_frontmatter(ordered)
+    if header is None:
+        header = yaml.dump(ordered, Dumper=_YamlDumper, sort_keys=False, allow_unicode=False).strip()
     cleaned_body = body.lstrip("\n")
     return f"---\n{header}\n---\n\n{cleaned_body.rstrip()}\n"
 
 
-def _fix_frontmatter(frontmatter: Dict[str, Any], dir_name: str, policy: Policy) -> Tuple[Dict[str, Any], List[FixAction], bool]:
-    fixes: List[FixAction] = []
+def _fix_frontmatter(frontmatter: dict[str, Any], dir_name: str, policy: Policy) -> tuple[dict[str, Any], list[FixAction], bool]:
+    fixes: list[FixAction] = []
     changed = False
     result = dict(frontmatter)
 
@@ -149,9 +221,10 @@ def run_safe_remediation(skill_path: Path, lint_report: LintReport, policy: Poli
     skill_name = lint_report.skill_name or skill_path.name
     result = FixResult(skill_name=skill_name)
     skill_md = find_skill_md(skill_path)
+    directory_slug = _slugify_name(skill_path.name)
 
     if skill_md is None:
-        template_name = _slugify_name(skill_path.name)
+        template_name = directory_slug
         action = FixAction(
             code="SCHEMA_MISSING",
             message="Generate minimal SKILL.md template",
@@ -181,8 +254,8 @@ def run_safe_remediation(skill_path: Path, lint_report: LintReport, policy: Poli
     frontmatter, body, parsed = _parse_skill_md(original_text)
     if not parsed:
         frontmatter = {
-            "name": _slugify_name(skill_path.name),
-            "description": f"Skill {_slugify_name(skill_path.name)}",
+            "name": directory_slug,
+            "description": f"Skill {directory_slug}",
         }
         result.skipped.append(
             FixAction(
@@ -208,7 +281,7 @@ def run_safe_remediation(skill_path: Path, lint_report: LintReport, policy: Poli
 
     new_text = _render_skill_md(fixed_frontmatter, body)
     if new_text != original_text:
-        skill_md.write_text(new_text, encoding="utf-8")
+        _replace_file_text(skill_md, new_text)
         result.changed_files.append(skill_md.name)
 
     return result
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterable, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
-
-from .dependencies import collect_dependencies, DependencyIssue
-from .schema import Policy, parse_skill_metadata, load_policy
+from stat import S_ISREG
+
+from .dependencies import DependencyIssue, collect_dependencies
+from .schema import PatternRule, Policy, load_policy, parse_skill_metadata
+from .utils import (
+    RawPrefilter,
+    build_raw_prefilter,
+    decode_text,
+    iter_files,
+    pattern_needles,
+    read_bytes_if_text,
+)
 
 SECRET_PATTERN = re.compile(r"(?i)(api[_-]?key|secret|token)\s*[:=]\s*[^\s]+")
 PATH_TRAVERSAL_PATTERN = re.compile(r"\.\./|\.\.\\\\")
@@ -17,7 +29,7 @@ REFERENCE_INLINE_PATTERN = re.compile(r"\b(?:scripts|references|assets)/[A-Za-z0
 IGNORE_DIRS = {".git", ".skillcheck", "__pycache__", "node_modules"}
 
 
-@dataclass
+@dataclass(slots=True)
 class LintIssue:
     """Single lint finding."""
 
@@ -26,7 +38,7 @@ class LintIssue:
     path: str
     severity: str = "error"
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> dict[str, str]:
         return {
             "code": self.code,
             "message": self.message,
@@ -44,8 +56,8 @@ class LintReport:
     """Aggregate lint findings for a Skill."""
 
     skill_name: str
-    skill_version: Optional[str]
-    issues: List[LintIssue]
+    skill_version: str | None
+    issues: list[LintIssue]
     files_scanned: int
 
     @property
@@ -56,7 +68,7 @@ class LintReport:
     def ok(self) -> bool:
         return self.violations_count == 0
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "skill": {
                 "name": self.skill_name,
@@ -71,26 +83,19 @@ class LintReport:
         }
 
 
-def _iter_files(skill_path: Path) -> Iterable[Path]:
-    for candidate in sorted(skill_path.rglob("*")):
-        if any(part in IGNORE_DIRS for part in candidate.parts):
-            continue
-        if candidate.is_file():
-            yield candidate
+def _iter_files(skill_path: Path) -> Iterable[tuple[str, str, os.stat_result]]:
+    """Yield ``(relative path, full path, stat)`` for every file outside ``IGNORE_DIRS``."""
+    prefix_len = len(os.path.join(os.fspath(skill_path), ""))
+    for entry in iter_files(skill_path, IGNORE_DIRS):
+        # DirEntry caches the stat, so the size check and the read share one syscall.
+        yield entry.path[prefix_len:], entry.path, entry.stat()
 
 
-def _issue_waived(policy: Policy, code: str, path: Path) -> bool:
-    relative = str(path)
-    for waiver in policy.waivers:
-        waiver_path = waiver.get("path")
-        waiver_code = waiver.get("rule")
-        if waiver_path and waiver_code:
-            if waiver_path == relative and waiver_code == code:
-                return True
-    return False
+def _issue_waived(policy: Policy, code: str, path: str) -> bool:
+    return policy.is_waived(code, path)
 
 
-def _check_monolithic_skill(body: str, skill_md_path: Path, policy: Policy, issues: List[LintIssue]) -> None:
+def _check_monolithic_skill(body: str, skill_md_path: Path, policy: Policy, issues: list[LintIssue]) -> None:
     max_lines = policy.skill_body_max_lines
     if max_lines <= 0:
         return
@@ -109,55 +114,110 @@ def _check_monolithic_skill(body: str, skill_md_path: Path, policy: Policy, issu
         )
 
 
-def _check_forbidden_patterns(policy: Policy, path: Path, text: str, issues: List[LintIssue]) -> None:
-    for rule in policy.forbidden_patterns:
-        if rule.pattern.search(text):
-            if _issue_waived(policy, rule.code, path):
-                continue
-            issues.append(
-                LintIssue(
-                    code=rule.code,
-                    path=str(path),
-                    message=rule.reason,
-                )
-            )
+@dataclass(frozen=True, slots=True)
+class _TextRule:
+    """Content rule applied to every decoded file in a skill."""
 
+    code: str
+    pattern: re.Pattern[str]
+    message: str
+    waivable: bool = False
+    # Literals of which at least one must occur for the pattern to match; empty disables the prefilter.
+    needles: tuple[str, ...] = ()
+    # Needles are lowercase and matched against lowercased text (ASCII files only).
+    fold_case: bool = False
+
+
+_BUILTIN_TEXT_RULES = (
+    _TextRule(
+        code="SECRET_SUSPECT",
+        pattern=SECRET_PATTERN,
+        message="Potential secret token detected",
+        needles=("key", "secret", "token"),
+        fold_case=True,
+    ),
+    _TextRule(
+        code="PATH_TRAVERSAL",
+        pattern=PATH_TRAVERSAL_PATTERN,
+        message="Relative path traversal detected ('../'); writes must stay within allowed globs.",
+        needles=("../", "..\\\\"),
+    ),
+)
+
+
+def _policy_text_rule(rule: PatternRule) -> _TextRule:
+    pattern = rule.pattern
+    needles, fold_case = pattern_needles(pattern.pattern, pattern.flags)
+    return _TextRule(
+        code=rule.code,
+        pattern=pattern,
+        message=rule.reason,
+        waivable=True,
+        needles=needles,
+        fold_case=fold_case,
+    )
 
-def _check_secret_pattern(path: Path, text: str, issues: List[LintIssue]) -> None:
-    if SECRET_PATTERN.search(text):
-        issues.append(
-            LintIssue(
-                code="SECRET_SUSPECT",
-                path=str(path),
-                message="Potential secret token detected",
-            )
-        )
 
+def _text_rules(policy: Policy) -> list[_TextRule]:
+    rules = [_policy_text_rule(rule) for rule in policy.forbidden_patterns]
+    rules.extend(_BUILTIN_TEXT_RULES)
+    return rules
 
-def _check_path_traversal(path: Path, text: str, issues: List[LintIssue]) -> None:
-    if PATH_TRAVERSAL_PATTERN.search(text):
-        issues.append(
-            LintIssue(
-                code="PATH_TRAVERSAL",
-                path=str(path),
-                message="Relative path traversal detected ('../'); writes must stay within allowed globs.",
-            )
-        )
 
+def _raw_prefilter(rules: Sequence[_TextRule]) -> RawPrefilter:
+    return build_raw_prefilter((rule.needles, rule.fold_case) for rule in rules)
 
-def _extract_references(body: str) -> List[str]:
+
+def _scan_text(
+    rules: Sequence[_TextRule],
+    policy: Policy,
+    path: str,
+    text: str,
+    issues: list[LintIssue],
+) -> None:
+    lowered: str | None = None
+    for rule in rules:
+        if rule.needles:
+            if not rule.fold_case:
+                haystack: str | None = text
+            elif text.isascii():
+                # Unicode case folding has matches that str.lower() misses (e.g. "ı" for "i"),
+                # so the lowercase prefilter is only exact for ASCII text.
+                if lowered is None:
+                    lowered = text.lower()
+                haystack = lowered
+            else:
+                haystack = None
+            if haystack is not None and not any(needle in haystack for needle in rule.needles):
+                continue
+        if not rule.pattern.search(text):
+            continue
+        if rule.waivable and _issue_waived(policy, rule.code, path):
+            continue
+        issues.append(LintIssue(code=rule.code, path=path, message=rule.message))
+
+
+@lru_cache(maxsize=128)
+def _extract_references(body: str) -> tuple[str, ...]:
     refs = set()
-    for match in REFERENCE_LINK_PATTERN.finditer(body):
-        path = match.group(1).strip()
+    # findall hands back the captured strings directly; no match object is built per reference.
+    for target in REFERENCE_LINK_PATTERN.findall(body):
+        path = target.strip()
         if not path or "://" in path or path.startswith("#"):
             continue
-        refs.add(path.strip().strip("`").strip("\"'"))
-    for match in REFERENCE_INLINE_PATTERN.finditer(body):
-        refs.add(match.group(0))
-    return sorted(refs)
+        refs.add(path.strip("`").strip("\"'"))
+    refs.update(REFERENCE_INLINE_PATTERN.findall(body))
+    return tuple(sorted(refs))
 
 
-def _check_file_references(body: str, skill_path: Path, skill_md_path: Path, issues: List[LintIssue]) -> None:
+def _check_file_references(
+    body: str,
+    skill_path: Path,
+    skill_md_path: Path,
+    issues: list[LintIssue],
+    known_files: AbstractSet[str] = frozenset(),
+) -> None:
+    """Validate reference paths; ``known_files`` (skill-relative) spares a stat for files already walked."""
     for ref in _extract_references(body):
         if not ref:
             continue
@@ -189,7 +249,7 @@ def _check_file_references(body: str, skill_path: Path, skill_md_path: Path, iss
                     message=f"Reference is more than one level deep: {ref}",
                 )
             )
-        if not (skill_path / path).exists():
+        if str(path) not in known_files and not (skill_path / path).exists():
             issues.append(
                 LintIssue(
                     code="REFERENCE_MISSING",
@@ -204,7 +264,7 @@ def _dependency_issue_to_lint(issue: DependencyIssue) -> LintIssue:
     return LintIssue(code=issue.code, message=issue.message, path=issue.path)
 
 
-def _check_dependencies(skill_path: Path, policy: Policy, issues: List[LintIssue]) -> None:
+def _check_dependencies(skill_path: Path, policy: Policy, issues: list[LintIssue]) -> None:
     dependencies, dep_issues = collect_dependencies(skill_path)
     for issue in dep_issues:
         issues.append(_dependency_issue_to_lint(issue))
@@ -220,9 +280,9 @@ def _check_dependencies(skill_path: Path, policy: Policy, issues: List[LintIssue
 
 
 def _add_schema_issues(
-    issues: List[LintIssue],
+    issues: list[LintIssue],
     schema_issues: Sequence,
-    skill_md_path: Optional[Path],
+    skill_md_path: Path | None,
     skill_path: Path,
 ) -> None:
     fallback = skill_md_path or (skill_path / "SKILL.md")
@@ -238,26 +298,69 @@ def _add_schema_issues(
         )
 
 
-def run_lint(skill_path: Path, policy: Optional[Policy] = None) -> LintReport:
-    """Run lint rules for a Skill directory."""
+def _iter_selected_files(skill_path: Path, paths: Iterable[str]) -> Iterable[tuple[str, str, os.stat_result]]:
+    for relative in sorted(set(paths)):
+        relative_path = Path(relative)
+        if any(part in IGNORE_DIRS for part in relative_path.parts):
+            continue
+        candidate = os.path.join(skill_path, relative_path)
+        try:
+            file_stat = os.stat(candidate)
+        except OSError:
+            continue
+        if S_ISREG(file_stat.st_mode):
+            yield str(relative_path), candidate, file_stat
+
+
+def run_lint(
+    skill_path: Path,
+    policy: Policy | None = None,
+    *,
+    paths: Iterable[str] | None = None,
+) -> LintReport:
+    """Run lint rules for a Skill directory.
+
+    When ``paths`` (skill-relative) is given, content rules only scan those
+    files; schema, reference and dependency checks still cover the whole skill.
+    """
     policy_obj = policy or load_policy()
     parse_result = parse_skill_metadata(skill_path, policy_obj)
     metadata = parse_result.metadata
-    issues: List[LintIssue] = []
+    issues: list[LintIssue] = []
 
     _add_schema_issues(issues, parse_result.issues, parse_result.skill_md_path, skill_path)
 
-    files = list(_iter_files(skill_path))
-    for file_path in files:
-        try:
-            text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Binary files are skipped but counted.
+    rules = _text_rules(policy_obj)
+    prefilter = _raw_prefilter(rules)
+    files_scanned = 0
+    known_files: set[str] = set()
+    candidates = _iter_files(skill_path) if paths is None else _iter_selected_files(skill_path, paths)
+    for rel_path, file_path, file_stat in candidates:
+        files_scanned += 1
+        known_files.add(rel_path)
+        if policy_obj.scan_max_bytes > 0:
+            size = file_stat.st_size
+            if size > policy_obj.scan_max_bytes:
+                issues.append(
+                    LintIssue(
+                        code="SCAN_SKIPPED_LARGE",
+                        path=rel_path,
+                        severity="warning",
+                        message=(
+                            f"File not scanned: {size} bytes exceeds limits.scan_max_bytes "
+                            f"({policy_obj.scan_max_bytes})."
+                        ),
+                    )
+                )
+                continue
+        data = read_bytes_if_text(file_path, file_stat)
+        if data is None or not prefilter.may_match(data):
+            # Files with a non-UTF-8 head, and files no rule can match, are counted without decoding.
+            continue
+        text = decode_text(data)
+        if text is None:
             continue
-        rel_path = file_path.relative_to(skill_path)
-        _check_forbidden_patterns(policy_obj, rel_path, text, issues)
-        _check_secret_pattern(rel_path, text, issues)
-        _check_path_traversal(rel_path, text, issues)
+        _scan_text(rules, policy_obj, rel_path, text, issues)
 
     if parse_result.body:
         _check_monolithic_skill(
@@ -271,6 +374,7 @@ def run_lint(skill_path: Path, policy: Optional[Policy] = None) -> LintReport:
             skill_path,
             parse_result.skill_md_path or (skill_path / "SKILL.md"),
             issues,
+            known_files,
         )
 
     _check_dependencies(skill_path, policy_obj, issues)
@@ -280,5 +384,5 @@ def run_lint(skill_path: Path, policy: Optional[Policy] = None) -> LintReport:
         skill_name=skill_name,
         skill_version=metadata.version,
         issues=issues,
-        files_scanned=len(files),
+        files_scanned=files_scanned,
     )
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, Sequence, Union, cast
+import threading
+from collections.abc import Sequence
+from typing import Any, cast
 
 trace: Any
 Resource: Any
@@ -17,6 +19,8 @@ try:  # pragma: no cover - optional dependency
     from opentelemetry.sdk.trace import TracerProvider as _TracerProvider  # type: ignore[import]
     from opentelemetry.sdk.trace.export import (  # type: ignore[import]
         BatchSpanProcessor as _BatchSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.export import (
         ConsoleSpanExporter as _ConsoleSpanExporter,
     )
 
@@ -34,49 +38,64 @@ except Exception:
     ConsoleSpanExporter = cast(Any, None)
     _OTEL_AVAILABLE = False
 
-AttributeValue = Union[
-    str,
-    bool,
-    int,
-    float,
-    Sequence[str],
-    Sequence[bool],
-    Sequence[int],
-    Sequence[float],
-]
+AttributeValue = (
+    str
+    | bool
+    | int
+    | float
+    | Sequence[str]
+    | Sequence[bool]
+    | Sequence[int]
+    | Sequence[float]
+)
 
 _TRACER = None
+# Exporter settings whose provider could not be built (e.g. missing OTLP package); not retried.
+_FAILED_EXPORTERS: set[str] = set()
+_TRACER_LOCK = threading.Lock()
 
 
-def _ensure_tracer() -> Optional["trace.Tracer"]:
+def _ensure_tracer() -> trace.Tracer | None:
     global _TRACER
     if not _OTEL_AVAILABLE:
         return None
     exporter_pref = os.environ.get("SKILLCHECK_OTEL_EXPORTER", "").lower()
     if not exporter_pref:
         return None
-    if _TRACER is None:
-        provider = TracerProvider(resource=Resource.create({"service.name": "skillcheck"}))
-        processors = []
-        if exporter_pref == "console":
-            processors.append(ConsoleSpanExporter())
-        elif exporter_pref == "otlp":
-            try:  # pragma: no cover - optional dependency
-                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter  # type: ignore[import]
+    if _TRACER is not None:
+        return _TRACER
+    with _TRACER_LOCK:
+        # Re-check under the lock so concurrent first calls install a single provider.
+        if _TRACER is None and exporter_pref not in _FAILED_EXPORTERS:
+            _TRACER = _build_tracer(exporter_pref)
+            if _TRACER is None:
+                _FAILED_EXPORTERS.add(exporter_pref)
+    return _TRACER
+
 
-                processors.append(OTLPSpanExporter())
-            except Exception:
-                return None
-        else:
+def _build_tracer(exporter_pref: str) -> trace.Tracer | None:
+    provider = TracerProvider(resource=Resource.create({"service.name": "skillcheck"}))
+    processors = []
+    if exporter_pref == "console":
+        processors.append(ConsoleSpanExporter())
+    elif exporter_pref == "otlp":
+        try:  # pragma: no cover - optional dependency
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,  # type: ignore[import]
+            )
+
+            processors.append(OTLPSpanExporter())
+        except Exception:
             return None
-        for exporter in processors:
-            provider.add_span_processor(BatchSpanProcessor(exporter))
-        trace.set_tracer_provider(provider)
-        _TRACER = trace.get_tracer("skillcheck")
-    return _TRACER
+    else:
+        return None
+    for exporter in processors:
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return trace.get_tracer("skillcheck")
 
 
-def emit_run_span(name: str, skill_name: str, attributes: Dict[str, AttributeValue]) -> bool:
+def emit_run_span(name: str, skill_name: str, attributes: dict[str, AttributeValue]) -> bool:
     """Emit a span if OpenTelemetry is available."""
     tracer = _ensure_tracer()
     if tracer is None:
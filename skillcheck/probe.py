@@ -2,20 +2,40 @@
 
 from __future__ import annotations
 
+import errno
 import fnmatch
-import re
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from .schema import Policy, parse_skill_metadata
+from .utils import (
+    RawPrefilter,
+    available_cpus,
+    build_raw_prefilter,
+    compile_globs,
+    decode_text,
+    iter_files,
+    load_json,
+    pattern_needles,
+    read_bytes_if_text,
+)
+
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    _HAS_FCNTL = False
 
 PYTHON_EGRESS_PATTERNS = [
     ("requests_call", re.compile(r"requests\.(?:get|post|delete|put)\(\s*['\"](?P<url>https?://[^'\"]+)")),
@@ -52,37 +72,166 @@ SHELL_WRITE_PATTERNS = [
 ]
 
 SANDBOX_MODULE = "skillcheck._sandbox_runner"
+SANDBOX_SCRIPT = Path(__file__).with_name("_sandbox_runner.py")
+# Runs the stdlib-only runner by path: "-m" would first import the skillcheck package (typer, rich, yaml).
+# Like "-m", "-c" keeps the working directory (the staged skill root) as sys.path[0].
+# "-B": the staging copy is deleted after the run, so bytecode written into it is wasted I/O.
+_SANDBOX_BOOTSTRAP = "import runpy, sys; runpy.run_path(sys.argv.pop(1), run_name='__main__')"
+# Notes keep 200 characters of sandbox stderr; 4 bytes per UTF-8 character bounds what must be decoded.
+STDERR_SNIPPET_BYTES = 800
 DEFAULT_EXEC_GLOBS = ["scripts/**/*.py", "*.py"]
 IGNORE_DIRS = {".git", ".skillcheck", "__pycache__", "node_modules"}
+# VCS metadata and SKILLCHECK's own artifacts are not part of the skill; leave them out of sandbox copies.
+SANDBOX_SKIP_DIRS = (".git", ".skillcheck")
 JS_EXTENSIONS = {".js", ".ts", ".mjs", ".cjs"}
 SHELL_EXTENSIONS = {".sh", ".bash", ".zsh", ".ksh", ".cmd", ".bat"}
 POWERSHELL_EXTENSIONS = {".ps1", ".psm1"}
+# Below this many files per worker, process start-up outweighs scanning in parallel.
+PARALLEL_SCAN_MIN_FILES = 500
+WINDOWS_ABSOLUTE_PATTERN = re.compile(r"^[A-Za-z]:\\\\")
 
+# (code, pattern, needles, fold_case): the needles come from ``pattern_needles``.
+_PatternTable = tuple[tuple[str, re.Pattern[str], tuple[str, ...], bool], ...]
 
-@dataclass
+_EGRESS_PATTERN_GROUPS = (
+    ({".py"}, PYTHON_EGRESS_PATTERNS),
+    (JS_EXTENSIONS, JS_EGRESS_PATTERNS),
+    (SHELL_EXTENSIONS, SHELL_EGRESS_PATTERNS),
+    (POWERSHELL_EXTENSIONS, POWERSHELL_EGRESS_PATTERNS),
+)
+_WRITE_PATTERN_GROUPS = (
+    ({".py"}, PYTHON_WRITE_PATTERNS),
+    (JS_EXTENSIONS, JS_WRITE_PATTERNS),
+    (SHELL_EXTENSIONS, SHELL_WRITE_PATTERNS),
+)
+
+
+def _gated(code: str, pattern: re.Pattern[str]) -> tuple[str, re.Pattern[str], tuple[str, ...], bool]:
+    needles, fold_case = pattern_needles(pattern.pattern, pattern.flags)
+    return code, pattern, needles, fold_case
+
+
+def _candidate_patterns(patterns: _PatternTable, text: str) -> list[tuple[str, re.Pattern[str]]]:
+    """Patterns from ``patterns`` that may match ``text``, decided by substring checks alone.
+
+    Only the survivors are handed to the regex engine, and case-insensitive
+    needles share a single lowercased copy of the text.
+    """
+    candidates: list[tuple[str, re.Pattern[str]]] = []
+    folded: str | None = None
+    for code, pattern, needles, fold_case in patterns:
+        haystack = text
+        if needles and fold_case:
+            if not text.isascii():
+                needles = ()
+            else:
+                if folded is None:
+                    folded = text.lower()
+                haystack = folded
+        if not needles or any(needle in haystack for needle in needles):
+            candidates.append((code, pattern))
+    return candidates
+
+
+@lru_cache(maxsize=128)
+def _patterns_for(ext: str, in_scripts: bool) -> tuple[_PatternTable, _PatternTable]:
+    """Egress and write patterns that apply to a file with this suffix and location."""
+    egress = tuple(
+        _gated(code, pattern)
+        for exts, group in _EGRESS_PATTERN_GROUPS
+        if ext in exts or in_scripts
+        for code, pattern in group
+    )
+    writes = tuple(
+        _gated(code, pattern)
+        for exts, group in _WRITE_PATTERN_GROUPS
+        if ext in exts or in_scripts
+        for code, pattern in group
+    )
+    return egress, writes
+
+
+@lru_cache(maxsize=128)
+def _raw_prefilter_for(ext: str, in_scripts: bool) -> RawPrefilter:
+    """Byte-level gate over every pattern ``_patterns_for`` returns for this suffix and location."""
+    egress, writes = _patterns_for(ext, in_scripts)
+    return build_raw_prefilter((needles, fold_case) for _, _, needles, fold_case in egress + writes)
+
+
+# Linux FICLONE ioctl (exposed as fcntl.FICLONE from Python 3.12).
+_FICLONE = 0x40049409
+_CLONE_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EPERM}
+_clone_supported = _HAS_FCNTL and sys.platform.startswith("linux")
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """``copytree`` copy function that reflinks on copy-on-write filesystems and copies otherwise."""
+    global _clone_supported
+    if _clone_supported:
+        try:
+            with open(src, "rb") as source, open(dst, "wb") as target:
+                fcntl.ioctl(target.fileno(), getattr(fcntl, "FICLONE", _FICLONE), source.fileno())
+        except OSError as exc:
+            if exc.errno not in _CLONE_UNSUPPORTED_ERRNOS:
+                raise
+            # Filesystem cannot share extents (ext4, tmpfs, cross-device): stop trying for this process.
+            _clone_supported = False
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    return shutil.copy2(src, dst)
+
+
+def _glob_parts_match(
+    parts: tuple[str, ...], pattern: tuple[str, ...], prefix: bool = False, symlink: bool = False
+) -> bool:
+    """Match path components the way ``Path.glob`` does: ``**`` spans zero or more directories.
+
+    With ``prefix``, ``parts`` is a directory and the question is whether files below it can match.
+    With ``symlink`` as well, the directory is a symlink, which ``Path.glob`` only follows when a
+    component other than ``**`` matches it.
+    """
+    if not parts:
+        return bool(pattern) if prefix else not pattern
+    if not pattern:
+        return False
+    if pattern[0] == "**":
+        if prefix and not symlink:
+            return True
+        # "**" never consumes the last part: that is the file name, or the symlink it will not follow.
+        return any(_glob_parts_match(parts[index:], pattern[1:], prefix, symlink) for index in range(len(parts)))
+    return fnmatch.fnmatch(parts[0], pattern[0]) and _glob_parts_match(parts[1:], pattern[1:], prefix, symlink)
+
+
+@dataclass(slots=True)
 class ProbeFinding:
     code: str
     message: str
 
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> dict[str, str]:
         return {"code": self.code, "message": self.message}
 
 
+# (relative path, full path, lowercased suffix, stat) and the (egress, writes) findings for one file.
+_ScanEntry = tuple[str, str, str, os.stat_result]
+_ScanResult = tuple[list[ProbeFinding], list[ProbeFinding]]
+
+
 @dataclass
 class ProbeResult:
     skill_name: str
-    skill_version: Optional[str]
+    skill_version: str | None
     files_loaded_count: int
-    egress_attempts: List[ProbeFinding] = field(default_factory=list)
-    disallowed_writes: List[ProbeFinding] = field(default_factory=list)
-    notes: List[str] = field(default_factory=list)
+    egress_attempts: list[ProbeFinding] = field(default_factory=list)
+    disallowed_writes: list[ProbeFinding] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
     policy_hash: str = ""
 
     @property
     def ok(self) -> bool:
         return not self.egress_attempts and not self.disallowed_writes
 
-    def to_dict(self) -> Dict[str, object]:
+    def to_dict(self) -> dict[str, object]:
         return {
             "skill": {"name": self.skill_name, "version": self.skill_version},
             "summary": {
@@ -98,10 +247,15 @@ class ProbeResult:
 
 
 class ProbeRunner:
-    """Main entrypoint for dynamic probe heuristics."""
+    """Main entrypoint for dynamic probe heuristics.
 
-    def __init__(self, policy: Policy, enable_exec: Optional[bool] = None):
+    ``parallel=False`` scans files and runs sandbox scripts one at a time, for
+    callers that already spread several probes across worker processes.
+    """
+
+    def __init__(self, policy: Policy, enable_exec: bool | None = None, parallel: bool = True):
         self.policy = policy
+        self.parallel = parallel
         env_flag = os.environ.get("SKILLCHECK_PROBE_EXEC", "").lower() in {"1", "true", "yes"}
         probe_cfg = policy.raw.get("probe", {})
         if not isinstance(probe_cfg, dict):
@@ -112,26 +266,32 @@ class ProbeRunner:
         else:
             self.enable_exec = enable_exec
         self.exec_globs = list(probe_cfg.get("exec_globs") or DEFAULT_EXEC_GLOBS)
+        hosts = policy.allow_network_hosts
+        self._origin_pattern = compile_globs(pattern for pattern in hosts if "://" in pattern)
+        self._netloc_pattern = compile_globs(pattern for pattern in hosts if "://" not in pattern)
         self.exec_timeout = float(probe_cfg.get("timeout", 5))
 
     def run(self, skill_path: Path) -> ProbeResult:
         parse_result = parse_skill_metadata(skill_path, self.policy)
         metadata = parse_result.metadata
         files_loaded = 0
-        egress_findings: List[ProbeFinding] = []
-        write_findings: List[ProbeFinding] = []
-        notes: List[str] = []
+        egress_findings: list[ProbeFinding] = []
+        write_findings: list[ProbeFinding] = []
+        notes: list[str] = []
         if parse_result.issues:
             for issue in parse_result.issues:
                 notes.append(f"Schema issue {issue.code}: {issue.message}")
 
-        for rel_path, text in self._iter_text_files(skill_path):
+        entries = self._collect_scan_entries(skill_path)
+        for (rel_path, _, _, _), scanned in zip(entries, self._scan_entries(entries)):
+            if scanned is None:
+                continue
             if self.policy.is_read_allowed(rel_path):
                 files_loaded += 1
             else:
                 notes.append(f"Read outside policy allowlist ignored: {rel_path}")
-            egress_findings.extend(self._detect_egress(rel_path, text))
-            write_findings.extend(self._detect_writes(rel_path, text))
+            egress_findings.extend(scanned[0])
+            write_findings.extend(scanned[1])
 
         if self.enable_exec:
             exec_egress, exec_writes, exec_notes = self._run_exec_checks(skill_path)
@@ -149,35 +309,58 @@ class ProbeRunner:
             policy_hash=self.policy.sha256,
         )
 
-    def _iter_text_files(self, skill_path: Path) -> Iterable[tuple[str, str]]:
-        for file_path in sorted(skill_path.rglob("*")):
-            if any(part in IGNORE_DIRS for part in file_path.parts):
+    def _collect_scan_entries(self, skill_path: Path) -> list[_ScanEntry]:
+        """Scan entries for every file under ``skill_path``, in sorted path order."""
+        prefix_len = len(os.path.join(os.fspath(skill_path), ""))
+        entries: list[_ScanEntry] = []
+        for entry in iter_files(skill_path, IGNORE_DIRS):
+            # Same result as Path(rel).suffix for any suffix the pattern tables know.
+            ext = os.path.splitext(entry.name)[1].lower()
+            entries.append((entry.path[prefix_len:], entry.path, ext, entry.stat()))
+        return entries
+
+    def _scan_entries(self, entries: list[_ScanEntry]) -> list[_ScanResult | None]:
+        """Scan ``entries`` in order, fanning out to worker processes for large trees."""
+        workers = min(available_cpus(), len(entries) // PARALLEL_SCAN_MIN_FILES)
+        if workers < 2 or not self.parallel:
+            return self._scan_batch(entries)
+        # Workers read the files themselves, so only paths and findings cross process boundaries.
+        batch_size = -(-len(entries) // (workers * 4))
+        batches = [entries[start : start + batch_size] for start in range(0, len(entries), batch_size)]
+        results: list[_ScanResult | None] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for batch_result in executor.map(self._scan_batch, batches):
+                results.extend(batch_result)
+        return results
+
+    def _scan_batch(self, entries: list[_ScanEntry]) -> list[_ScanResult | None]:
+        """Egress and write findings per entry; ``None`` for files that are not UTF-8."""
+        results: list[_ScanResult | None] = []
+        for rel_path, full_path, ext, stat in entries:
+            data = read_bytes_if_text(full_path, stat)
+            if data is None:
+                results.append(None)
                 continue
-            if not file_path.is_file():
+            in_scripts = rel_path.startswith("scripts/")
+            if not _raw_prefilter_for(ext, in_scripts).may_match(data):
+                # Nothing can match, so the text is never needed; ASCII is UTF-8 without decoding it.
+                results.append(([], []) if data.isascii() or decode_text(data) is not None else None)
                 continue
-            try:
-                text = file_path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
+            text = decode_text(data)
+            if text is None:
+                results.append(None)
                 continue
-            rel = str(file_path.relative_to(skill_path))
-            yield rel, text
-
-    def _detect_egress(self, rel_path: str, text: str) -> List[ProbeFinding]:
-        findings: List[ProbeFinding] = []
-        ext = Path(rel_path).suffix.lower()
-        in_scripts = rel_path.startswith("scripts/")
-        patterns: List[Tuple[str, re.Pattern[str]]] = []
-        if ext == ".py" or in_scripts:
-            patterns.extend(PYTHON_EGRESS_PATTERNS)
-        if ext in JS_EXTENSIONS or in_scripts:
-            patterns.extend(JS_EGRESS_PATTERNS)
-        if ext in SHELL_EXTENSIONS or in_scripts:
-            patterns.extend(SHELL_EGRESS_PATTERNS)
-        if ext in POWERSHELL_EXTENSIONS or in_scripts:
-            patterns.extend(POWERSHELL_EGRESS_PATTERNS)
-        for code, pattern in patterns:
+            egress_patterns, write_patterns = _patterns_for(ext, in_scripts)
+            egress = self._detect_egress(rel_path, text, egress_patterns) if egress_patterns else []
+            writes = self._detect_writes(rel_path, text, write_patterns) if write_patterns else []
+            results.append((egress, writes))
+        return results
+
+    def _detect_egress(self, rel_path: str, text: str, patterns: _PatternTable) -> list[ProbeFinding]:
+        findings: list[ProbeFinding] = []
+        for code, pattern in _candidate_patterns(patterns, text):
             for match in pattern.finditer(text):
-                url = match.groupdict().get("url", "")
+                url = match["url"]
                 host_allowed = self._host_allowed(url)
                 if not host_allowed:
                     findings.append(
@@ -194,34 +377,16 @@ class ProbeRunner:
         parsed = urlparse(url)
         if not parsed.netloc:
             return False
-        host = f"{parsed.scheme}://{parsed.netloc}"
-        if not self.policy.allow_network_hosts:
-            return False
-        for pattern in self.policy.allow_network_hosts:
-            if not pattern:
-                continue
-            if "://" in pattern:
-                if fnmatch.fnmatch(host, pattern):
-                    return True
-            else:
-                if fnmatch.fnmatch(parsed.netloc, pattern):
-                    return True
-        return False
+        origin_pattern, netloc_pattern = self._origin_pattern, self._netloc_pattern
+        if origin_pattern is not None and origin_pattern.match(os.path.normcase(f"{parsed.scheme}://{parsed.netloc}")):
+            return True
+        return netloc_pattern is not None and netloc_pattern.match(os.path.normcase(parsed.netloc)) is not None
 
-    def _detect_writes(self, rel_path: str, text: str) -> List[ProbeFinding]:
-        findings: List[ProbeFinding] = []
-        ext = Path(rel_path).suffix.lower()
-        in_scripts = rel_path.startswith("scripts/")
-        patterns: List[Tuple[str, re.Pattern[str]]] = []
-        if ext == ".py" or in_scripts:
-            patterns.extend(PYTHON_WRITE_PATTERNS)
-        if ext in JS_EXTENSIONS or in_scripts:
-            patterns.extend(JS_WRITE_PATTERNS)
-        if ext in SHELL_EXTENSIONS or in_scripts:
-            patterns.extend(SHELL_WRITE_PATTERNS)
-        for code, pattern in patterns:
+    def _detect_writes(self, rel_path: str, text: str, patterns: _PatternTable) -> list[ProbeFinding]:
+        findings: list[ProbeFinding] = []
+        for code, pattern in _candidate_patterns(patterns, text):
             for match in pattern.finditer(text):
-                target = match.groupdict().get("path", "")
+                target = match["path"]
                 normalized = target.strip()
                 if not normalized:
                     continue
@@ -233,7 +398,7 @@ class ProbeRunner:
                         )
                     )
                     continue
-                if normalized.startswith(("/", "\\")) or re.match(r"^[A-Za-z]:\\\\", normalized):
+                if normalized.startswith(("/", "\\")) or WINDOWS_ABSOLUTE_PATTERN.match(normalized):
                     findings.append(
                         ProbeFinding(
                             code=f"WRITE_{code.upper()}",
@@ -250,17 +415,21 @@ class ProbeRunner:
                     )
         return findings
 
-    def _run_exec_checks(self, skill_path: Path) -> Tuple[List[ProbeFinding], List[ProbeFinding], List[str]]:
-        egress: List[ProbeFinding] = []
-        writes: List[ProbeFinding] = []
-        notes: List[str] = []
+    def _run_exec_checks(self, skill_path: Path) -> tuple[list[ProbeFinding], list[ProbeFinding], list[str]]:
+        egress: list[ProbeFinding] = []
+        writes: list[ProbeFinding] = []
+        notes: list[str] = []
         targets = self._collect_exec_targets(skill_path)
         if not targets:
             return egress, writes, notes
-        for script in targets:
+        # Each sandbox run blocks on its own interpreter subprocess, so runs overlap well in threads.
+        workers = min(len(targets), available_cpus()) if self.parallel else 1
+        skill_paths = [skill_path] * len(targets)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(self._invoke_sandbox, skill_paths, targets))
+        for script, outcome in zip(targets, outcomes):
             rel = script.relative_to(skill_path)
             notes.append(f"Sandbox exec: {rel}")
-            outcome = self._invoke_sandbox(skill_path, script)
             if outcome.get("timeout"):
                 notes.append(f"Sandbox timeout while executing {rel} (>{self.exec_timeout}s)")
                 continue
@@ -268,7 +437,7 @@ class ProbeRunner:
             if not isinstance(payload, dict):
                 notes.append(f"Sandbox returned invalid payload for {rel}")
                 continue
-            payload_dict: Dict[str, object] = payload
+            payload_dict: dict[str, object] = payload
             violations = payload_dict.get("violations")
             if isinstance(violations, list):
                 violation_items = violations
@@ -305,31 +474,40 @@ class ProbeRunner:
                     notes.append(f"{rel} stderr: {stderr_snippet[:200]}")
         return egress, writes, notes
 
-    def _collect_exec_targets(self, skill_path: Path) -> List[Path]:
-        targets: List[Path] = []
-        seen: set = set()
-        for pattern in self.exec_globs:
-            for candidate in skill_path.glob(pattern):
-                if not candidate.is_file():
-                    continue
-                if candidate.suffix.lower() != ".py":
-                    continue
-                key = candidate.resolve()
-                if key in seen:
-                    continue
-                seen.add(key)
-                targets.append(candidate)
-        return sorted(targets)
+    def _collect_exec_targets(self, skill_path: Path) -> list[Path]:
+        """Python files matching any exec glob, in sorted path order, from one pruned directory walk."""
+        patterns = [Path(pattern).parts for pattern in self.exec_globs if pattern]
+        prefix_len = len(os.path.join(os.fspath(skill_path), ""))
+
+        def descend(entry: os.DirEntry[str]) -> bool:
+            parts = tuple(entry.path[prefix_len:].split(os.sep))
+            symlink = entry.is_symlink()
+            return any(_glob_parts_match(parts, pattern, prefix=True, symlink=symlink) for pattern in patterns)
+
+        targets: list[Path] = []
+        for entry in iter_files(skill_path, descend=descend):
+            if os.path.splitext(entry.name)[1].lower() != ".py":
+                continue
+            parts = tuple(entry.path[prefix_len:].split(os.sep))
+            if any(_glob_parts_match(parts, pattern) for pattern in patterns):
+                targets.append(Path(entry.path))
+        return targets
 
-    def _invoke_sandbox(self, skill_path: Path, script_path: Path) -> Dict[str, object]:
+    def _invoke_sandbox(self, skill_path: Path, script_path: Path) -> dict[str, object]:
         with tempfile.TemporaryDirectory() as tmpdir:
             temp_root = Path(tmpdir) / "skill"
-            shutil.copytree(skill_path, temp_root)
+            shutil.copytree(
+                skill_path,
+                temp_root,
+                ignore=shutil.ignore_patterns(*SANDBOX_SKIP_DIRS),
+                copy_function=_clone_or_copy,
+            )
             rel_script = script_path.relative_to(skill_path)
-            cmd = [
-                sys.executable,
-                "-m",
-                SANDBOX_MODULE,
+            if SANDBOX_SCRIPT.is_file():
+                cmd = [sys.executable, "-B", "-c", _SANDBOX_BOOTSTRAP, str(SANDBOX_SCRIPT)]
+            else:  # pragma: no cover - e.g. installed from a zip archive
+                cmd = [sys.executable, "-B", "-m", SANDBOX_MODULE]
+            cmd += [
                 "--script",
                 str(rel_script),
                 "--skill-root",
@@ -344,22 +522,23 @@ class ProbeRunner:
                     cmd,
                     check=False,
                     capture_output=True,
-                    text=True,
                     timeout=self.exec_timeout,
                     cwd=temp_root,
                 )
             except subprocess.TimeoutExpired:
                 return {"timeout": True}
-            stdout = (result.stdout or "").strip()
+            # The runner reports on its final stdout line; only that line is decoded.
+            last_line = result.stdout.rstrip().rpartition(b"\n")[2].strip()
             payload = {}
-            if stdout:
+            if last_line:
                 try:
-                    payload = json.loads(stdout.splitlines()[-1])
+                    payload = load_json(last_line)
                 except json.JSONDecodeError:
                     payload = {}
+            stderr = result.stderr.strip()[:STDERR_SNIPPET_BYTES]
             return {
                 "payload": payload,
-                "stderr": (result.stderr or "").strip(),
+                "stderr": stderr.decode("utf-8", errors="replace").strip(),
                 "returncode": result.returncode,
                 "timeout": False,
             }
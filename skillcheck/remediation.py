@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
 
 
 @dataclass(frozen=True)
@@ -11,10 +10,10 @@ class RemediationGuide:
     code_pattern: str
     title: str
     why: str
-    fixes: List[str]
+    fixes: list[str]
 
 
-REMEDIATION_GUIDES: List[RemediationGuide] = [
+REMEDIATION_GUIDES: list[RemediationGuide] = [
     RemediationGuide(
         code_pattern="EGRESS_",
         title="Outbound network egress detected",
@@ -98,19 +97,24 @@ REMEDIATION_GUIDES: List[RemediationGuide] = [
 ]
 
 
-def get_remediation(code: str) -> Optional[RemediationGuide]:
+_EXACT_GUIDES: dict[str, RemediationGuide] = {
+    guide.code_pattern: guide for guide in REMEDIATION_GUIDES if not guide.code_pattern.endswith("_")
+}
+# Prefix guides keep their declaration order: the first matching prefix wins.
+_PREFIX_GUIDES: tuple[RemediationGuide, ...] = tuple(
+    guide for guide in REMEDIATION_GUIDES if guide.code_pattern.endswith("_")
+)
+
+
+def get_remediation(code: str) -> RemediationGuide | None:
     """Return the best remediation guide for a finding code."""
     normalized = code.strip().upper()
     if not normalized:
         return None
-    exact_map: Dict[str, RemediationGuide] = {
-        guide.code_pattern: guide
-        for guide in REMEDIATION_GUIDES
-        if not guide.code_pattern.endswith("_")
-    }
-    if normalized in exact_map:
-        return exact_map[normalized]
-    for guide in REMEDIATION_GUIDES:
-        if guide.code_pattern.endswith("_") and normalized.startswith(guide.code_pattern):
+    guide = _EXACT_GUIDES.get(normalized)
+    if guide is not None:
+        return guide
+    for guide in _PREFIX_GUIDES:
+        if normalized.startswith(guide.code_pattern):
             return guide
     return None
@@ -3,21 +3,57 @@
 from __future__ import annotations
 
 import csv
-import json
-import re
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any
+
+from .utils import StatSignature, dump_json, is_settled, load_json, stat_signature
 
 try:
-    import matplotlib.pyplot as plt  # type: ignore
+    # The object-oriented API with the Agg canvas: no pyplot state machine or GUI backend selection.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+    from matplotlib.figure import Figure  # type: ignore
 
     _HAS_MATPLOTLIB = True
 except Exception:  # pragma: no cover - optional dependency
     _HAS_MATPLOTLIB = False
 
+ARTIFACT_SUFFIXES = (".lint", ".probe", ".attestation")
+_REPORT_BUFFER_BYTES = 1024 * 1024
+_CSV_HEADER = (
+    "skill_name",
+    "skill_version",
+    "lint_violations",
+    "lint_issues",
+    "probe_egress",
+    "probe_disallowed_writes",
+    "policy_hash",
+    "signature_mode",
+    "waivers_count",
+    "trust_score",
+    "status",
+)
+_SARIF_LEVELS = {"error": "error", "warning": "warning"}
+# Builds each CSV record as a tuple in C; the attribute order matches _CSV_HEADER.
+_csv_row = attrgetter(
+    "skill_name",
+    "skill_version",
+    "lint_violations",
+    "lint_issues",
+    "probe_egress",
+    "probe_writes",
+    "policy_hash",
+    "signature_mode",
+    "waivers_count",
+    "trust_score",
+    "status",
+)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReportRow:
     skill_name: str
     skill_version: str
@@ -35,7 +71,7 @@ class ReportRow:
         return "pass" if self.lint_violations == 0 and self.probe_egress == 0 and self.probe_writes == 0 else "fail"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportSummary:
     total: int
     pass_count: int
@@ -44,19 +80,19 @@ class ReportSummary:
     min_trust_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportResult:
-    rows: List[ReportRow]
-    findings: List["ReportFinding"]
+    rows: list[ReportRow]
+    findings: list[ReportFinding]
     summary: ReportSummary
     csv_path: Path
     md_path: Path
-    chart_path: Optional[Path]
+    chart_path: Path | None
     json_path: Path
-    sarif_path: Optional[Path]
+    sarif_path: Path | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportFinding:
     skill_name: str
     code: str
@@ -73,54 +109,95 @@ class ReportWriter:
     def __init__(self, artifact_dir: Path):
         self.artifact_dir = artifact_dir
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self._json_cache: dict[Path, tuple[StatSignature, Any]] = {}
+        self._listing_cache: tuple[StatSignature, dict[str, list[Path]]] | None = None
+
+    def _partition_artifacts(self) -> dict[str, list[Path]]:
+        """Group artifact JSON files by kind suffix from a single directory scan.
 
-    def _load_json_files(self, suffix: str) -> Dict[str, dict]:
-        data: Dict[str, dict] = {}
-        for json_path in self.artifact_dir.glob(f"*{suffix}.json"):
-            content = json.loads(json_path.read_text(encoding="utf-8"))
+        The listing is reused while the directory's ``stat_signature`` is unchanged.
+        That only proves no entry was added, removed or renamed; file contents are
+        still revalidated per file by ``_load_artifact``.
+        """
+        dir_stat = os.stat(self.artifact_dir)
+        signature = stat_signature(dir_stat)
+        if self._listing_cache is not None and self._listing_cache[0] == signature:
+            return self._listing_cache[1]
+        groups: dict[str, list[Path]] = {suffix: [] for suffix in ARTIFACT_SUFFIXES}
+        with os.scandir(self.artifact_dir) as scanner:
+            names = sorted(entry.name for entry in scanner if entry.is_file() and entry.name.endswith(".json"))
+        for name in names:
+            # "<stem>.<kind>.json" dispatches on its kind with one lookup instead of testing every suffix.
+            _, dot, kind = name[: -len(".json")].rpartition(".")
+            paths = groups.get(f".{kind}") if dot else None
+            if paths is not None:
+                paths.append(self.artifact_dir / name)
+        if is_settled(dir_stat):
+            self._listing_cache = (signature, groups)
+        return groups
+
+    def _load_json_files(self, paths: list[Path]) -> dict[str, dict]:
+        data: dict[str, dict] = {}
+        for json_path in paths:
+            content = self._load_artifact(json_path)
             skill_name = content.get("skill", {}).get("name") or json_path.stem.split(".")[0]
             data[skill_name] = content
         return data
 
-    def _collect_rows(self, lint: Dict[str, dict], probe: Dict[str, dict], attest: Dict[str, dict]) -> List[ReportRow]:
-        rows: List[ReportRow] = []
+    def _load_artifact(self, json_path: Path) -> Any:
+        """Parse an artifact, reusing the previous ``write()``'s result while its stat is unchanged."""
+        stat = json_path.stat()
+        signature = stat_signature(stat)
+        cached = self._json_cache.get(json_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        content = load_json(json_path.read_bytes())
+        if is_settled(stat):
+            self._json_cache[json_path] = (signature, content)
+        return content
+
+    def _collect_rows(self, lint: dict[str, dict], probe: dict[str, dict], attest: dict[str, dict]) -> list[ReportRow]:
+        rows: list[ReportRow] = []
         for skill_name in sorted(set(lint.keys()) | set(probe.keys()) | set(attest.keys())):
             lint_entry = lint.get(skill_name, {})
             probe_entry = probe.get(skill_name, {})
             att_entry = attest.get(skill_name, {})
             summary = lint_entry.get("summary", {})
             probe_summary = probe_entry.get("summary", {})
+            lint_violations = int(summary.get("violations_count", 0))
+            probe_egress = int(probe_summary.get("egress_attempts", 0))
+            probe_writes = int(probe_summary.get("disallowed_writes", 0))
+            signature_mode = att_entry.get("signature", {}).get("mode", "")
+            waivers_count = len(att_entry.get("policy", {}).get("waivers", []) or [])
             rows.append(
                 ReportRow(
                     skill_name=skill_name,
                     skill_version=lint_entry.get("skill", {}).get("version") or "",
-                    lint_violations=int(summary.get("violations_count", 0)),
+                    lint_violations=lint_violations,
                     lint_issues=int(summary.get("issue_count", 0)),
-                    probe_egress=int(probe_summary.get("egress_attempts", 0)),
-                    probe_writes=int(probe_summary.get("disallowed_writes", 0)),
+                    probe_egress=probe_egress,
+                    probe_writes=probe_writes,
                     policy_hash=att_entry.get("policy", {}).get("sha256", ""),
-                    signature_mode=att_entry.get("signature", {}).get("mode", ""),
-                    waivers_count=len(att_entry.get("policy", {}).get("waivers", []) or []),
-                    trust_score=0.0,
+                    signature_mode=signature_mode,
+                    waivers_count=waivers_count,
+                    trust_score=self._calculate_trust_score(
+                        lint_violations, probe_egress, probe_writes, waivers_count, signature_mode
+                    ),
                 )
             )
-        for row in rows:
-            row.trust_score = self._calculate_trust_score(row)
         return rows
 
-    def _calculate_trust_score(self, row: ReportRow) -> float:
-        score = 100.0
-        score -= 15.0 * row.lint_violations
-        score -= 20.0 * row.probe_egress
-        score -= 20.0 * row.probe_writes
-        score -= 2.0 * row.waivers_count
-        if row.signature_mode == "sigstore":
+    def _calculate_trust_score(
+        self, lint_violations: int, probe_egress: int, probe_writes: int, waivers_count: int, signature_mode: str
+    ) -> float:
+        # One expression, evaluated in the same order as the step-by-step deductions it replaced.
+        score = 100.0 - 15.0 * lint_violations - 20.0 * probe_egress - 20.0 * probe_writes - 2.0 * waivers_count
+        if signature_mode == "sigstore":
             score += 3.0
-        score = max(0.0, min(100.0, score))
-        return round(score, 2)
+        return round(max(0.0, min(100.0, score)), 2)
 
-    def _collect_findings(self, lint: Dict[str, dict], probe: Dict[str, dict]) -> List[ReportFinding]:
-        findings: List[ReportFinding] = []
+    def _collect_findings(self, lint: dict[str, dict], probe: dict[str, dict]) -> list[ReportFinding]:
+        findings: list[ReportFinding] = []
         for skill_name, lint_entry in lint.items():
             for issue in lint_entry.get("issues", []) or []:
                 if not isinstance(issue, dict):
@@ -162,55 +239,28 @@ class ReportWriter:
         return findings
 
     def _extract_probe_path(self, message: str) -> tuple[str, str]:
-        match = re.match(r"^(?P<path>[^:\n]+):\s*(?P<detail>.+)$", message)
-        if not match:
+        path, sep, detail = message.partition(":")
+        # Same acceptance as r"^[^:\n]+:\s*.+$": the detail is one line after optional leading whitespace.
+        detail = detail.removesuffix("\n")
+        head, _, detail = detail.rpartition("\n")
+        if not sep or not path or "\n" in path or not detail or (head and not head.isspace()):
             return "SKILL.md", message
-        path = (match.group("path") or "").strip()
-        detail = (match.group("detail") or message).strip()
+        path = path.strip()
         if "/" in path or "." in path:
-            return path, detail
+            return path, detail.strip()
         return "SKILL.md", message
 
-    def _write_csv(self, rows: List[ReportRow]) -> Path:
+    def _write_csv(self, rows: list[ReportRow]) -> Path:
         csv_path = self.artifact_dir / "results.csv"
-        with csv_path.open("w", newline="", encoding="utf-8") as handle:
+        with csv_path.open("w", newline="", encoding="utf-8", buffering=_REPORT_BUFFER_BYTES) as handle:
             writer = csv.writer(handle)
-            writer.writerow(
-                [
-                    "skill_name",
-                    "skill_version",
-                    "lint_violations",
-                    "lint_issues",
-                    "probe_egress",
-                    "probe_disallowed_writes",
-                    "policy_hash",
-                    "signature_mode",
-                    "waivers_count",
-                    "trust_score",
-                    "status",
-                ]
-            )
-            for row in rows:
-                writer.writerow(
-                    [
-                        row.skill_name,
-                        row.skill_version,
-                        row.lint_violations,
-                        row.lint_issues,
-                        row.probe_egress,
-                        row.probe_writes,
-                        row.policy_hash,
-                        row.signature_mode,
-                        row.waivers_count,
-                        row.trust_score,
-                        row.status,
-                    ]
-                )
+            writer.writerow(_CSV_HEADER)
+            writer.writerows(map(_csv_row, rows))
         return csv_path
 
-    def _write_markdown(self, rows: List[ReportRow], chart_path: Optional[Path], summary: ReportSummary) -> Path:
+    def _write_markdown(self, rows: list[ReportRow], chart_path: Path | None, summary: ReportSummary) -> Path:
         md_path = self.artifact_dir / "results.md"
-        lines = [
+        header = [
             "# SKILLCHECK Report",
             "",
             f"Total skills audited: **{len(rows)}**",
@@ -219,19 +269,21 @@ class ReportWriter:
             "",
             "| Skill | Version | Lint Violations | Lint Issues | Egress Attempts | Disallowed Writes | Trust Score | Policy Hash | Signature | Status |",
             "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |",
+            "",
         ]
-        for row in rows:
-            lines.append(
+        # Rows stream through one large buffer instead of being joined into a single document first.
+        with md_path.open("w", encoding="utf-8", buffering=_REPORT_BUFFER_BYTES) as handle:
+            handle.write("\n".join(header))
+            handle.writelines(
                 f"| {row.skill_name} | {row.skill_version or '—'} | {row.lint_violations} | {row.lint_issues} | "
-                f"{row.probe_egress} | {row.probe_writes} | {row.trust_score:.2f} | {row.policy_hash or '—'} | {row.signature_mode or '—'} | {row.status.upper()} |"
+                f"{row.probe_egress} | {row.probe_writes} | {row.trust_score:.2f} | {row.policy_hash or '—'} | {row.signature_mode or '—'} | {row.status.upper()} |\n"
+                for row in rows
             )
-        if chart_path:
-            lines.append("")
-            lines.append(f"![Lint vs Probe]({chart_path.name})")
-        md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            if chart_path:
+                handle.write(f"\n![Lint vs Probe]({chart_path.name})\n")
         return md_path
 
-    def _write_json(self, rows: List[ReportRow], summary: ReportSummary) -> Path:
+    def _write_json(self, rows: list[ReportRow], summary: ReportSummary) -> Path:
         json_path = self.artifact_dir / "results.json"
         payload = {
             "summary": {
@@ -258,40 +310,35 @@ class ReportWriter:
                 for row in rows
             ],
         }
-        json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        json_path.write_bytes(dump_json(payload))
         return json_path
 
-    def _write_sarif(self, findings: List[ReportFinding]) -> Path:
+    def _write_sarif(self, findings: list[ReportFinding]) -> Path:
         sarif_path = self.artifact_dir / "results.sarif"
-        rules: Dict[str, Dict[str, object]] = {}
-        results: List[Dict[str, object]] = []
+        # The first finding seen for a code supplies that rule's help text.
+        help_by_code: dict[str, str] = {}
         for finding in findings:
-            if finding.code not in rules:
-                rules[finding.code] = {
-                    "id": finding.code,
-                    "shortDescription": {"text": finding.code},
-                    "help": {"text": finding.message},
-                }
-            level = "error"
-            if finding.severity.lower() == "warning":
-                level = "warning"
-            elif finding.severity.lower() not in {"error", "warning"}:
-                level = "note"
-            results.append(
-                {
-                    "ruleId": finding.code,
-                    "level": level,
-                    "message": {"text": f"[{finding.skill_name}] {finding.message}"},
-                    "locations": [
-                        {
-                            "physicalLocation": {
-                                "artifactLocation": {"uri": finding.path},
-                                "region": {"startLine": max(1, finding.line)},
-                            }
+            help_by_code.setdefault(finding.code, finding.message)
+        rules = [
+            {"id": code, "shortDescription": {"text": code}, "help": {"text": help_by_code[code]}}
+            for code in sorted(help_by_code)
+        ]
+        results = (
+            {
+                "ruleId": finding.code,
+                "level": _SARIF_LEVELS.get(finding.severity.lower(), "note"),
+                "message": {"text": f"[{finding.skill_name}] {finding.message}"},
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": finding.path},
+                            "region": {"startLine": max(1, finding.line)},
                         }
-                    ],
-                }
-            )
+                    }
+                ],
+            }
+            for finding in findings
+        )
         payload = {
             "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
             "version": "2.1.0",
@@ -301,20 +348,36 @@ class ReportWriter:
                         "driver": {
                             "name": "SKILLCHECK",
                             "informationUri": "https://github.com/jlov7/SKILLCHECK",
-                            "rules": [rules[key] for key in sorted(rules.keys())],
+                            "rules": rules,
                         }
                     },
-                    "results": results,
+                    "results": [],
                 }
             ],
         }
-        sarif_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Serialize the envelope once and stream each result into its empty "results" array, so
+        # memory stays flat however many findings there are. "results" is the envelope's last key;
+        # any earlier occurrence of the marker would sit inside a string with its quotes escaped.
+        head, _, tail = dump_json(payload).rpartition(b'"results": []')
+        with sarif_path.open("wb", buffering=_REPORT_BUFFER_BYTES) as handle:
+            handle.write(head + b'"results": [')
+            separator = b""
+            for result in results:
+                handle.write(separator)
+                handle.write(dump_json(result))
+                separator = b", "
+            handle.write(b"]" + tail)
         return sarif_path
 
-    def _summarize(self, rows: List[ReportRow]) -> ReportSummary:
-        pass_count = sum(1 for row in rows if row.status == "pass")
-        fail_count = sum(1 for row in rows if row.status != "pass")
-        trust_scores = [row.trust_score for row in rows]
+    def _summarize(self, rows: list[ReportRow]) -> ReportSummary:
+        pass_count = 0
+        trust_scores: list[float] = []
+        for row in rows:
+            if row.status == "pass":
+                pass_count += 1
+            trust_scores.append(row.trust_score)
+        # Every row is either a pass or a fail; sum()/min() stay in C and keep the float results unchanged.
+        fail_count = len(rows) - pass_count
         avg_trust_score = round(sum(trust_scores) / len(trust_scores), 2) if trust_scores else 0.0
         min_trust_score = round(min(trust_scores), 2) if trust_scores else 0.0
         return ReportSummary(
@@ -325,7 +388,7 @@ class ReportWriter:
             min_trust_score=min_trust_score,
         )
 
-    def _write_chart(self, rows: List[ReportRow]) -> Optional[Path]:
+    def _write_chart(self, rows: list[ReportRow]) -> Path | None:
         if not _HAS_MATPLOTLIB or not rows:
             return None
         chart_path = self.artifact_dir / "results_chart.png"
@@ -333,28 +396,33 @@ class ReportWriter:
         lint_vals = [row.lint_violations for row in rows]
         probe_vals = [row.probe_egress + row.probe_writes for row in rows]
         x = range(len(rows))
-        plt.figure(figsize=(max(6, len(rows) * 1.2), 4))
-        plt.bar(x, lint_vals, width=0.4, label="Lint violations")
-        plt.bar([pos + 0.4 for pos in x], probe_vals, width=0.4, label="Probe issues")
-        plt.xticks([pos + 0.2 for pos in x], labels, rotation=45, ha="right")
-        plt.tight_layout()
-        plt.legend()
-        plt.savefig(chart_path, dpi=150)
-        plt.close()
+        figure = Figure(figsize=(max(6, len(rows) * 1.2), 4))
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        axes.bar(x, lint_vals, width=0.4, label="Lint violations")
+        axes.bar([pos + 0.4 for pos in x], probe_vals, width=0.4, label="Probe issues")
+        axes.set_xticks([pos + 0.2 for pos in x], labels, rotation=45, ha="right")
+        figure.tight_layout()
+        axes.legend()
+        figure.savefig(chart_path, dpi=150)
         return chart_path
 
     def write(self, *, write_sarif: bool = False) -> ReportResult:
-        lint = self._load_json_files(".lint")
-        probe = self._load_json_files(".probe")
-        attest = self._load_json_files(".attestation")
+        artifacts = self._partition_artifacts()
+        lint = self._load_json_files(artifacts[".lint"])
+        probe = self._load_json_files(artifacts[".probe"])
+        attest = self._load_json_files(artifacts[".attestation"])
         rows = self._collect_rows(lint, probe, attest)
         findings = self._collect_findings(lint, probe)
         summary = self._summarize(rows)
-        csv_path = self._write_csv(rows)
-        chart_path = self._write_chart(rows)
+        # Rendering the chart is the slowest step; overlap it with the other writers (only Markdown needs its path).
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            chart_future = executor.submit(self._write_chart, rows)
+            csv_path = self._write_csv(rows)
+            json_path = self._write_json(rows, summary)
+            sarif_path = self._write_sarif(findings) if write_sarif else None
+            chart_path = chart_future.result()
         md_path = self._write_markdown(rows, chart_path, summary)
-        json_path = self._write_json(rows, summary)
-        sarif_path = self._write_sarif(findings) if write_sarif else None
         return ReportResult(
             rows=rows,
             findings=findings,
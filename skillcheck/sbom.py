@@ -2,40 +2,89 @@
 
 from __future__ import annotations
 
-import json
-import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any
 
 from .dependencies import collect_dependencies
+from .utils import (
+    available_cpus,
+    dump_json,
+    is_settled,
+    iter_relative_files,
+    load_json,
+    sha256_file,
+    stat_signature,
+)
 
 
-def _hash_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+class _HashCache:
+    """SHA-256 digests kept next to the SBOM and reused while a file's stat is unchanged.
+
+    Entries are keyed by absolute path and validated by ``stat_signature``. Only
+    files seen in the current run are written back.
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        try:
+            previous = load_json(cache_path.read_bytes())
+        except (OSError, ValueError):
+            previous = {}
+        self._previous: dict[str, Any] = previous if isinstance(previous, dict) else {}
+        self._current: dict[str, list[Any]] = {}
+
+    def digest(self, file_path: str) -> str:
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        signature = list(stat_signature(stat))
+        entry = self._previous.get(key)
+        if isinstance(entry, list) and entry[:-1] == signature and isinstance(entry[-1], str):
+            digest = entry[-1]
+        else:
+            digest = sha256_file(file_path)
+        if is_settled(stat):
+            self._current[key] = signature + [digest]
+        return digest
+
+    def save(self) -> None:
+        try:
+            self.cache_path.write_bytes(dump_json(self._current))
+        except OSError:
+            pass
 
 
 def generate_sbom(skill_path: Path, output_path: Path) -> Path:
     """Generate a minimal SPDX-style SBOM for the Skill directory."""
-    files: List[Dict[str, Any]] = []
-    for file_path in sorted(skill_path.rglob("*")):
-        if file_path.is_file():
-            relative = str(file_path.relative_to(skill_path))
-            files.append(
-                {
-                    "spdxid": f"SPDXRef-{relative.replace('/', '-')}",
-                    "fileName": relative,
-                    "checksums": [
-                        {"algorithm": "SHA256", "checksumValue": _hash_file(file_path)}
-                    ],
-                }
-            )
+    files: list[dict[str, Any]] = []
+    hash_cache = _HashCache(output_path.with_name(f".{output_path.name}.hashes"))
+    relative_paths: list[str] = []
+    file_paths: list[str] = []
+    for relative, entry in iter_relative_files(skill_path):
+        relative_paths.append(relative)
+        file_paths.append(entry.path)
+    # hashlib releases the GIL while hashing, so threads overlap both reads and digests.
+    workers = min(available_cpus(), len(file_paths))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = list(executor.map(hash_cache.digest, file_paths))
+    else:
+        digests = [hash_cache.digest(file_path) for file_path in file_paths]
+    for relative, digest in zip(relative_paths, digests):
+        files.append(
+            {
+                "spdxid": f"SPDXRef-{relative.replace('/', '-')}",
+                "fileName": relative,
+                "checksums": [
+                    {"algorithm": "SHA256", "checksumValue": digest}
+                ],
+            }
+        )
+    hash_cache.save()
     dependencies, _ = collect_dependencies(skill_path)
-    packages: List[Dict[str, Any]] = []
+    packages: list[dict[str, Any]] = []
     for dep in sorted({(dep.ecosystem, dep.name, dep.spec) for dep in dependencies}):
         ecosystem, name, spec = dep
         packages.append(
@@ -57,5 +106,5 @@ def generate_sbom(skill_path: Path, output_path: Path) -> Path:
         "files": files,
         "packages": packages,
     }
-    output_path.write_text(json.dumps(sbom, indent=2), encoding="utf-8")
+    output_path.write_bytes(dump_json(sbom))
     return output_path
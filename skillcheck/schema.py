@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
-import fnmatch
+import copy
 import hashlib
-import re
+import os
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+from .utils import compile_globs, compile_pattern
+
 SKILL_FRONTMATTER_FIELDS = {
     "name",
     "description",
@@ -28,7 +36,7 @@ class SkillValidationError(RuntimeError):
     """Raised when SKILL.md fails schema validation."""
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaIssue:
     """Single schema validation issue."""
 
@@ -38,25 +46,25 @@ class SchemaIssue:
     path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Parsed SKILL.md frontmatter (Agent Skills spec)."""
 
     name: str = ""
     description: str = ""
-    license: Optional[str] = None
-    compatibility: Optional[str] = None
-    allowed_tools: List[str] = field(default_factory=list)
-    allowed_tools_raw: Optional[str] = None
-    metadata: Dict[str, str] = field(default_factory=dict)
-    raw: Dict[str, Any] = field(default_factory=dict)
+    license: str | None = None
+    compatibility: str | None = None
+    allowed_tools: list[str] = field(default_factory=list)
+    allowed_tools_raw: str | None = None
+    metadata: dict[str, str] = field(default_factory=dict)
+    raw: dict[str, Any] = field(default_factory=dict)
 
     @property
-    def version(self) -> Optional[str]:
+    def version(self) -> str | None:
         return self.metadata.get("version")
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternRule:
     """Compiled forbidden pattern from policy."""
 
@@ -65,60 +73,106 @@ class PatternRule:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """Policy document parsed from YAML."""
 
-    raw: Dict[str, Any]
+    raw: dict[str, Any]
     path: str
     sha256: str
-    pack: Optional[str] = None
-    version: Optional[int] = None
+    pack: str | None = None
+    version: int | None = None
     skill_name_max: int = 64
     skill_description_max: int = 1024
     skill_compatibility_max: int = 500
     skill_body_max_lines: int = 500
-    allow_network_hosts: List[str] = field(default_factory=list)
-    read_globs: List[str] = field(default_factory=list)
-    write_globs: List[str] = field(default_factory=list)
-    forbidden_patterns: List[PatternRule] = field(default_factory=list)
-    waivers: List[Dict[str, str]] = field(default_factory=list)
-    dependency_allowlists: Dict[str, List[str]] = field(default_factory=dict)
+    scan_max_bytes: int = 0
+    allow_network_hosts: list[str] = field(default_factory=list)
+    read_globs: list[str] = field(default_factory=list)
+    write_globs: list[str] = field(default_factory=list)
+    forbidden_patterns: list[PatternRule] = field(default_factory=list)
+    waivers: list[dict[str, str]] = field(default_factory=list)
+    dependency_allowlists: dict[str, list[str]] = field(default_factory=dict)
     allow_unknown_fields: bool = False
-    legacy_fields: List[str] = field(default_factory=list)
-    allow_tools: List[str] = field(default_factory=list)
+    legacy_fields: list[str] = field(default_factory=list)
+    allow_tools: list[str] = field(default_factory=list)
+    _waiver_index: set[tuple[str, str]] = field(init=False, repr=False, compare=False, default_factory=set)
+
+    def __post_init__(self) -> None:
+        for waiver in self.waivers:
+            if not isinstance(waiver, dict):
+                continue
+            waiver_path = waiver.get("path")
+            waiver_rule = waiver.get("rule")
+            if isinstance(waiver_path, str) and isinstance(waiver_rule, str) and waiver_path and waiver_rule:
+                self._waiver_index.add((waiver_path, waiver_rule))
+
+    def is_waived(self, code: str, relative_path: str) -> bool:
+        return (relative_path, code) in self._waiver_index
 
     def is_read_allowed(self, relative_path: str) -> bool:
         if not self.read_globs:
             return True
-        return any(fnmatch.fnmatch(relative_path, glob) for glob in self.read_globs)
+        pattern = compile_globs(self.read_globs)
+        return pattern is not None and pattern.match(os.path.normcase(relative_path)) is not None
 
     def is_write_allowed(self, relative_path: str) -> bool:
-        if not self.write_globs:
-            return False
-        return any(fnmatch.fnmatch(relative_path, glob) for glob in self.write_globs)
+        pattern = compile_globs(self.write_globs)
+        return pattern is not None and pattern.match(os.path.normcase(relative_path)) is not None
+
+    def is_tool_allowed(self, token: str) -> bool:
+        """Match an ``allowed-tools`` token, or its name before any ``(...)`` arguments, against ``allow_tools``."""
+        base = token.split("(", 1)[0]
+        pattern = compile_globs(self.allow_tools)
+        if pattern is not None and (
+            pattern.match(os.path.normcase(token)) is not None or pattern.match(os.path.normcase(base)) is not None
+        ):
+            return True
+        # compile_globs drops empty globs; fnmatch lets one match an empty base name.
+        return "" in self.allow_tools and not base
 
     def is_dependency_allowed(self, ecosystem: str, name: str, spec: str) -> bool:
         allowlist = self.dependency_allowlists.get(f"allow_{ecosystem}", []) or []
         if not allowlist:
             return False
-        return any(
-            fnmatch.fnmatch(spec, pattern) or fnmatch.fnmatch(name, pattern)
-            for pattern in allowlist
-        )
+        pattern = compile_globs(allowlist)
+        if pattern is not None and (
+            pattern.match(os.path.normcase(spec)) is not None or pattern.match(os.path.normcase(name)) is not None
+        ):
+            return True
+        # compile_globs drops empty globs; fnmatch lets one match an empty spec or name.
+        return "" in allowlist and not (spec and name)
+
+
+def _policy_source(data: bytes) -> tuple[str, str]:
+    """Return policy text with ``read_text`` newline handling and the SHA-256 of that text.
+
+    Without carriage returns the text encodes back to ``data``, so the bytes are hashed as read.
+    """
+    text = data.decode("utf-8")
+    if "\r" not in text:
+        return text, hashlib.sha256(data).hexdigest()
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _parse_policy_text(raw_text: str) -> Any:
+    """Parse policy YAML once per distinct document; callers must copy before handing it out."""
+    return yaml.load(raw_text, Loader=_YamlLoader) or {}
 
 
 def load_policy(
-    policy_path: Optional[Path] = None,
+    policy_path: Path | None = None,
     *,
-    policy_pack: Optional[str] = None,
-    expected_version: Optional[int] = None,
+    policy_pack: str | None = None,
+    expected_version: int | None = None,
 ) -> Policy:
     """Load policy from YAML file (defaults to bundled policy)."""
     if policy_path is not None and policy_pack is not None:
         raise SkillValidationError("Choose either --policy or --policy-pack, not both")
     if policy_path is not None:
-        raw_text = policy_path.read_text(encoding="utf-8")
+        raw_text, checksum = _policy_source(policy_path.read_bytes())
         policy_location = str(policy_path.resolve())
         selected_pack = None
     elif policy_pack is not None:
@@ -129,32 +183,32 @@ def load_policy(
         from importlib import resources
 
         resource = resources.files("skillcheck.policies").joinpath(f"{selected_pack}.policy.yaml")
-        raw_text = resource.read_text(encoding="utf-8")
+        raw_text, checksum = _policy_source(resource.read_bytes())
         policy_location = f"package://skillcheck/policies/{selected_pack}.policy.yaml"
     else:
         selected_pack = "balanced"
         from importlib import resources
 
         resource = resources.files("skillcheck.policies").joinpath("default.policy.yaml")
-        raw_text = resource.read_text(encoding="utf-8")
+        raw_text, checksum = _policy_source(resource.read_bytes())
         policy_location = "package://skillcheck/policies/default.policy.yaml"
-    raw_policy = yaml.safe_load(raw_text) or {}
+    # Keyed on the text itself, so an edited policy file is reparsed whatever its mtime says.
+    raw_policy = copy.deepcopy(_parse_policy_text(raw_text))
     raw_version = raw_policy.get("version")
     if expected_version is not None and int(raw_version or 0) != int(expected_version):
         raise SkillValidationError(
             f"Policy version mismatch: expected {expected_version}, got {raw_version}"
         )
-    checksum = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
     limits = raw_policy.get("limits", {}) if isinstance(raw_policy.get("limits", {}), dict) else {}
     patterns = raw_policy.get("forbidden_patterns", []) or []
-    rules: List[PatternRule] = []
+    rules: list[PatternRule] = []
     for idx, entry in enumerate(patterns):
         pattern_str = entry.get("pattern")
         reason = entry.get("reason", "Policy violation")
         if not pattern_str:
             continue
         code = f"forbidden_pattern_{idx+1}"
-        compiled = re.compile(pattern_str)
+        compiled = compile_pattern(pattern_str)
         rules.append(PatternRule(code=code, pattern=compiled, reason=reason))
     dependency_allowlists = raw_policy.get("dependencies", {}) or {}
     waivers = raw_policy.get("waivers", []) or []
@@ -173,6 +227,7 @@ def load_policy(
         skill_description_max=int(limits.get("skill_description_max", 1024)),
         skill_compatibility_max=int(limits.get("skill_compatibility_max", 500)),
         skill_body_max_lines=int(limits.get("skill_body_max_lines", 500)),
+        scan_max_bytes=int(limits.get("scan_max_bytes", 0) or 0),
         allow_network_hosts=list(allow.get("network", {}).get("hosts", []) or []),
         read_globs=read_globs,
         write_globs=write_globs,
@@ -186,7 +241,7 @@ def load_policy(
     return policy
 
 
-def find_skill_md(skill_path: Path) -> Optional[Path]:
+def find_skill_md(skill_path: Path) -> Path | None:
     """Locate SKILL.md (or skill.md) in a skill directory."""
     for name in ("SKILL.md", "skill.md"):
         candidate = skill_path / name
@@ -195,16 +250,23 @@ def find_skill_md(skill_path: Path) -> Optional[Path]:
     return None
 
 
-def _extract_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+@lru_cache(maxsize=128)
+def _parse_frontmatter_text(frontmatter_str: str) -> Any:
+    """Parse front matter once per distinct text; lint, probe and attest each parse the same SKILL.md."""
+    return yaml.load(frontmatter_str, Loader=_YamlLoader) or {}
+
+
+def _extract_frontmatter(text: str) -> tuple[dict[str, Any], str]:
     if not text.startswith("---"):
         raise SkillValidationError("SKILL.md must begin with YAML front matter delimited by ---")
-    parts = text.split("---", 2)
-    if len(parts) < 3:
+    # Slice around the closing delimiter rather than split, which would copy the whole body first.
+    end = text.find("---", 3)
+    if end < 0:
         raise SkillValidationError("SKILL.md front matter is not properly closed with ---")
-    frontmatter_str = parts[1]
-    markdown_body = parts[2].strip()
+    frontmatter_str = text[3:end]
+    markdown_body = text[end + 3 :].strip()
     try:
-        parsed = yaml.safe_load(frontmatter_str) or {}
+        parsed = copy.deepcopy(_parse_frontmatter_text(frontmatter_str))
     except yaml.YAMLError as exc:  # pragma: no cover - defensive
         raise SkillValidationError(f"Invalid YAML front matter: {exc}") from exc
     if not isinstance(parsed, dict):
@@ -216,7 +278,7 @@ def _normalize_name(value: str) -> str:
     return unicodedata.normalize("NFKC", value.strip())
 
 
-def _normalize_metadata(raw_meta: Any) -> Tuple[Dict[str, str], Optional[str]]:
+def _normalize_metadata(raw_meta: Any) -> tuple[dict[str, str], str | None]:
     if raw_meta is None:
         return {}, None
     if not isinstance(raw_meta, dict):
@@ -225,7 +287,7 @@ def _normalize_metadata(raw_meta: Any) -> Tuple[Dict[str, str], Optional[str]]:
     return normalized, None
 
 
-def _extract_allowed_tools(raw_value: Any) -> Tuple[List[str], Optional[str], Optional[str]]:
+def _extract_allowed_tools(raw_value: Any) -> tuple[list[str], str | None, str | None]:
     if raw_value is None:
         return [], None, None
     if not isinstance(raw_value, str):
@@ -237,12 +299,12 @@ def _extract_allowed_tools(raw_value: Any) -> Tuple[List[str], Optional[str], Op
     return tokens, raw_value, None
 
 
-def validate_frontmatter(frontmatter: Dict[str, Any], skill_path: Path, policy: Policy) -> List[SchemaIssue]:
+def validate_frontmatter(frontmatter: dict[str, Any], skill_path: Path, policy: Policy) -> list[SchemaIssue]:
     """Validate frontmatter against the Agent Skills spec and policy."""
-    issues: List[SchemaIssue] = []
+    issues: list[SchemaIssue] = []
 
-    extra_fields = set(frontmatter.keys()) - SKILL_FRONTMATTER_FIELDS
-    legacy_fields = {field for field in extra_fields if field in set(policy.legacy_fields)}
+    extra_fields = frontmatter.keys() - SKILL_FRONTMATTER_FIELDS
+    legacy_fields = extra_fields.intersection(policy.legacy_fields)
     unknown_fields = extra_fields - legacy_fields
     if legacy_fields:
         issues.append(
@@ -302,7 +364,9 @@ def validate_frontmatter(frontmatter: Dict[str, Any], skill_path: Path, policy:
                     message="Skill name cannot contain consecutive hyphens",
                 )
             )
-        if not all(char.isalnum() or char == "-" for char in normalized):
+        # One C-level isalnum() over the name minus hyphens; a hyphen-only name leaves nothing to reject.
+        name_chars = normalized.replace("-", "")
+        if name_chars and not name_chars.isalnum():
             issues.append(
                 SchemaIssue(
                     code="FRONTMATTER_NAME",
@@ -386,11 +450,7 @@ def validate_frontmatter(frontmatter: Dict[str, Any], skill_path: Path, policy:
         tools = allowed_raw.split()
         if policy.allow_tools:
             for token in tools:
-                base = token.split("(", 1)[0]
-                if not any(
-                    fnmatch.fnmatch(token, pattern) or fnmatch.fnmatch(base, pattern)
-                    for pattern in policy.allow_tools
-                ):
+                if not policy.is_tool_allowed(token):
                     issues.append(
                         SchemaIssue(
                             code="FRONTMATTER_ALLOWED_TOOLS",
@@ -410,18 +470,24 @@ def validate_frontmatter(frontmatter: Dict[str, Any], skill_path: Path, policy:
     return issues
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillParseResult:
     metadata: SkillMetadata
     body: str
-    issues: List[SchemaIssue]
-    skill_md_path: Optional[Path] = None
+    issues: list[SchemaIssue]
+    skill_md_path: Path | None = None
+
+
+@lru_cache(maxsize=1)
+def _default_policy() -> Policy:
+    """Bundled policy for callers that only read it; ``load_policy()`` still returns a fresh copy."""
+    return load_policy()
 
 
-def parse_skill_metadata(skill_path: Path, policy: Optional[Policy] = None) -> SkillParseResult:
+def parse_skill_metadata(skill_path: Path, policy: Policy | None = None) -> SkillParseResult:
     """Parse SKILL.md frontmatter/body and collect schema issues."""
-    policy_obj = policy or load_policy()
-    issues: List[SchemaIssue] = []
+    policy_obj = policy or _default_policy()
+    issues: list[SchemaIssue] = []
     skill_md = find_skill_md(skill_path)
     if not skill_md:
         issues.append(
@@ -462,7 +528,7 @@ def parse_skill_metadata(skill_path: Path, policy: Optional[Policy] = None) -> S
     return SkillParseResult(metadata=metadata, body=body, issues=issues, skill_md_path=skill_md)
 
 
-def load_skill_metadata(skill_path: Path, policy: Optional[Policy] = None) -> Tuple[SkillMetadata, str]:
+def load_skill_metadata(skill_path: Path, policy: Policy | None = None) -> tuple[SkillMetadata, str]:
     """Load SKILL.md metadata and body, validating against policy limits."""
     result = parse_skill_metadata(skill_path, policy)
     errors = [issue for issue in result.issues if issue.severity == "error"]
@@ -472,7 +538,7 @@ def load_skill_metadata(skill_path: Path, policy: Optional[Policy] = None) -> Tu
     return result.metadata, result.body
 
 
-def policy_summary(policy: Policy) -> Dict[str, Any]:
+def policy_summary(policy: Policy) -> dict[str, Any]:
     """Return a stable summary for attestation payloads."""
     probe_cfg = policy.raw.get("probe", {})
     if not isinstance(probe_cfg, dict):
@@ -487,6 +553,7 @@ def policy_summary(policy: Policy) -> Dict[str, Any]:
             "skill_description_max": policy.skill_description_max,
             "skill_compatibility_max": policy.skill_compatibility_max,
             "skill_body_max_lines": policy.skill_body_max_lines,
+            "scan_max_bytes": policy.scan_max_bytes,
         },
         "frontmatter": {
             "allow_unknown_fields": policy.allow_unknown_fields,
@@ -6,7 +6,7 @@ import json
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any
 
 import streamlit as st
 
@@ -48,13 +48,13 @@ def _inject_styles() -> None:
     )
 
 
-def _run_cmd(args: List[str]) -> Tuple[int, str]:
+def _run_cmd(args: list[str]) -> tuple[int, str]:
     result = subprocess.run(args, check=False, capture_output=True, text=True)
     output = (result.stdout or "") + ("\n" + result.stderr if result.stderr else "")
     return result.returncode, output.strip()
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
+def _load_json(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
@@ -67,7 +67,7 @@ def _status_badge(value: str) -> str:
     return "✅ PASS" if value.lower() == "pass" else "❌ FAIL"
 
 
-def _render_hero(summary: Dict[str, Any]) -> None:
+def _render_hero(summary: dict[str, Any]) -> None:
     st.markdown(
         """
 <div class="hero">
@@ -85,7 +85,7 @@ def _render_hero(summary: Dict[str, Any]) -> None:
     c4.metric("Avg trust", summary.get("avg_trust_score", 0.0))
 
 
-def _artifact_paths(artifact_dir: str) -> Dict[str, Path]:
+def _artifact_paths(artifact_dir: str) -> dict[str, Path]:
     base = Path(artifact_dir)
     return {
         "results_json": base / "results.json",
@@ -112,7 +112,7 @@ def _build_cmds(
     policy_pack: str,
     policy_version: int,
     enable_exec: bool,
-) -> Dict[str, List[str]]:
+) -> dict[str, list[str]]:
     base_cmd = [sys.executable, "-m", "skillcheck.cli"]
 
     lint_cmd = base_cmd + [
@@ -148,7 +148,7 @@ def _build_cmds(
     return {"lint": lint_cmd, "probe": probe_cmd, "report": report_cmd}
 
 
-def _execute_action(label: str, cmd: List[str]) -> None:
+def _execute_action(label: str, cmd: list[str]) -> None:
     rc, out = _run_cmd(cmd)
     st.session_state["last_output"] = out or "(no output)"
     st.session_state["last_command"] = "$ " + " ".join(cmd)
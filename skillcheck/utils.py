@@ -2,9 +2,47 @@
 
 from __future__ import annotations
 
+import codecs
+import fnmatch
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_ORJSON = False
+
+StrPath = Union[str, "os.PathLike[str]"]
+StatSignature = tuple[int, int, int, int]
 
 _SLUG_PATTERN = re.compile(r"[^a-zA-Z0-9_.-]+")
+_INLINE_FLAGS_PATTERN = re.compile(r"\(\?[aiLmsu]+\)")
+_BINARY_SNIFF_BYTES = 4096
+_HASH_CHUNK_BYTES = 1024 * 1024
+# Files changed this recently are not cached: coarse timestamp clocks could hide a rewrite in the same tick.
+_RACY_WINDOW_NS = 2_000_000_000
+# Lint and probe read the same files back to back; keep recent contents keyed by path and stat signature.
+_FILE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_FILE_CACHE_MAX_ENTRY = 4 * 1024 * 1024
+_file_cache: OrderedDict[str, tuple[StatSignature, bytes]] = OrderedDict()
+_file_cache_size = 0
+_file_cache_lock = threading.Lock()
+# SBOM and attestation hash the same tree in one run; remember digests by path and full stat signature.
+_DIGEST_CACHE_MAX_ENTRIES = 65536
+_digest_cache: OrderedDict[str, tuple[StatSignature, str]] = OrderedDict()
+_digest_cache_lock = threading.Lock()
 
 
 def slugify(value: str) -> str:
@@ -12,3 +50,395 @@ def slugify(value: str) -> str:
     slug = _SLUG_PATTERN.sub("-", value.lower()).strip("-")
     return slug or "skill"
 
+
+def available_cpus() -> int:
+    """CPUs this process may run on; CI containers are often pinned to fewer than ``os.cpu_count()``."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def stat_signature(stat: os.stat_result) -> StatSignature:
+    """Return ``(mtime, ctime, size, inode)`` for validating a cached file.
+
+    ctime moves on every write and ``utime`` call, so a rewrite that restores
+    the old mtime and size (``cp -p``, ``rsync -t``) still changes the signature.
+    """
+    return (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+
+
+def is_settled(stat: os.stat_result) -> bool:
+    """Whether the file has not changed within the racy window and may be cached."""
+    return time.time_ns() - max(stat.st_mtime_ns, stat.st_ctime_ns) >= _RACY_WINDOW_NS
+
+
+@lru_cache(maxsize=4096)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """``re.compile`` for policy-supplied patterns, memoized beyond the ``re`` module's 512-entry cache.
+
+    Module-level constants should keep calling ``re.compile`` directly.
+    """
+    return re.compile(pattern, flags)
+
+
+def compile_globs(globs: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch globs into one pattern; ``None`` when there are no non-empty globs.
+
+    ``pattern.match(os.path.normcase(name))`` agrees with ``any(fnmatch.fnmatch(name, g) for g in globs)``.
+    """
+    return _compile_glob_tuple(tuple(filter(None, globs)))
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_tuple(globs: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(glob)) for glob in globs))
+
+
+def dump_json(payload: Any) -> bytes:
+    """Serialize an artifact payload as indented UTF-8 JSON (orjson when installed)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_json(data: bytes | str) -> Any:
+    """Parse JSON text or bytes (orjson when installed).
+
+    Both backends raise a ``json.JSONDecodeError`` subclass on malformed input.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_bytes_cached(path: StrPath, stat_result: os.stat_result | None = None) -> bytes:
+    """Return the file's bytes, reusing an earlier read while its ``stat_signature`` is unchanged.
+
+    Pass ``stat_result`` when the caller already has one (e.g. from ``DirEntry.stat``).
+    """
+    key = os.fspath(path)
+    stat = stat_result if stat_result is not None else os.stat(key)
+    data = _cache_lookup(key, stat)
+    if data is None:
+        with open(key, "rb") as handle:
+            data = handle.read()
+        _cache_store(key, stat, data)
+    return data
+
+
+def read_bytes_if_text(path: StrPath, stat_result: os.stat_result | None = None) -> bytes | None:
+    """Return the file's raw bytes, or ``None`` when its first 4 KiB are not valid UTF-8.
+
+    Binary files are rejected after reading only their first 4 KiB. NUL bytes
+    alone do not reject a file: like ``Path.read_text``, only invalid UTF-8 does,
+    so callers must still decode the rest.
+    """
+    key = os.fspath(path)
+    stat = stat_result if stat_result is not None else os.stat(key)
+    data = _cache_lookup(key, stat)
+    if data is None:
+        with open(key, "rb") as handle:
+            if stat.st_size <= _BINARY_SNIFF_BYTES:
+                data = handle.read()
+            else:
+                head = handle.read(_BINARY_SNIFF_BYTES)
+                if not _is_utf8_prefix(head):
+                    return None
+                data = head + handle.read()
+        _cache_store(key, stat, data)
+    return data
+
+
+def _is_utf8_prefix(head: bytes) -> bool:
+    """Whether ``head`` can start a UTF-8 file; a character cut off at the end is allowed."""
+    if head.isascii():
+        return True
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _cache_lookup(key: str, stat: os.stat_result) -> bytes | None:
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+        if cached is not None and cached[0] == stat_signature(stat):
+            _file_cache.move_to_end(key)
+            return cached[1]
+    return None
+
+
+def _cache_store(key: str, stat: os.stat_result, data: bytes) -> None:
+    global _file_cache_size
+    if len(data) != stat.st_size or len(data) > _FILE_CACHE_MAX_ENTRY:
+        return
+    if not is_settled(stat):
+        return
+    with _file_cache_lock:
+        previous = _file_cache.pop(key, None)
+        if previous is not None:
+            _file_cache_size -= len(previous[1])
+        _file_cache[key] = (stat_signature(stat), data)
+        _file_cache_size += len(data)
+        while _file_cache_size > _FILE_CACHE_MAX_BYTES:
+            _, evicted = _file_cache.popitem(last=False)
+            _file_cache_size -= len(evicted[1])
+
+
+def sha256_file(path: StrPath) -> str:
+    """Return the hex SHA-256 of a file, hashed in C via ``hashlib.file_digest`` where available.
+
+    A file hashed earlier in this process is not reread while its
+    ``stat_signature`` is unchanged.
+    """
+    key = os.fspath(path)
+    stat = os.stat(key)
+    signature = stat_signature(stat)
+    with _digest_cache_lock:
+        cached = _digest_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _digest_cache.move_to_end(key)
+            return cached[1]
+    digest = _sha256_file_uncached(key, stat.st_size)
+    if is_settled(stat):
+        with _digest_cache_lock:
+            _digest_cache[key] = (signature, digest)
+            _digest_cache.move_to_end(key)
+            if len(_digest_cache) > _DIGEST_CACHE_MAX_ENTRIES:
+                _digest_cache.popitem(last=False)
+    return digest
+
+
+def _sha256_file_uncached(path: str, size: int) -> str:
+    with open(path, "rb") as handle:
+        if size > _HASH_CHUNK_BYTES and hasattr(os, "posix_fadvise"):
+            # Let the kernel grow readahead straight away. DONTNEED is deliberately not used afterwards:
+            # lint, probe and the next run read the same files again.
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        # Python 3.10: reuse one large buffer instead of allocating a bytes object per chunk.
+        digest = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_BYTES)
+        view = memoryview(buffer)
+        while True:
+            size = handle.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+        return digest.hexdigest()
+
+
+def decode_text(data: bytes) -> str | None:
+    """Decode UTF-8 bytes with ``Path.read_text`` newline handling; ``None`` if not UTF-8."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_text_if_utf8(path: StrPath, stat_result: os.stat_result | None = None) -> str | None:
+    """Return the file's text, or ``None`` for binary or other non-UTF-8 content.
+
+    Newlines are normalised to ``\\n`` exactly as ``Path.read_text`` does.
+    """
+    data = read_bytes_if_text(path, stat_result)
+    if data is None:
+        return None
+    return decode_text(data)
+
+
+def iter_files(
+    root: StrPath,
+    ignore_dirs: AbstractSet[str] = frozenset(),
+    descend: Callable[[os.DirEntry[str]], bool] | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under ``root`` in sorted path order.
+
+    Directories named in ``ignore_dirs`` are pruned instead of walked, and
+    symlinked directories are not descended into (matching ``Path.rglob``).
+    When given, ``descend`` decides for every other directory, symlinked ones
+    included, whether to walk it.
+    """
+    # One generator with an explicit stack: each entry is yielded once rather
+    # than relayed through a ``yield from`` per directory level.
+    stack = [_sorted_entries(root)]
+    while stack:
+        for entry in stack[-1]:
+            if entry.is_dir(follow_symlinks=False) or (descend is not None and entry.is_dir()):
+                if entry.name not in ignore_dirs and (descend is None or descend(entry)):
+                    stack.append(_sorted_entries(entry.path))
+                    break
+            elif entry.is_file():
+                yield entry
+        else:
+            stack.pop()
+
+
+def iter_relative_files(root: StrPath, ignore_dirs: AbstractSet[str] = frozenset()) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield ``(relative_path, entry)`` for ``iter_files``; the order matches ``sorted(Path(root).rglob("*"))``."""
+    prefix_length = len(os.path.join(os.fspath(root), ""))
+    for entry in iter_files(root, ignore_dirs):
+        yield entry.path[prefix_length:], entry
+
+
+def _sorted_entries(directory: StrPath) -> Iterator[os.DirEntry[str]]:
+    """Return an iterator over ``directory``'s entries by name; empty when unreadable."""
+    try:
+        with os.scandir(directory) as scanner:
+            return iter(sorted(scanner, key=lambda entry: entry.name))
+    except OSError:
+        return iter(())
+
+
+def _split_alternatives(source: str) -> list[str] | None:
+    """Split a regex source on top-level ``|``; ``None`` if brackets are unbalanced."""
+    branches: list[str] = []
+    depth = 0
+    in_class = False
+    start = 0
+    index = 0
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A "]" straight after "[" or "[^" is a literal member, not the closing bracket.
+            if source[index + 1 : index + 2] == "^":
+                index += 1
+            if source[index + 1 : index + 2] == "]":
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(source[start:index])
+            start = index + 1
+        index += 1
+    if depth or in_class:
+        return None
+    branches.append(source[start:])
+    return branches
+
+
+def _leading_literal(branch: str) -> str:
+    """Return the literal text every match of ``branch`` must start with."""
+    literal: list[str] = []
+    index = 0
+    while index < len(branch):
+        char = branch[index]
+        if char in "*+?{":
+            # The quantifier applies to the previous character, which is therefore optional.
+            if literal:
+                literal.pop()
+            break
+        if char == "\\":
+            escaped = branch[index + 1 : index + 2]
+            if escaped == "b":
+                index += 2
+                continue
+            if not escaped or escaped.isalnum():
+                break
+            char = escaped
+            index += 1
+        elif char in ".^$[]()|":
+            break
+        literal.append(char)
+        index += 1
+    return "".join(literal)
+
+
+@lru_cache(maxsize=256)
+def pattern_needles(source: str, flags: int) -> tuple[tuple[str, ...], bool]:
+    """Return literals of which at least one occurs in any text ``source`` matches.
+
+    The second item is true for case-insensitive patterns; the needles are then
+    lowercase and only exact against lowercased ASCII text. An empty tuple means
+    no prefilter could be proven and the regex must always run.
+    """
+    if flags & re.VERBOSE:
+        return (), False
+    prefix = _INLINE_FLAGS_PATTERN.match(source)
+    if prefix:
+        source = source[prefix.end() :]
+    branches = _split_alternatives(source)
+    if not branches:
+        return (), False
+    needles = []
+    for branch in branches:
+        literal = _leading_literal(branch)
+        if not literal:
+            return (), False
+        needles.append(literal)
+    fold_case = bool(flags & re.IGNORECASE)
+    if fold_case:
+        if not all(needle.isascii() for needle in needles):
+            return (), False
+        needles = [needle.lower() for needle in needles]
+    return tuple(dict.fromkeys(needles)), fold_case
+
+
+@lru_cache(maxsize=256)
+def _raw_needles(needles: tuple[str, ...]) -> tuple[bytes, ...] | None:
+    # Newline normalisation happens after decoding, so needles containing CR/LF cannot be tested on raw bytes.
+    if any("\r" in needle or "\n" in needle for needle in needles):
+        return None
+    return tuple(needle.encode("utf-8") for needle in needles)
+
+
+def _minimal_needles(needles: Iterable[bytes]) -> tuple[bytes, ...]:
+    """Drop duplicates and needles that contain a shorter kept needle (redundant for an "any" test)."""
+    kept: list[bytes] = []
+    for needle in sorted(set(needles), key=len):
+        if not any(shorter in needle for shorter in kept):
+            kept.append(needle)
+    return tuple(kept)
+
+
+@dataclass(frozen=True, slots=True)
+class RawPrefilter:
+    """Union of several patterns' needles, checked against undecoded file bytes."""
+
+    always: bool
+    exact: tuple[bytes, ...] = ()
+    folded: tuple[bytes, ...] = ()
+
+    def may_match(self, data: bytes) -> bool:
+        """Return ``False`` only when no pattern can match the decoded text of ``data``.
+
+        UTF-8 never encodes one character inside another, so a needle occurs in the
+        decoded text exactly when its encoding occurs in the bytes.
+        """
+        if self.always:
+            return True
+        if any(needle in data for needle in self.exact):
+            return True
+        if self.folded:
+            if not data.isascii():
+                return True
+            lowered = data.lower()
+            return any(needle in lowered for needle in self.folded)
+        return False
+
+
+def build_raw_prefilter(needle_sets: Iterable[tuple[tuple[str, ...], bool]]) -> RawPrefilter:
+    """Merge ``(needles, fold_case)`` pairs from ``pattern_needles`` into one ``RawPrefilter``."""
+    exact: list[bytes] = []
+    folded: list[bytes] = []
+    for needles, fold_case in needle_sets:
+        raw_needles = _raw_needles(needles) if needles else None
+        if raw_needles is None:
+            return RawPrefilter(always=True)
+        (folded if fold_case else exact).extend(raw_needles)
+    return RawPrefilter(always=False, exact=_minimal_needles(exact), folded=_minimal_needles(folded))
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import zipfile
 
 import pytest
 
+from skillcheck import utils
+
 
 @pytest.fixture
 def make_skill_zip(tmp_path: Path):
@@ -23,3 +26,21 @@ def make_skill_zip(tmp_path: Path):
         return archive
 
     return _make
+
+
+@pytest.fixture
+def settled_files(monkeypatch) -> None:
+    """Let stat-keyed caches accept files written moments ago."""
+    monkeypatch.setattr(utils, "_RACY_WINDOW_NS", 0)
+
+
+@pytest.fixture
+def rewrite_keeping_mtime():
+    """Rewrite a file and restore its mtime, as ``cp -p`` or ``rsync -t`` would."""
+
+    def _rewrite(path: Path, data: bytes) -> None:
+        stat = path.stat()
+        path.write_bytes(data)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    return _rewrite
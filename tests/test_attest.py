@@ -55,3 +55,43 @@ def test_attestation_from_zip(tmp_path: Path, make_skill_zip) -> None:
         )
     payload = json.loads(attestation_path.read_text(encoding="utf-8"))
     assert payload["skill"]["path"] == str(archive)
+
+
+def test_sbom_reuses_cached_hashes_until_a_file_changes(
+    tmp_path: Path, monkeypatch, settled_files, rewrite_keeping_mtime
+) -> None:
+    from skillcheck import sbom
+
+    skill_dir = tmp_path / "skill"
+    skill_dir.mkdir()
+    target = skill_dir / "notes.txt"
+    target.write_text("first", encoding="utf-8")
+    output = tmp_path / "out" / "skill.sbom.json"
+    output.parent.mkdir()
+    generate_sbom(skill_dir, output)
+    assert (output.parent / ".skill.sbom.json.hashes").exists()
+
+    hashed = []
+    real_hash = sbom.sha256_file
+    monkeypatch.setattr(sbom, "sha256_file", lambda path: hashed.append(path) or real_hash(path))
+    first = json.loads(generate_sbom(skill_dir, output).read_text(encoding="utf-8"))
+    assert hashed == []
+
+    rewrite_keeping_mtime(target, b"other")
+    second = json.loads(generate_sbom(skill_dir, output).read_text(encoding="utf-8"))
+    assert hashed == [str(target)]
+    assert first["files"][0]["checksums"] != second["files"][0]["checksums"]
+
+
+def test_sbom_threaded_hashing_keeps_sorted_output(tmp_path: Path, monkeypatch) -> None:
+    from skillcheck import sbom
+
+    skill_dir = tmp_path / "skill"
+    (skill_dir / "sub").mkdir(parents=True)
+    for name in ("b.txt", "a.txt", "sub/c.txt"):
+        (skill_dir / name).write_text(name * 1000, encoding="utf-8")
+    serial = json.loads(generate_sbom(skill_dir, tmp_path / "serial.sbom.json").read_text(encoding="utf-8"))
+    monkeypatch.setattr(sbom, "available_cpus", lambda: 4)
+    threaded = json.loads(generate_sbom(skill_dir, tmp_path / "threaded.sbom.json").read_text(encoding="utf-8"))
+    assert [entry["fileName"] for entry in threaded["files"]] == ["a.txt", "b.txt", "sub/c.txt"]
+    assert threaded["files"] == serial["files"]
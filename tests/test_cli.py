@@ -1,4 +1,5 @@
 import json
+import os
 import subprocess
 from pathlib import Path
 
@@ -203,6 +204,89 @@ def test_cli_diff_audits_only_changed_skills(tmp_path: Path) -> None:
     assert payload["summary"]["total"] == 1
 
 
+def test_cli_diff_audits_multiple_changed_skills(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.cli as cli_module
+
+    pool_sizes = []
+
+    class RecordingPool(cli_module.ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            pool_sizes.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(cli_module, "available_cpus", lambda: 2)
+    monkeypatch.setattr(cli_module, "ProcessPoolExecutor", RecordingPool)
+    repo = _init_git_repo_with_two_skills(tmp_path)
+    (repo / "skill-b" / "notes.md").write_text("changed", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True, text=True)
+    subprocess.run(["git", "commit", "-m", "change skill b"], cwd=repo, check=True, capture_output=True, text=True)
+    out_dir = repo / ".skillcheck-diff"
+    result = runner.invoke(
+        app,
+        ["diff", str(repo), "--base", "HEAD~2", "--head", "HEAD", "--output-dir", str(out_dir)],
+    )
+    assert result.exit_code == 0
+    assert pool_sizes == [2]
+    assert result.stdout.index("Audited skill-a") < result.stdout.index("Audited skill-b")
+    assert (out_dir / "skill-a.lint.json").exists()
+    assert (out_dir / "skill-b.probe.json").exists()
+    payload = json.loads((out_dir / "results.json").read_text(encoding="utf-8"))
+    assert payload["summary"]["total"] == 2
+
+
+def test_cli_diff_changed_only_limits_content_scan(tmp_path: Path) -> None:
+    repo = _init_git_repo_with_two_skills(tmp_path)
+    (repo / "skill-a" / "config.txt").write_text("API_KEY = super-secret-token", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True, text=True)
+    subprocess.run(["git", "commit", "-m", "add config"], cwd=repo, check=True, capture_output=True, text=True)
+    (repo / "skill-a" / "notes.md").write_text("changed again", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True, text=True)
+    subprocess.run(["git", "commit", "-m", "touch notes"], cwd=repo, check=True, capture_output=True, text=True)
+
+    codes = {}
+    for flag in ("--changed-only", "--full-skill"):
+        out_dir = repo / f".skillcheck-diff{flag}"
+        result = runner.invoke(
+            app,
+            ["diff", str(repo), "--base", "HEAD~1", "--head", "HEAD", "--output-dir", str(out_dir), flag],
+        )
+        assert result.exit_code == 0
+        payload = json.loads((out_dir / "skill-a.lint.json").read_text(encoding="utf-8"))
+        codes[flag] = {issue["code"] for issue in payload["issues"]}
+        if flag == "--changed-only":
+            assert payload["summary"]["files_scanned"] == 1
+    assert "SECRET_SUSPECT" not in codes["--changed-only"]
+    assert "SECRET_SUSPECT" in codes["--full-skill"]
+
+
+def test_cli_diff_handles_non_ascii_paths(tmp_path: Path) -> None:
+    repo = _init_git_repo_with_two_skills(tmp_path)
+    (repo / "skill-b" / "café notes.md").write_text("changed", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True, text=True)
+    subprocess.run(["git", "commit", "-m", "change skill b"], cwd=repo, check=True, capture_output=True, text=True)
+    out_dir = repo / ".skillcheck-diff"
+    result = runner.invoke(
+        app,
+        ["diff", str(repo), "--base", "HEAD~1", "--head", "HEAD", "--output-dir", str(out_dir)],
+    )
+    assert result.exit_code == 0
+    assert (out_dir / "skill-b.lint.json").exists()
+
+
+def test_cli_diff_handles_non_utf8_file_names(tmp_path: Path) -> None:
+    repo = _init_git_repo_with_two_skills(tmp_path)
+    (repo / "skill-b" / os.fsdecode(b"caf\xe9.md")).write_text("changed", encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "commit", "-m", "latin-1 name"], cwd=repo, check=True, capture_output=True)
+    out_dir = repo / ".skillcheck-diff"
+    result = runner.invoke(
+        app,
+        ["diff", str(repo), "--base", "HEAD~1", "--head", "HEAD", "--output-dir", str(out_dir)],
+    )
+    assert result.exit_code == 0
+    assert (out_dir / "skill-b.lint.json").exists()
+
+
 def test_cli_diff_no_changed_skills(tmp_path: Path) -> None:
     repo = _init_git_repo_with_two_skills(tmp_path)
     result = runner.invoke(
@@ -270,6 +354,15 @@ def test_cli_fix_no_changed_skills_still_writes_artifact(tmp_path: Path) -> None
     assert payload["summary"]["skills_considered"] == 0
 
 
+def test_cli_diff_requires_git_executable(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.cli as cli_module
+
+    monkeypatch.setattr(cli_module, "_git_executable", lambda: None)
+    result = runner.invoke(app, ["diff", str(tmp_path)])
+    assert result.exit_code == 2
+    assert "Git executable is required" in result.output
+
+
 def test_cli_studio_requires_ui_dependency(monkeypatch) -> None:
     import skillcheck.cli as cli_module
 
@@ -468,3 +561,42 @@ def test_cli_report_release_gate_strict(tmp_path: Path) -> None:
         ],
     )
     assert result.exit_code == 1
+
+
+def test_find_skill_root_cache_reuses_directory_lookups(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.cli as cli_module
+
+    (tmp_path / "skill" / "a" / "b").mkdir(parents=True)
+    (tmp_path / "other").mkdir()
+    (tmp_path / "skill" / "SKILL.md").write_text("---\nname: skill\n---\n", encoding="utf-8")
+    calls = []
+    real_find = cli_module.find_skill_md
+
+    def counting_find(path: Path):
+        calls.append(path)
+        return real_find(path)
+
+    monkeypatch.setattr(cli_module, "find_skill_md", counting_find)
+    cache: dict = {}
+    assert cli_module._find_skill_root(tmp_path, "skill/a/b/x.py", cache) == tmp_path / "skill"
+    assert cli_module._find_skill_root(tmp_path, "skill/a/y.py", cache) == tmp_path / "skill"
+    assert cli_module._find_skill_root(tmp_path, "other/z.txt", cache) is None
+    assert cli_module._find_skill_root(tmp_path, "other/w.txt", cache) is None
+    assert len(calls) == 5
+
+
+def test_cli_fix_pr_without_gh_fails_before_committing(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.cli as cli_module
+
+    real_which = cli_module.shutil.which
+    monkeypatch.setattr(cli_module.shutil, "which", lambda name: None if name == "gh" else real_which(name))
+    repo = _init_git_repo_with_broken_skill(tmp_path)
+    head_before = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True).stdout
+    result = runner.invoke(
+        app,
+        ["fix", str(repo), "--apply", "--commit", "--push", "--pr", "--output-dir", str(tmp_path / "out")],
+    )
+    assert result.exit_code == 2
+    assert "`gh` is required" in result.output
+    head_after = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True).stdout
+    assert head_after == head_before
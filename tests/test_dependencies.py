@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from skillcheck.dependencies import collect_dependencies
+
+
+def test_collect_requirements_follows_includes_and_flags_unsafe_lines(tmp_path: Path) -> None:
+    (tmp_path / "requirements.txt").write_text(
+        "# pinned\n-r requirements-base.in\n--index-url https://example.com\nrequests==2.31\n./vendor/pkg\ngit+https://example.com/repo.git\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "requirements-base.in").write_text("pyyaml>=6\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "package.json").write_text("{}", encoding="utf-8")
+
+    dependencies, issues = collect_dependencies(tmp_path)
+
+    assert [dep.name for dep in dependencies] == ["pyyaml", "requests"]
+    assert [issue.code for issue in issues] == ["DEPENDENCY_PYPI_PATH", "DEPENDENCY_PYPI_VCS"]
+
+
+def test_collect_requirements_reports_invalid_utf8_once(tmp_path: Path) -> None:
+    (tmp_path / "requirements.txt").write_bytes(b"./local\nrequests\ncaf\xe9\n")
+
+    dependencies, issues = collect_dependencies(tmp_path)
+
+    assert dependencies == []
+    assert [issue.code for issue in issues] == ["DEPENDENCY_PYPI_ENCODING"]
+
+
+def test_collect_requirements_skips_includes_of_undecodable_file(tmp_path: Path) -> None:
+    padding = b"".join(b"# filler line %05d\n" % index for index in range(1500))
+    (tmp_path / "requirements.txt").write_bytes(b"-r requirements2.txt\n" + padding + b"caf\xff\n")
+    (tmp_path / "requirements2.txt").write_text("requests==2.31\n", encoding="utf-8")
+
+    dependencies, issues = collect_dependencies(tmp_path)
+
+    assert [dep.name for dep in dependencies] == ["requests"]
+    assert [issue.code for issue in issues] == ["DEPENDENCY_PYPI_ENCODING"]
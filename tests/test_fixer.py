@@ -1,6 +1,15 @@
+import random
 from pathlib import Path
 
-from skillcheck.fixer import run_safe_remediation
+import yaml
+
+from skillcheck.fixer import (
+    _emit_frontmatter,
+    _parse_skill_md,
+    _render_skill_md,
+    _slugify_name,
+    run_safe_remediation,
+)
 from skillcheck.lint_rules import run_lint
 from skillcheck.schema import load_policy
 
@@ -63,3 +72,57 @@ def test_safe_remediation_dry_run_does_not_write(tmp_path: Path) -> None:
     assert result.proposed
     assert not result.changed
     assert not (skill_dir / "SKILL.md").exists()
+
+
+def test_render_skill_md_round_trips_frontmatter() -> None:
+    frontmatter = {
+        "metadata": {"owner": "team: platform", "tier": 2},
+        "description": "Uses 'quotes', #hashes and unicode café",
+        "name": "demo-skill",
+    }
+    rendered = _render_skill_md(frontmatter, "\n# Body\n")
+    assert rendered.startswith("---\nname: demo-skill\n")
+    parsed, body, ok = _parse_skill_md(rendered)
+    assert ok
+    assert parsed == frontmatter
+    assert body == "# Body\n"
+
+
+def test_safe_remediation_rewrite_keeps_mode_and_leaves_no_temp_files(tmp_path: Path) -> None:
+    skill_dir = tmp_path / "mode-skill"
+    skill_dir.mkdir()
+    skill_md = skill_dir / "SKILL.md"
+    skill_md.write_text("---\nname: Mode Skill\ndescription: Demo\n---\n\n# Body\n", encoding="utf-8")
+    skill_md.chmod(0o640)
+
+    policy = load_policy()
+    result = run_safe_remediation(skill_dir, run_lint(skill_dir, policy), policy, apply=True)
+
+    assert result.changed_files == ["SKILL.md"]
+    assert "name: mode-skill" in skill_md.read_text(encoding="utf-8")
+    assert skill_md.stat().st_mode & 0o777 == 0o640
+    assert sorted(path.name for path in skill_dir.iterdir()) == ["SKILL.md"]
+
+
+def test_emit_frontmatter_matches_yaml_dump_or_defers() -> None:
+    typical = {"name": "demo-skill", "description": "Skill demo-skill", "metadata": {"owner": "platform"}}
+    assert _emit_frontmatter(typical) == yaml.safe_dump(typical, sort_keys=False).strip()
+    for deferred in ({"name": "yes"}, {"description": "a: b"}, {"name": "x" * 90}, {"metadata": {"tier": 2}}, {}):
+        assert _emit_frontmatter(deferred) is None
+
+    rng = random.Random(7)
+    alphabet = "abXZ09   _.,()/+-:#'"
+    for _ in range(2000):
+        frontmatter = {
+            "name": "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 40))),
+            "description": "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 85))),
+        }
+        emitted = _emit_frontmatter(frontmatter)
+        if emitted is not None:
+            assert emitted == yaml.safe_dump(frontmatter, sort_keys=False, allow_unicode=False).strip()
+
+
+def test_slugify_name_collapses_separators() -> None:
+    assert _slugify_name("  BAD Skill !!! ") == "bad-skill"
+    assert _slugify_name("my_skill--Ünïcode__v2") == "my-skill-n-code-v2"
+    assert _slugify_name("___") == "skill"
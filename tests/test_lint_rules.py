@@ -1,7 +1,8 @@
+import re
 from pathlib import Path
 
 from skillcheck.bundle import open_skill_bundle
-from skillcheck.lint_rules import run_lint
+from skillcheck.lint_rules import _raw_prefilter, _text_rules, run_lint
 from skillcheck.schema import load_policy
 
 
@@ -42,3 +43,104 @@ def test_lint_accepts_zip(make_skill_zip) -> None:
     with open_skill_bundle(archive) as bundle:
         report = run_lint(bundle, load_policy())
     assert report.ok
+
+
+def test_lint_reports_overlapping_rules_on_same_text(tmp_path: Path) -> None:
+    skill_dir = _make_skill(tmp_path, "# Body")
+    report = run_lint(skill_dir, load_policy())
+    config_codes = [issue.code for issue in report.issues if issue.path == "config.txt"]
+    assert config_codes == ["forbidden_pattern_1", "SECRET_SUSPECT"]
+
+
+def test_lint_skips_files_over_scan_limit(tmp_path: Path) -> None:
+    from dataclasses import replace
+
+    skill_dir = _make_skill(tmp_path, "# Body")
+    policy = replace(load_policy(), scan_max_bytes=10)
+    report = run_lint(skill_dir, policy)
+    config_codes = [issue.code for issue in report.issues if issue.path == "config.txt"]
+    assert config_codes == ["SCAN_SKIPPED_LARGE"]
+    assert report.files_scanned == 2
+
+
+def test_lint_scans_utf8_files_despite_nul_bytes(tmp_path: Path) -> None:
+    skill_dir = _make_skill(tmp_path, "# Body")
+    (skill_dir / "config.txt").write_bytes(b"\x00\nAPI_KEY = super-secret-token")
+    report = run_lint(skill_dir, load_policy())
+    config_codes = [issue.code for issue in report.issues if issue.path == "config.txt"]
+    assert config_codes == ["forbidden_pattern_1", "SECRET_SUSPECT"]
+
+
+def test_lint_secret_prefilter_keeps_unicode_case_folding(tmp_path: Path) -> None:
+    skill_dir = _make_skill(tmp_path, "# Body")
+    (skill_dir / "config.txt").write_text("ſECRET = hunter2", encoding="utf-8")
+    (skill_dir / "notes.txt").write_text("plain prose without credentials", encoding="utf-8")
+    report = run_lint(skill_dir, load_policy())
+    assert ("SECRET_SUSPECT", "config.txt") in {(issue.code, issue.path) for issue in report.issues}
+    assert not [issue for issue in report.issues if issue.path == "notes.txt"]
+
+
+def test_lint_waiver_suppresses_matching_rule_only(tmp_path: Path) -> None:
+    from dataclasses import replace
+
+    skill_dir = _make_skill(tmp_path, "# Body")
+    policy = replace(
+        load_policy(),
+        waivers=[{"path": "config.txt", "rule": "forbidden_pattern_1"}, {"path": "other.txt"}, "malformed"],
+    )
+    report = run_lint(skill_dir, policy)
+    config_codes = [issue.code for issue in report.issues if issue.path == "config.txt"]
+    assert config_codes == ["SECRET_SUSPECT"]
+
+
+
+def test_lint_raw_prefilter_respects_newline_normalisation(tmp_path: Path) -> None:
+    from dataclasses import replace
+
+    from skillcheck.schema import PatternRule
+
+    skill_dir = _make_skill(tmp_path, "# Body")
+    (skill_dir / "old-mac.txt").write_bytes(b"begin\rend\r")
+    (skill_dir / "latin1.txt").write_bytes(b"begin\nend caf\xe9")
+    rule = PatternRule(code="forbidden_pattern_x", pattern=re.compile("begin\nend"), reason="split marker")
+    policy = replace(load_policy(), forbidden_patterns=[rule])
+    report = run_lint(skill_dir, policy)
+    assert [(issue.code, issue.path) for issue in report.issues if issue.code == "forbidden_pattern_x"] == [
+        ("forbidden_pattern_x", "old-mac.txt")
+    ]
+
+
+def test_lint_reference_checks_cover_walked_and_unwalked_paths(tmp_path: Path) -> None:
+    skill_dir = _make_skill(
+        tmp_path,
+        "See [guide](./references/guide.md), [assets](assets/), scripts/missing.py and [dep](node_modules/pkg.js).",
+    )
+    (skill_dir / "references").mkdir()
+    (skill_dir / "references" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+    (skill_dir / "assets").mkdir()
+    (skill_dir / "node_modules").mkdir()
+    (skill_dir / "node_modules" / "pkg.js").write_text("", encoding="utf-8")
+    report = run_lint(skill_dir, load_policy())
+    missing = [issue.message for issue in report.issues if issue.code == "REFERENCE_MISSING"]
+    assert missing == ["Referenced file not found: scripts/missing.py"]
+
+
+def test_raw_prefilter_merges_rule_needles() -> None:
+    prefilter = _raw_prefilter(_text_rules(load_policy()))
+    assert not prefilter.always
+    assert prefilter.folded.count(b"secret") == 1
+    assert prefilter.may_match(b"run curl now")
+    assert prefilter.may_match(b"My TOKEN")
+    assert prefilter.may_match("caf\u00e9 prose".encode("utf-8"))
+    assert not prefilter.may_match(b"plain prose")
+
+
+def test_lint_relative_paths_from_dot_and_nested_roots(tmp_path: Path, monkeypatch) -> None:
+    skill_dir = _make_skill(tmp_path, "# Body")
+    (skill_dir / "sub").mkdir()
+    (skill_dir / "sub" / "deep.txt").write_text("see ../other", encoding="utf-8")
+    monkeypatch.chdir(skill_dir)
+    report = run_lint(Path("."), load_policy())
+    paths = {(issue.code, issue.path) for issue in report.issues}
+    assert ("SECRET_SUSPECT", "config.txt") in paths
+    assert ("PATH_TRAVERSAL", str(Path("sub/deep.txt"))) in paths
@@ -0,0 +1,58 @@
+import threading
+
+from skillcheck import otel
+
+
+class _FakeTrace:
+    def __init__(self) -> None:
+        self.providers: list = []
+
+    def set_tracer_provider(self, provider) -> None:
+        self.providers.append(provider)
+
+    def get_tracer(self, name: str) -> str:
+        return f"tracer:{name}"
+
+
+class _FakeProvider:
+    def __init__(self, resource=None) -> None:
+        self.processors: list = []
+
+    def add_span_processor(self, processor) -> None:
+        self.processors.append(processor)
+
+
+def test_ensure_tracer_installs_one_provider_across_threads(monkeypatch) -> None:
+    fake_trace = _FakeTrace()
+    monkeypatch.setattr(otel, "_OTEL_AVAILABLE", True)
+    monkeypatch.setattr(otel, "_TRACER", None)
+    monkeypatch.setattr(otel, "_FAILED_EXPORTERS", set())
+    monkeypatch.setattr(otel, "trace", fake_trace)
+    monkeypatch.setattr(otel, "TracerProvider", _FakeProvider)
+    monkeypatch.setattr(otel, "Resource", type("R", (), {"create": staticmethod(lambda attrs: attrs)}))
+    monkeypatch.setattr(otel, "ConsoleSpanExporter", object)
+    monkeypatch.setattr(otel, "BatchSpanProcessor", lambda exporter: exporter)
+    monkeypatch.setenv("SKILLCHECK_OTEL_EXPORTER", "console")
+
+    results: list = []
+    threads = [threading.Thread(target=lambda: results.append(otel._ensure_tracer())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["tracer:skillcheck"] * 8
+    assert len(fake_trace.providers) == 1
+
+
+def test_ensure_tracer_remembers_unusable_exporters(monkeypatch) -> None:
+    builds: list = []
+    monkeypatch.setattr(otel, "_OTEL_AVAILABLE", True)
+    monkeypatch.setattr(otel, "_TRACER", None)
+    monkeypatch.setattr(otel, "_FAILED_EXPORTERS", set())
+    monkeypatch.setattr(otel, "_build_tracer", lambda pref: builds.append(pref))
+    monkeypatch.setenv("SKILLCHECK_OTEL_EXPORTER", "bogus")
+
+    assert otel._ensure_tracer() is None
+    assert otel._ensure_tracer() is None
+    assert builds == ["bogus"]
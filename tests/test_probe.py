@@ -1,10 +1,15 @@
 from pathlib import Path
 
 from skillcheck.bundle import open_skill_bundle
-from skillcheck.probe import ProbeRunner
+from skillcheck.probe import ProbeRunner, _candidate_patterns, _patterns_for
 from skillcheck.schema import load_policy
 
 
+def _make_skill(tmp_path: Path) -> Path:
+    (tmp_path / "SKILL.md").write_text("---\nname: tmp-skill\ndescription: Temp skill.\n---\nBody\n", encoding="utf-8")
+    return tmp_path
+
+
 def test_probe_safe_skill() -> None:
     project_root = Path(__file__).resolve().parents[1]
     skill_dir = project_root / "examples" / "brand-voice-editor"
@@ -37,3 +42,309 @@ def test_probe_handles_zip(make_skill_zip) -> None:
     with open_skill_bundle(archive) as bundle:
         result = ProbeRunner(load_policy()).run(bundle)
     assert result.files_loaded_count >= 1
+
+
+def test_probe_skips_ignored_dirs_and_binary_files(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "run.py").write_text('import requests\nrequests.get("https://evil.example")\n', encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.js").write_text('fetch("https://evil.example")\n', encoding="utf-8")
+    (tmp_path / "blob.bin").write_bytes(b"\x00\x01" + b'fetch("https://evil.example")')
+    result = ProbeRunner(load_policy()).run(tmp_path)
+    assert result.files_loaded_count == 2
+    assert [finding.code for finding in result.egress_attempts] == ["EGRESS_REQUESTS_CALL"]
+
+
+def test_probe_scans_utf8_scripts_with_nul_bytes(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "run.py").write_bytes(
+        b"\x00\nimport requests\nrequests.get('https://evil.example/x')"
+    )
+    result = ProbeRunner(load_policy()).run(tmp_path)
+    assert [finding.code for finding in result.egress_attempts] == ["EGRESS_REQUESTS_CALL"]
+
+
+def test_probe_selects_patterns_by_extension_and_scripts_dir(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    call = 'requests.get("https://evil.example")\nfetch("https://evil.example")\n'
+    (tmp_path / "app.js").write_text(call, encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "task.txt").write_text(call, encoding="utf-8")
+    result = ProbeRunner(load_policy()).run(tmp_path)
+    assert [finding.code for finding in result.egress_attempts] == [
+        "EGRESS_FETCH_CALL",
+        "EGRESS_REQUESTS_CALL",
+        "EGRESS_FETCH_CALL",
+    ]
+
+
+def test_candidate_patterns_fold_case_needles_only_on_ascii_text() -> None:
+    egress, _ = _patterns_for(".ps1", False)
+    assert [code for code, _ in _candidate_patterns(egress, "write-host hi")] == []
+    hits = _candidate_patterns(egress, "INVOKE-WEBREQUEST -Uri https://evil.example")
+    assert [code for code, _ in hits] == ["powershell_webrequest"]
+    # Non-ASCII text may case-fold onto the needles ("\u212a" lowers to "k"), so the regex must run.
+    assert len(_candidate_patterns(egress, "caf\u00e9")) == 1
+
+
+def test_probe_patterns_capture_their_target_group() -> None:
+    for ext in (".py", ".js", ".sh", ".ps1"):
+        egress, writes = _patterns_for(ext, True)
+        assert all("url" in pattern.groupindex for _, pattern, _, _ in egress)
+        assert all("path" in pattern.groupindex for _, pattern, _, _ in writes)
+
+
+def test_collect_exec_targets_matches_path_glob(tmp_path: Path) -> None:
+    for rel in ("main.py", "scripts/a.py", "scripts/deep/b.py", "scripts/notes.txt", "lib/c.py", "node_modules/d.py"):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("print('x')\n", encoding="utf-8")
+    # Path.glob follows a symlinked directory matched by a literal or wildcard component, but not by "**".
+    (tmp_path / "shared" / "nested").mkdir(parents=True)
+    (tmp_path / "shared" / "nested" / "e.py").write_text("print('x')\n", encoding="utf-8")
+    (tmp_path / "tools").symlink_to(tmp_path / "shared", target_is_directory=True)
+    (tmp_path / "scripts" / "linked").symlink_to(tmp_path / "shared", target_is_directory=True)
+    runner = ProbeRunner(load_policy())
+    for globs in (
+        ["scripts/**/*.py", "*.py"],
+        ["**/*.py", "scripts/*.py"],
+        ["*/*.py"],
+        ["tools/**/*.py"],
+        ["*/nested/*.py", "scripts/linked/*/*.py"],
+    ):
+        runner.exec_globs = globs
+        expected = sorted({path for glob in globs for path in tmp_path.glob(glob) if path.suffix == ".py"})
+        assert runner._collect_exec_targets(tmp_path) == expected, globs
+
+
+def test_probe_exec_keeps_script_order_when_parallel(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.probe as probe_module
+
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / "scripts" / name).write_text(f"print('{name}')\n", encoding="utf-8")
+
+    def fake_invoke(self, skill_path: Path, script_path: Path) -> dict:
+        violation = {"category": "network", "detail": f"blocked {script_path.name}"}
+        return {"payload": {"violations": [violation]}, "stderr": "", "timeout": False}
+
+    pool_sizes = []
+
+    class RecordingPool(probe_module.ThreadPoolExecutor):
+        def __init__(self, max_workers=None):
+            pool_sizes.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(probe_module, "available_cpus", lambda: 4)
+    monkeypatch.setattr(probe_module, "ThreadPoolExecutor", RecordingPool)
+    monkeypatch.setattr(ProbeRunner, "_invoke_sandbox", fake_invoke)
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert pool_sizes == [3]
+    assert [finding.message for finding in result.egress_attempts] == [
+        "scripts/a.py: blocked a.py",
+        "scripts/b.py: blocked b.py",
+        "scripts/c.py: blocked c.py",
+    ]
+
+
+def test_clone_or_copy_falls_back_to_plain_copy(tmp_path: Path, monkeypatch) -> None:
+    import skillcheck.probe as probe_module
+
+    src = tmp_path / "tool.py"
+    src.write_text("print('hi')\n", encoding="utf-8")
+    src.chmod(0o750)
+    dst = tmp_path / "copy.py"
+    probe_module._clone_or_copy(str(src), str(dst))
+    assert dst.read_text(encoding="utf-8") == "print('hi')\n"
+    assert dst.stat().st_mode & 0o777 == 0o750
+    monkeypatch.setattr(probe_module, "_clone_supported", True)
+    if probe_module._HAS_FCNTL:
+        import errno
+
+        def unsupported(*_args):
+            raise OSError(errno.EOPNOTSUPP, "not supported")
+
+        monkeypatch.setattr(probe_module.fcntl, "ioctl", unsupported)
+        dst.unlink()
+        probe_module._clone_or_copy(str(src), str(dst))
+        assert dst.read_text(encoding="utf-8") == "print('hi')\n"
+        assert probe_module._clone_supported is False
+
+
+def test_probe_exec_tolerates_noisy_and_undecodable_output(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "noisy.py").write_text(
+        "import os\nprint('x' * 100000)\nos.write(1, b'raw line\\n')\nos.write(2, b'\\xff bad bytes\\n')\n",
+        encoding="utf-8",
+    )
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert "scripts/noisy.py stdout: " + "x" * 200 in result.notes
+    assert "scripts/noisy.py stderr: � bad bytes" in result.notes
+
+
+def test_probe_exec_runner_skips_package_imports_and_keeps_skill_root_on_path(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "helper.py").write_text("VALUE = 'helper-ok'\n", encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "check.py").write_text(
+        "import sys\nimport helper\nprint(helper.VALUE, 'typer' in sys.modules)\n",
+        encoding="utf-8",
+    )
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert "scripts/check.py stdout: helper-ok False" in result.notes
+
+
+def test_probe_host_allowlist_matches_hosts_and_origins(tmp_path: Path) -> None:
+    from dataclasses import replace
+
+    policy = replace(load_policy(), allow_network_hosts=["*.example.com", "https://api.internal", ""])
+    runner = ProbeRunner(policy)
+    assert runner._host_allowed("https://cdn.example.com/file")
+    assert runner._host_allowed("https://api.internal/v1")
+    assert not runner._host_allowed("http://api.internal/v1")
+    assert not runner._host_allowed("https://example.org")
+    assert not runner._host_allowed("not a url")
+    assert not ProbeRunner(replace(policy, allow_network_hosts=[]))._host_allowed("https://cdn.example.com")
+
+
+def test_probe_exec_runs_byte_identical_scripts_separately(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    source = "import os, sys\nif os.path.basename(sys.argv[0]) == 'b.py':\n    open('../escape.txt', 'w')\n"
+    for name in ("a.py", "b.py"):
+        (tmp_path / "scripts" / name).write_text(source, encoding="utf-8")
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert [finding.message for finding in result.disallowed_writes if finding.code == "WRITE_SANDBOX"] == [
+        "scripts/b.py: write to ../escape.txt escapes skill root"
+    ]
+
+
+def test_probe_exec_stages_skill_without_vcs_and_artifacts(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    for name in (".git", ".skillcheck", "references"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "data.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "ls.py").write_text("import os\nprint(sorted(os.listdir('.')))\n", encoding="utf-8")
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert "scripts/ls.py stdout: ['SKILL.md', 'references', 'scripts']" in result.notes
+
+
+def test_probe_exec_guards_network_modules_imported_by_the_script(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "requests").mkdir()
+    (tmp_path / "requests" / "__init__.py").write_text(
+        "from .sessions import Session\n\ndef get(url):\n    return Session().request('GET', url)\n", encoding="utf-8"
+    )
+    (tmp_path / "requests" / "sessions.py").write_text(
+        "class Session:\n    def request(self, method, url):\n        return 'sent'\n", encoding="utf-8"
+    )
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "call.py").write_text(
+        "import requests\nrequests.get('https://evil.example/x')\n",
+        encoding="utf-8",
+    )
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert [finding.message for finding in result.egress_attempts if finding.code == "EGRESS_SANDBOX"] == [
+        "scripts/call.py: requests.get to evil.example blocked"
+    ]
+
+
+def test_probe_exec_leaves_no_bytecode_in_staging(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "check.py").write_text(
+        "import os, sys\nimport helper\nprint(sys.dont_write_bytecode, os.path.exists('__pycache__'))\n",
+        encoding="utf-8",
+    )
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert "scripts/check.py stdout: True False" in result.notes
+
+
+def test_probe_exec_workers_follow_cpu_affinity(monkeypatch) -> None:
+    import os
+
+    from skillcheck import utils
+
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 3}, raising=False)
+    monkeypatch.setattr(os, "cpu_count", lambda: 64)
+    assert utils.available_cpus() == 2
+    monkeypatch.delattr(os, "sched_getaffinity")
+    assert utils.available_cpus() == 64
+
+
+def test_probe_parallel_scan_matches_serial_scan(tmp_path: Path, monkeypatch) -> None:
+    from skillcheck import probe
+
+    _make_skill(tmp_path)
+    (tmp_path / "scripts").mkdir()
+    for index in range(6):
+        (tmp_path / "scripts" / f"s{index}.py").write_text(
+            f'requests.get("https://evil{index}.example")\nopen("../out{index}", "w")\n', encoding="utf-8"
+        )
+    (tmp_path / "blob.bin").write_bytes(b"\x00")
+    serial = ProbeRunner(load_policy()).run(tmp_path)
+    monkeypatch.setattr(probe, "PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr(probe, "available_cpus", lambda: 2)
+    parallel = ProbeRunner(load_policy()).run(tmp_path)
+    assert parallel.to_dict() == serial.to_dict()
+    assert len(parallel.egress_attempts) == 6
+
+
+def test_probe_without_parallel_starts_no_worker_pool(tmp_path: Path, monkeypatch) -> None:
+    from skillcheck import probe
+
+    _make_skill(tmp_path)
+    for index in range(6):
+        (tmp_path / f"s{index}.py").write_text(f'requests.get("https://evil{index}.example")\n', encoding="utf-8")
+    monkeypatch.setattr(probe, "PARALLEL_SCAN_MIN_FILES", 2)
+    monkeypatch.setattr(probe, "available_cpus", lambda: 2)
+    monkeypatch.setattr(probe, "ProcessPoolExecutor", None)
+    result = ProbeRunner(load_policy(), parallel=False).run(tmp_path)
+    assert len(result.egress_attempts) == 6
+
+
+def test_probe_counts_only_utf8_files_when_no_pattern_applies(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "notes.md").write_text("café notes\n", encoding="utf-8")
+    (tmp_path / "legacy.md").write_bytes("café notes\n".encode("latin-1"))
+    (tmp_path / "tool.py").write_text("# résumé\nprint('hi')\n", encoding="utf-8")
+    result = ProbeRunner(load_policy()).run(tmp_path)
+    assert result.files_loaded_count == 2
+    assert "Read outside policy allowlist ignored: tool.py" in result.notes
+
+
+def test_sandbox_runner_compiles_allowlist_like_fnmatch() -> None:
+    import fnmatch
+
+    from skillcheck._sandbox_runner import _compile_globs
+
+    globs = ["api.github.com", "*.example.com", "svc.internal"]
+    pattern = _compile_globs(globs)
+    assert pattern is not None
+    for host in ("api.github.com", "x.example.com", "example.com", "svc.internal", "evil.test"):
+        assert bool(pattern.match(host)) is any(fnmatch.fnmatch(host, glob) for glob in globs), host
+    assert _compile_globs([]) is None
+
+
+def test_probe_exec_write_guard_applies_policy_globs(tmp_path: Path) -> None:
+    _make_skill(tmp_path)
+    (tmp_path / "scratch").mkdir()
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "write.py").write_text(
+        "from pathlib import Path\n"
+        "Path('scratch/ok.txt').write_text('x')\n"
+        "try:\n    open('notes.txt', 'w')\nexcept Exception:\n    pass\n"
+        "open('../escape.txt', 'w')\n",
+        encoding="utf-8",
+    )
+    result = ProbeRunner(load_policy(), enable_exec=True).run(tmp_path)
+    assert [finding.message for finding in result.disallowed_writes if finding.code == "WRITE_SANDBOX"] == [
+        "scripts/write.py: write to notes.txt not allowed by policy",
+        "scripts/write.py: write to ../escape.txt escapes skill root",
+    ]
@@ -0,0 +1,15 @@
+from skillcheck.remediation import REMEDIATION_GUIDES, get_remediation
+
+
+def test_get_remediation_prefers_exact_codes_then_prefixes() -> None:
+    assert get_remediation(" secret_suspect ").code_pattern == "SECRET_SUSPECT"
+    assert get_remediation("EGRESS_SANDBOX").code_pattern == "EGRESS_"
+    assert get_remediation("write_open_write").code_pattern == "WRITE_"
+    assert get_remediation("PATH_TRAVERSAL_EXTRA") is None
+    assert get_remediation("") is None
+
+
+def test_every_guide_is_reachable() -> None:
+    for guide in REMEDIATION_GUIDES:
+        code = guide.code_pattern + "X" if guide.code_pattern.endswith("_") else guide.code_pattern
+        assert get_remediation(code) is guide
@@ -75,3 +75,120 @@ def test_report_writer_includes_trust_score(tmp_path: Path) -> None:
     payload = json.loads(result.json_path.read_text(encoding="utf-8"))
     assert "avg_trust_score" in payload["summary"]
     assert "trust_score" in payload["rows"][0]
+
+
+def test_report_writer_partitions_artifacts_by_kind(tmp_path: Path) -> None:
+    artifacts = tmp_path / ".skillcheck"
+    artifacts.mkdir()
+    for name in ("b.lint.json", "a.lint.json", "a.probe.json", "a.attestation.json", "results.json", "lint.json", "notes.txt"):
+        (artifacts / name).write_text("{}", encoding="utf-8")
+    (artifacts / "dir.lint.json").mkdir()
+
+    groups = ReportWriter(artifacts)._partition_artifacts()
+
+    assert {suffix: [path.name for path in paths] for suffix, paths in groups.items()} == {
+        ".lint": ["a.lint.json", "b.lint.json"],
+        ".probe": ["a.probe.json"],
+        ".attestation": ["a.attestation.json"],
+    }
+
+
+def test_report_writer_csv_has_one_line_per_skill(tmp_path: Path) -> None:
+    import csv
+
+    artifacts = tmp_path / ".skillcheck"
+    artifacts.mkdir()
+    for name in ("beta", "alpha"):
+        payload = {"skill": {"name": name, "version": "1.0"}, "summary": {"violations_count": 1, "issue_count": 2}}
+        (artifacts / f"{name}.lint.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    result = ReportWriter(artifacts).write()
+
+    with result.csv_path.open(newline="", encoding="utf-8") as handle:
+        table = list(csv.reader(handle))
+    assert table[0][0] == "skill_name" and table[0][-1] == "status"
+    assert table[1] == ["alpha", "1.0", "1", "2", "0", "0", "", "", "0", "85.0", "fail"]
+    assert [line[0] for line in table[1:]] == ["alpha", "beta"]
+
+
+def test_report_writer_markdown_table_rows(tmp_path: Path) -> None:
+    artifacts = tmp_path / ".skillcheck"
+    artifacts.mkdir()
+    payload = {"skill": {"name": "alpha", "version": ""}, "summary": {"violations_count": 0, "issue_count": 1}}
+    (artifacts / "alpha.lint.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    result = ReportWriter(artifacts).write()
+
+    text = result.md_path.read_text(encoding="utf-8")
+    assert "| alpha | — | 0 | 1 | 0 | 0 | 100.00 | — | — | PASS |\n" in text
+    assert text.endswith("\n") and not text.endswith("\n\n")
+
+
+def test_report_writer_reuses_parsed_artifacts_until_they_change(
+    tmp_path: Path, monkeypatch, settled_files, rewrite_keeping_mtime
+) -> None:
+    from skillcheck import report
+
+    artifact = tmp_path / "demo.lint.json"
+    artifact.write_text(json.dumps({"skill": {"name": "demo"}, "summary": {"violations_count": 1}}), encoding="utf-8")
+    writer = ReportWriter(tmp_path)
+    assert writer.write().rows[0].lint_violations == 1
+
+    parsed = []
+    real_load = report.load_json
+    monkeypatch.setattr(report, "load_json", lambda data: parsed.append(data) or real_load(data))
+    writer.write()
+    assert parsed == []
+    rewrite_keeping_mtime(artifact, json.dumps({"skill": {"name": "demo"}, "summary": {"violations_count": 2}}).encode())
+    assert writer.write().rows[0].lint_violations == 2
+    assert len(parsed) == 1
+
+
+def test_extract_probe_path_matches_regex_split(tmp_path: Path) -> None:
+    import itertools
+    import re
+
+    def expected(message: str) -> tuple:
+        match = re.match(r"^(?P<path>[^:\n]+):\s*(?P<detail>.+)$", message)
+        if not match:
+            return "SKILL.md", message
+        path = match.group("path").strip()
+        if "/" in path or "." in path:
+            return path, match.group("detail").strip()
+        return "SKILL.md", message
+
+    writer = ReportWriter(tmp_path)
+    pieces = ["a.py", "x", ":", " ", "\n", "y/z", "detail"]
+    for size in range(1, 5):
+        for combo in itertools.product(pieces, repeat=size):
+            message = "".join(combo)
+            assert writer._extract_probe_path(message) == expected(message), repr(message)
+
+
+def test_report_writer_reuses_listing_until_directory_changes(tmp_path: Path, settled_files) -> None:
+    (tmp_path / "a.lint.json").write_text(json.dumps({"skill": {"name": "a"}}), encoding="utf-8")
+    writer = ReportWriter(tmp_path)
+    assert [row.skill_name for row in writer.write().rows] == ["a"]
+    first = writer._partition_artifacts()
+    assert writer._partition_artifacts() is first
+
+    (tmp_path / "b.lint.json").write_text(json.dumps({"skill": {"name": "b"}}), encoding="utf-8")
+    assert [row.skill_name for row in writer.write().rows] == ["a", "b"]
+
+
+def test_report_writer_streams_sarif_results_into_valid_json(tmp_path: Path) -> None:
+    from skillcheck.report import ReportFinding
+
+    findings = [
+        ReportFinding("demo", f"CODE_{index % 3}", f'msg {index} "results": []', "SKILL.md", 0, "warning", "lint")
+        for index in range(5)
+    ]
+    sarif = json.loads(ReportWriter(tmp_path)._write_sarif(findings).read_text(encoding="utf-8"))
+    run = sarif["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["CODE_0", "CODE_1", "CODE_2"]
+    assert run["tool"]["driver"]["rules"][0]["help"]["text"] == 'msg 0 "results": []'
+    assert [result["message"]["text"] for result in run["results"]] == [
+        f'[demo] msg {index} "results": []' for index in range(5)
+    ]
+    assert {result["level"] for result in run["results"]} == {"warning"}
+    assert json.loads(ReportWriter(tmp_path / "empty")._write_sarif([]).read_text(encoding="utf-8"))["runs"][0]["results"] == []
@@ -72,3 +72,95 @@ def test_load_all_policy_packs() -> None:
 def test_load_policy_pack_version_mismatch() -> None:
     with pytest.raises(SkillValidationError):
         load_policy(policy_pack="balanced", expected_version=999)
+
+
+def test_policy_filesystem_globs_match_like_fnmatch() -> None:
+    import fnmatch
+
+    policy = load_policy()
+    for path in ("SKILL.md", "references/a/b.md", "scripts/run.py", "data/x.csv", "scratch/out.txt", "../etc/passwd"):
+        assert policy.is_read_allowed(path) is any(fnmatch.fnmatch(path, glob) for glob in policy.read_globs), path
+        assert policy.is_write_allowed(path) is any(fnmatch.fnmatch(path, glob) for glob in policy.write_globs), path
+    policy.write_globs = []
+    assert not policy.is_write_allowed("scratch/out.txt")
+
+
+def test_load_policy_reuses_parse_but_returns_independent_policies(tmp_path: Path) -> None:
+    first = load_policy()
+    first.raw["allow"]["filesystem"]["read_globs"].append("extra/**")
+    first.read_globs.append("extra/**")
+    second = load_policy()
+    assert "extra/**" not in second.raw["allow"]["filesystem"]["read_globs"]
+    assert "extra/**" not in second.read_globs
+
+    policy_file = tmp_path / "custom.policy.yaml"
+    policy_file.write_text("version: 1\nallow:\n  network:\n    hosts: [a.example]\n", encoding="utf-8")
+    assert load_policy(policy_file).allow_network_hosts == ["a.example"]
+    policy_file.write_text("version: 1\nallow:\n  network:\n    hosts: [b.example]\n", encoding="utf-8")
+    assert load_policy(policy_file).allow_network_hosts == ["b.example"]
+
+
+def test_repeated_policy_loads_share_compiled_patterns() -> None:
+    first = load_policy(policy_pack="strict")
+    second = load_policy(policy_pack="strict")
+    assert first.forbidden_patterns
+    for left, right in zip(first.forbidden_patterns, second.forbidden_patterns):
+        assert left.pattern is right.pattern
+
+
+def test_dependency_allowlist_matches_like_fnmatch() -> None:
+    import fnmatch
+
+    policy = load_policy()
+    allowlist = ["requests*", "pyyaml==6.*", "", "[a-c]*-utils"]
+    policy.dependency_allowlists = {"allow_pypi": allowlist}
+    cases = [("requests", "requests==2.31"), ("pyyaml", "pyyaml==6.0.1"), ("b-utils", "b-utils"), ("d-utils", ""), ("numpy", "numpy")]
+    for name, spec in cases:
+        expected = any(fnmatch.fnmatch(spec, glob) or fnmatch.fnmatch(name, glob) for glob in allowlist)
+        assert policy.is_dependency_allowed("pypi", name, spec) is expected, (name, spec)
+    assert not policy.is_dependency_allowed("npm", "requests", "requests")
+
+
+def test_policy_checksum_hashes_text_as_read_text_sees_it(tmp_path: Path) -> None:
+    import hashlib
+
+    content = "version: 1\nallow:\n  network:\n    hosts: [a.example]\n"
+    lf_file = tmp_path / "lf.policy.yaml"
+    lf_file.write_bytes(content.encode("utf-8"))
+    crlf_file = tmp_path / "crlf.policy.yaml"
+    crlf_file.write_bytes(content.replace("\n", "\r\n").encode("utf-8"))
+    expected = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    assert load_policy(lf_file).sha256 == expected
+    assert load_policy(crlf_file).sha256 == expected
+    assert load_policy(crlf_file).allow_network_hosts == ["a.example"]
+
+
+@pytest.mark.parametrize("name", ["abc", "a-b", "---", "a_b", "café", "a b", "a.b", "x́"])
+def test_skill_name_character_check_matches_per_character_rule(name: str) -> None:
+    from skillcheck.schema import validate_frontmatter
+
+    issues = validate_frontmatter({"name": name, "description": "d"}, Path(name), load_policy())
+    flagged = any("invalid characters" in issue.message for issue in issues)
+    assert flagged is not all(char.isalnum() or char == "-" for char in name)
+
+
+def test_frontmatter_splits_legacy_and_unknown_fields() -> None:
+    from skillcheck.schema import validate_frontmatter
+
+    policy = load_policy()
+    policy.legacy_fields = ["version", "author"]
+    frontmatter = {"name": "demo", "description": "d", "version": "1", "owner": "x"}
+    issues = {issue.code: issue for issue in validate_frontmatter(frontmatter, Path("demo"), policy)}
+    assert issues["FRONTMATTER_LEGACY_FIELD"].message.endswith(": version")
+    assert issues["FRONTMATTER_UNKNOWN_FIELD"].message.endswith(": owner")
+
+
+def test_tool_allowlist_matches_like_fnmatch() -> None:
+    import fnmatch
+
+    policy = load_policy()
+    policy.allow_tools = ["Read", "Bash(git:*)", "mcp__*", ""]
+    for token in ["Read", "Bash(git:status)", "Bash(rm:-rf)", "mcp__files", "Write", "(odd)"]:
+        base = token.split("(", 1)[0]
+        expected = any(fnmatch.fnmatch(token, glob) or fnmatch.fnmatch(base, glob) for glob in policy.allow_tools)
+        assert policy.is_tool_allowed(token) is expected, token
@@ -0,0 +1,190 @@
+import json
+import os
+import re
+
+import pytest
+
+from skillcheck import utils
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_round_trips_with_either_backend(monkeypatch, use_orjson: bool) -> None:
+    if use_orjson and not utils._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(utils, "_HAS_ORJSON", use_orjson)
+    payload = {"skill": "café", "issues": [{"code": "X", "line": 1}], "ok": False}
+    data = utils.dump_json(payload)
+    assert isinstance(data, bytes)
+    assert data.startswith(b'{\n  "skill"')
+    assert json.loads(data) == payload
+    assert utils.load_json(data) == payload
+    with pytest.raises(json.JSONDecodeError):
+        utils.load_json(b"{not json")
+
+
+def test_dump_json_backends_write_identical_bytes(monkeypatch) -> None:
+    if not utils._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    payload = {"skill": "café ☃", "issues": [{"code": "X", "line": 1, "score": 2.5}], "ok": None, "empty": {}}
+    fast = utils.dump_json(payload)
+    monkeypatch.setattr(utils, "_HAS_ORJSON", False)
+    assert utils.dump_json(payload) == fast
+    assert "café ☃".encode() in fast
+
+
+def test_iter_files_prunes_ignored_dirs_in_sorted_order(tmp_path) -> None:
+    for rel in ("b.txt", "a/z.txt", "a-b.txt", "node_modules/pkg/index.js", "a/node_modules/x.js"):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x", encoding="utf-8")
+    found = [entry.path for entry in utils.iter_files(tmp_path, {"node_modules"})]
+    assert found == [str(tmp_path / rel) for rel in ("a/z.txt", "a-b.txt", "b.txt")]
+
+
+def test_read_text_if_utf8_skips_binary_and_normalises_newlines(tmp_path) -> None:
+    text_file = tmp_path / "notes.txt"
+    text_file.write_bytes(b"one\r\ntwo\rthree\n")
+    assert utils.read_text_if_utf8(text_file) == text_file.read_text(encoding="utf-8")
+    binary_file = tmp_path / "image.png"
+    binary_file.write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00")
+    assert utils.read_text_if_utf8(binary_file) is None
+    latin1_file = tmp_path / "latin1.txt"
+    latin1_file.write_bytes("café".encode("latin-1"))
+    assert utils.read_text_if_utf8(latin1_file) is None
+
+
+@pytest.mark.parametrize(
+    ("source", "flags", "texts"),
+    [
+        (r"(?i)api[_-]?key|secret|token\s*[:=]", 0, ["API-KEY", "my Secret", "token=1", "tokens"]),
+        (r"subprocess\.(Popen|run)\(", 0, ["subprocess.run(", "subprocess.call("]),
+        (r"ab*c|x[]|]y|z[^]|]", 0, ["ac", "abbbc", "x]y", "x|y", "zq", "bc"]),
+        (r"\bfoo\.bar\b", 0, ["foo.bar", "foo-bar"]),
+        (r"(?:a|b)c", 0, ["ac", "bc"]),
+        (r"\\btee\\s+(?P<path>[^\\s]+)", 0, ["\\btee\\ssout.txt"]),
+        (r"\bInvoke-(?:WebRequest|RestMethod)", re.IGNORECASE, ["invoke-webrequest", "INVOKE-RESTMETHOD"]),
+        (r"kelvin", re.IGNORECASE, ["KELVIN", "\u212aelvin"]),
+    ],
+)
+def test_pattern_needles_never_reject_a_match(source: str, flags: int, texts: list) -> None:
+    pattern = re.compile(source, flags)
+    needles, fold_case = utils.pattern_needles(pattern.pattern, pattern.flags)
+    for text in texts:
+        if not pattern.search(text) or (fold_case and not text.isascii()):
+            continue
+        haystack = text.lower() if fold_case else text
+        assert not needles or any(needle in haystack for needle in needles), (source, text)
+
+
+def test_read_bytes_cached_reuses_settled_files_and_sees_rewrites(tmp_path, monkeypatch, settled_files, rewrite_keeping_mtime) -> None:
+    target = tmp_path / "notes.txt"
+    target.write_bytes(b"first")
+    assert utils.read_bytes_cached(target) == b"first"
+    assert utils._file_cache[str(target)][1] == b"first"
+    rewrite_keeping_mtime(target, b"other")
+    assert utils.read_bytes_cached(target) == b"other"
+    monkeypatch.setattr(utils, "_RACY_WINDOW_NS", 2_000_000_000)
+    target.write_bytes(b"fresh!")
+    assert utils.read_bytes_cached(target) == b"fresh!"
+    assert utils._file_cache[str(target)][1] == b"other"
+
+
+def test_compile_globs_agrees_with_fnmatch() -> None:
+    import fnmatch
+
+    globs = ["*.example.com", "api.github.com", "", "https://*.internal", "data/[a-c]?.json"]
+    names = ["x.example.com", "example.com", "api.github.com", "https://svc.internal", "data/b1.json", "data/d1.json"]
+    pattern = utils.compile_globs(globs)
+    assert pattern is not None
+    for name in names:
+        expected = any(fnmatch.fnmatch(name, glob) for glob in globs if glob)
+        assert bool(pattern.match(os.path.normcase(name))) is expected, name
+    assert utils.compile_globs(["", ""]) is None
+
+
+def test_compile_helpers_memoize_dynamic_patterns() -> None:
+    assert utils.compile_pattern(r"token\s*=") is utils.compile_pattern(r"token\s*=")
+    assert utils.compile_pattern("x", re.IGNORECASE).flags & re.IGNORECASE
+    assert utils.compile_globs(["*.py", ""]) is utils.compile_globs(iter(["*.py"]))
+
+
+def test_read_bytes_if_text_stops_at_binary_header(tmp_path, monkeypatch) -> None:
+    reads = []
+    real_open = open
+
+    class CountingHandle:
+        def __init__(self, handle):
+            self._handle = handle
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._handle.close()
+
+        def read(self, size=-1):
+            data = self._handle.read(size)
+            reads.append(len(data))
+            return data
+
+    monkeypatch.setattr("builtins.open", lambda path, mode="r": CountingHandle(real_open(path, mode)))
+    binary = tmp_path / "archive.whl"
+    binary.write_bytes(b"PK\x03\x04\x14\x00\x08\x00\xa1\x9c" + b"x" * 100_000)
+    assert utils.read_bytes_if_text(binary) is None
+    assert reads == [utils._BINARY_SNIFF_BYTES]
+    reads.clear()
+    text = tmp_path / "notes.md"
+    text.write_bytes(b"y" * 10_000)
+    assert utils.read_bytes_if_text(text) == b"y" * 10_000
+    assert sum(reads) == 10_000
+    reads.clear()
+    # A NUL byte is valid UTF-8; only undecodable bytes mark a file as binary.
+    nul_prefixed = tmp_path / "run.py"
+    nul_prefixed.write_bytes(b"\x00\n" + "é".encode() * 5_000)
+    assert utils.read_bytes_if_text(nul_prefixed) == nul_prefixed.read_bytes()
+
+
+def test_sha256_file_matches_hashlib_with_and_without_file_digest(tmp_path, monkeypatch) -> None:
+    import hashlib
+
+    payload = os.urandom(utils._HASH_CHUNK_BYTES + 123)
+    target = tmp_path / "blob.bin"
+    target.write_bytes(payload)
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    expected = hashlib.sha256(payload).hexdigest()
+    assert utils.sha256_file(target) == expected
+    monkeypatch.delattr(os, "posix_fadvise", raising=False)
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert utils.sha256_file(target) == expected
+    assert utils.sha256_file(empty) == hashlib.sha256(b"").hexdigest()
+
+
+def test_sha256_file_reuses_digest_until_stat_changes(tmp_path, monkeypatch, settled_files, rewrite_keeping_mtime) -> None:
+    target = tmp_path / "payload.txt"
+    target.write_bytes(b"one")
+    first = utils.sha256_file(target)
+    hashed = []
+    real_hash = utils._sha256_file_uncached
+    monkeypatch.setattr(utils, "_sha256_file_uncached", lambda path, size: hashed.append(path) or real_hash(path, size))
+    assert utils.sha256_file(target) == first
+    assert hashed == []
+    rewrite_keeping_mtime(target, b"two")
+    assert utils.sha256_file(target) != first
+    assert hashed == [str(target)]
+
+
+def test_iter_relative_files_matches_sorted_rglob(tmp_path) -> None:
+    from pathlib import Path
+
+    root = tmp_path / "skill"
+    for rel in ("b.txt", "a/z.txt", "a-b.txt", "A.txt", ".hidden/x", "a/b/c.md"):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x", encoding="utf-8")
+    (root / "empty").mkdir()
+    (root / "linked").symlink_to(root / "a", target_is_directory=True)
+    (root / "alias.txt").symlink_to(root / "b.txt")
+    expected = [str(path.relative_to(root)) for path in sorted(Path(root).rglob("*")) if path.is_file()]
+    assert [relative for relative, _ in utils.iter_relative_files(root)] == expected
+    assert all(entry.path == str(root / relative) for relative, entry in utils.iter_relative_files(root))